@@ -1,40 +1,202 @@
 # config/config.py
 import os
+import sys
+import errno
+import functools
 import logging
 import json
-import tempfile
+import hashlib
+import time
+import queue
+import threading
+import atexit
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 from config.constants import AppInfo, SettingsKey
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Ermittelt das Konfigurationsverzeichnis im APPDATA-Ordner als Path-Objekt."""
+    """
+    Ermittelt das Konfigurationsverzeichnis im APPDATA-Ordner als Path-Objekt.
+    Das Ergebnis wird zwischengespeichert; das Verzeichnis wird nur bei Bedarf angelegt.
+    """
     try:
         appdata = os.environ['APPDATA']
         config_dir = Path(appdata) / AppInfo.CONFIG_FOLDER_NAME
     except KeyError:
         config_dir = Path.home() / '.config' / AppInfo.CONFIG_FOLDER_NAME
     
-    config_dir.mkdir(parents=True, exist_ok=True)
+    if not config_dir.is_dir():
+        config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
+def dumps_json(data) -> bytes:
+    """Serialisiert Daten zu UTF-8-JSON; nutzt orjson, falls installiert."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+
+def loads_json(content: bytes | str):
+    """Parst JSON; nutzt orjson, falls installiert (orjson.JSONDecodeError erbt von json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+_HAS_FDATASYNC = hasattr(os, 'fdatasync')
+
+def _fsync_file(fd: int):
+    """Schreibt den Dateiinhalt auf den Datenträger (F_FULLFSYNC unter macOS, sonst fdatasync wo verfügbar)."""
+    if sys.platform == "darwin" and hasattr(fcntl, "F_FULLFSYNC"):
+        try:
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            return
+        except OSError:
+            pass
+    if _HAS_FDATASYNC:
+        # Überspringt reine Metadaten wie Zeitstempel; Inhalt und Dateigröße werden dennoch gesichert
+        os.fdatasync(fd)
+        return
+    os.fsync(fd)
+
+def _fsync_directory(directory: Path):
+    """Persistiert den Verzeichniseintrag nach einem Rename (nur POSIX)."""
+    if os.name == 'nt':
+        return
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        logging.debug(f"Verzeichnis '{directory}' konnte für fsync nicht geöffnet werden.", exc_info=True)
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        logging.debug(f"fsync auf Verzeichnis '{directory}' fehlgeschlagen.", exc_info=True)
+    finally:
+        os.close(dir_fd)
+
+_TEMP_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+REPLACE_RETRY_DELAY_SEC = 0.05
+
+# Hash des zuletzt geschriebenen Inhalts je Zieldatei, um identische Schreibvorgänge zu überspringen
+_last_saved_hashes: dict[Path, bytes] = {}
+
+# Sperren je Zieldatei, damit gleichzeitige Speichervorgänge (z. B. aus Hintergrund-Threads) sich nicht überlagern
+_target_locks: dict[Path, threading.Lock] = {}
+_target_locks_guard = threading.Lock()
+
+def _get_target_lock(target_path: Path) -> threading.Lock:
+    with _target_locks_guard:
+        lock = _target_locks.get(target_path)
+        if lock is None:
+            lock = _target_locks[target_path] = threading.Lock()
+        return lock
+
+def _replace_with_retry(temp_path: Path, target_path: Path):
+    """
+    Ersetzt die Zieldatei durch die temporäre Datei.
+    Unter Windows kann das Ziel kurzzeitig gesperrt sein (Virenscanner, Indexer),
+    daher wird bei PermissionError genau einmal erneut versucht.
+    """
+    try:
+        os.replace(temp_path, target_path)
+    except PermissionError:
+        time.sleep(REPLACE_RETRY_DELAY_SEC)
+        try:
+            os.replace(temp_path, target_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+# O_TMPFILE (Linux >= 3.11) erzeugt eine namenlose Datei, die erst nach vollständigem
+# Schreiben per linkat() im Verzeichnis sichtbar wird.
+_o_tmpfile_supported = hasattr(os, 'O_TMPFILE') and sys.platform.startswith('linux')
+
+def _write_via_anonymous_tmpfile(payload: bytes, temp_path: Path) -> bool:
+    """
+    Schreibt die Daten in eine anonyme O_TMPFILE-Datei und verlinkt sie erst danach als temp_path.
+    Gibt False zurück, wenn der Weg nicht verfügbar ist und normal geschrieben werden muss.
+    """
+    global _o_tmpfile_supported
+    if not _o_tmpfile_supported:
+        return False
+    try:
+        fd = os.open(temp_path.parent, os.O_WRONLY | os.O_TMPFILE, 0o600)
+    except OSError as e:
+        if e.errno in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+            # Dateisystem unterstützt O_TMPFILE nicht; dauerhaft auf den normalen Weg wechseln
+            _o_tmpfile_supported = False
+            return False
+        raise
+
+    with os.fdopen(fd, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        _fsync_file(f.fileno())
+        temp_path.unlink(missing_ok=True)
+        try:
+            # os.link mit follow_symlinks entspricht linkat(..., AT_SYMLINK_FOLLOW)
+            os.link(f"/proc/self/fd/{f.fileno()}", temp_path, follow_symlinks=True)
+        except OSError:
+            logging.debug("linkat für O_TMPFILE fehlgeschlagen, nutze normalen Schreibweg.", exc_info=True)
+            _o_tmpfile_supported = False
+            return False
+    return True
+
 def save_atomic(data, target_path: str | Path) -> bool:
     """
     Speichert Daten atomar in eine JSON-Datei.
     Akzeptiert sowohl Strings als auch Path-Objekte.
     """
+    try:
+        payload = dumps_json(data)
+    except Exception:
+        logging.exception(f"Fehler beim Serialisieren für '{target_path}'.")
+        return False
+    return save_bytes_atomic(payload, target_path)
+
+def save_bytes_atomic(payload: bytes, target_path: str | Path) -> bool:
+    """
+    Schreibt bereits serialisierte Daten atomar in eine Datei.
+    Akzeptiert sowohl Strings als auch Path-Objekte.
+    """
     try:
         # KORREKTUR: Stellt sicher, dass der Pfad immer ein Path-Objekt ist.
         target_path = Path(target_path)
         
-        fd, temp_path_str = tempfile.mkstemp(dir=target_path.parent, prefix=".tmp")
-        temp_path = Path(temp_path_str)
+        payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        # Die temporäre Datei hat einen festen Namen, daher pro Ziel serialisieren
+        with _get_target_lock(target_path):
+            if _last_saved_hashes.get(target_path) == payload_hash and target_path.exists():
+                logging.debug(f"Inhalt von '{target_path}' unverändert, Speichern übersprungen.")
+                return True
 
-        with os.fdopen(fd, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        
-        temp_path.replace(target_path)
+            # Fester Name neben der Zieldatei statt mkstemp (keine Zufallsnamen-Schleife)
+            temp_path = target_path.with_name(target_path.name + '.tmp')
+            if not _write_via_anonymous_tmpfile(payload, temp_path):
+                fd = os.open(temp_path, _TEMP_FILE_FLAGS, 0o600)
+
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    _fsync_file(f.fileno())
+            
+            _replace_with_retry(temp_path, target_path)
+            _fsync_directory(target_path.parent)
+            _last_saved_hashes[target_path] = payload_hash
         return True
     except Exception:
         logging.exception(f"Fehler beim atomaren Speichern nach '{target_path}'.")
@@ -44,9 +206,118 @@ def save_atomic(data, target_path: str | Path) -> bool:
 CONFIG_DIR = get_config_dir()
 LOG_FILE = CONFIG_DIR / 'monitor.log'
 
+# Aktivierte LibreHardwareMonitor-Subsysteme (Attributnamen von Computer).
+# Netzwerk liefert psutil, Netzteile werden nicht ausgewertet; jedes weitere
+# Subsystem verlängert Computer.Open() und lädt zusätzliche Treiber.
+LHM_SUBSYSTEMS: dict[str, bool] = {
+    'IsCpuEnabled': True,
+    'IsGpuEnabled': True,
+    'IsStorageEnabled': True,
+    'IsMotherboardEnabled': True,
+    'IsControllerEnabled': True,
+    'IsNetworkEnabled': False,
+    'IsPsuEnabled': False,
+}
+
+# Identifier-Präfixe der standardmäßig deaktivierten Subsysteme; Custom-Sensoren können an
+# jeden in Diagnose/Explorer gelisteten Identifier gebunden sein
+LHM_IDENTIFIER_SUBSYSTEMS: dict[str, str] = {
+    '/nic/': 'IsNetworkEnabled',
+    '/psu/': 'IsPsuEnabled',
+}
+
+def lhm_subsystem_for_identifier(identifier: str) -> Optional[str]:
+    """Liefert das Subsystem-Attribut, das für einen Sensor-Identifier aktiv sein muss, sofern bekannt."""
+    for prefix, subsystem in LHM_IDENTIFIER_SUBSYSTEMS.items():
+        if identifier.startswith(prefix):
+            return subsystem
+    return None
+
+def lhm_subsystems_for(identifiers) -> dict[str, bool]:
+    """LHM_SUBSYSTEMS, ergänzt um die Subsysteme, die konfigurierte Custom-Sensoren benötigen."""
+    subsystems = dict(LHM_SUBSYSTEMS)
+    for identifier in identifiers:
+        subsystem = lhm_subsystem_for_identifier(identifier)
+        if subsystem and not subsystems.get(subsystem):
+            logging.info("LHM-Subsystem '%s' wird für Custom-Sensor '%s' aktiviert.", subsystem, identifier)
+            subsystems[subsystem] = True
+    return subsystems
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler mit gepuffertem Dateistrom.
+    Geleert wird höchstens einmal pro FLUSH_INTERVAL_SEC, bei WARNING und höher sofort.
+    Ein Hintergrund-Thread leert den Puffer zusätzlich alle FLUSH_INTERVAL_SEC, damit bei
+    ruhigem Logging keine Zeilen liegen bleiben, die bei einem harten Absturz verloren wären.
+    Die Dateigröße wird intern mitgezählt, statt sie bei jedem Record per stat() zu prüfen.
+    """
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL_SEC = 1.0
+
+    def __init__(self, *args, **kwargs):
+        self._last_flush = time.monotonic()
+        self._force_flush = False
+        self._bytes_written = 0
+        self._record_size = 0
+        self._flush_stop = threading.Event()
+        super().__init__(*args, **kwargs)
+        self._flush_thread = threading.Thread(
+            target=self._periodic_flush, name="LogFlushThread", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _periodic_flush(self):
+        while not self._flush_stop.wait(self.FLUSH_INTERVAL_SEC):
+            if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SEC:
+                self._flush_now()
+
+    def _flush_now(self):
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename) if 'a' in self.mode else 0
+        except OSError:
+            self._bytes_written = 0
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+        # Zeichenanzahl als Näherung für die Bytes; maxBytes ist ohnehin eine weiche Grenze
+        self._record_size = len(self.format(record)) + len(self.terminator)
+        return self._bytes_written + self._record_size >= self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        self._bytes_written = 0
+
+    def emit(self, record):
+        self._force_flush = record.levelno >= logging.WARNING
+        self._record_size = 0
+        super().emit(record)
+        self._bytes_written += self._record_size
+
+    def flush(self):
+        now = time.monotonic()
+        if self._force_flush or now - self._last_flush >= self.FLUSH_INTERVAL_SEC:
+            self._flush_now()
+
+    def close(self):
+        self._flush_stop.set()
+        self._force_flush = True
+        super().close()
+
+# Hintergrund-Listener, der die Log-Records in die Datei schreibt
+_log_listener: Optional[QueueListener] = None
+
 def _create_rotating_log_handler(log_file: Path, max_bytes: int, backup_count: int) -> RotatingFileHandler:
     """Erzeugt einen fertig konfigurierten RotatingFileHandler."""
-    handler = RotatingFileHandler(
+    handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
@@ -59,10 +330,40 @@ def _create_rotating_log_handler(log_file: Path, max_bytes: int, backup_count: i
     handler.setFormatter(formatter)
     return handler
 
+def _stop_log_listener(listener: Optional[QueueListener]):
+    """Stoppt einen QueueListener, schreibt ausstehende Records und schließt dessen Handler."""
+    if listener is None:
+        return
+    try:
+        listener.stop()
+    except Exception:
+        logging.debug("Log-Listener konnte nicht sauber gestoppt werden.", exc_info=True)
+    for handler in listener.handlers:
+        try:
+            handler.close()
+        except Exception:
+            logging.debug("Alter Log-Handler konnte nicht sauber geschlossen werden.", exc_info=True)
+
+def shutdown_logging():
+    """Stoppt den Hintergrund-Listener, damit gepufferte Log-Einträge geschrieben werden."""
+    global _log_listener
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            root_logger.removeHandler(handler)
+    _stop_log_listener(listener)
+
+atexit.register(shutdown_logging)
+
 def reconfigure_logging(settings: dict):
     """
     Rekonfiguriert den Root-Logger mit Werten aus den Einstellungen.
+    Datei-Schreibzugriffe laufen über eine Queue in einem Hintergrund-Thread.
     """
+    global _log_listener
     max_mb = settings.get(SettingsKey.LOG_MAX_SIZE_MB.value, 20)
     backup_count = settings.get(SettingsKey.LOG_BACKUP_COUNT.value, 5)
     log_level_name = settings.get(SettingsKey.LOG_LEVEL.value, "INFO").upper()
@@ -71,28 +372,44 @@ def reconfigure_logging(settings: dict):
     max_bytes = max_mb * 1024 * 1024
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    old_file_handlers = [
+    old_handlers = [
         handler for handler in root_logger.handlers
-        if isinstance(handler, logging.FileHandler)
+        if isinstance(handler, (logging.FileHandler, QueueHandler))
     ]
 
     try:
-        new_handler = _create_rotating_log_handler(LOG_FILE, max_bytes, backup_count)
+        file_handler = _create_rotating_log_handler(LOG_FILE, max_bytes, backup_count)
     except Exception:
         logging.exception(
             "Logging-Rekonfiguration fehlgeschlagen. Bisherige Log-Handler bleiben aktiv."
         )
         return False
 
-    root_logger.addHandler(new_handler)
+    log_queue = queue.SimpleQueue()
+    new_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    new_listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
 
-    for handler in old_file_handlers:
+    for handler in old_handlers:
         root_logger.removeHandler(handler)
+        if isinstance(handler, QueueHandler):
+            continue
         try:
             handler.close()
         except Exception:
             logging.debug("Alter Log-Handler konnte nicht sauber geschlossen werden.", exc_info=True)
 
+    old_listener, _log_listener = _log_listener, new_listener
+    _stop_log_listener(old_listener)
+
+    # Das Log-Format nutzt weder Thread- noch Prozessangaben; deren Ermittlung pro Record entfällt
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if hasattr(logging, "logAsyncioTasks"):
+        logging.logAsyncioTasks = False
+    logging.raiseExceptions = False
+
     logging.info(f"Logging rekonfiguriert: Level={log_level_name}, max_size={max_mb}MB, backups={backup_count}")
     return True
 
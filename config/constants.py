@@ -6,6 +6,8 @@ um "magic strings" zu vermeiden und die Wartbarkeit zu verbessern.
 """
 
 from enum import Enum
+from typing import Final, Literal
+from types import SimpleNamespace
 
 
 # Application Identity
@@ -158,6 +160,11 @@ class SettingsKey(Enum):
     SHOW_GPU_POWER = "show_gpu_power"
 
 
+# Rohe String-Schlüssel als einfache Attribute (K.CPU_COLOR == "cpu_color"),
+# um in häufig ausgeführtem Code den Enum-Zugriff über .value zu sparen.
+K = SimpleNamespace(**{member.name: member.value for member in SettingsKey})
+
+
 # Neue Sensor-Typen für Custom Sensors
 class CustomSensorType(Enum):
     TEMPERATURE = "Temperature"
@@ -195,206 +202,266 @@ class LayoutSection(Enum):
 
 
 # ERWEITERT: Gruppierte Einstellungsschlüssel für das Layout-System
-FONT_SETTING_KEYS = [
-    SettingsKey.FONT_FAMILY.value,
-    SettingsKey.FONT_SIZE.value,
-    SettingsKey.FONT_WEIGHT.value
-]
-
-COLOR_SETTING_KEYS = [
-    SettingsKey.BACKGROUND_COLOR.value,
-    SettingsKey.CPU_COLOR.value,
-    SettingsKey.CPU_TEMP_COLOR.value,
-    SettingsKey.RAM_COLOR.value,
-    SettingsKey.DISK_COLOR.value,
-    SettingsKey.STORAGE_TEMP_COLOR.value,
-    SettingsKey.DISK_IO_COLOR.value,
-    SettingsKey.NET_COLOR.value,
-    SettingsKey.GPU_CORE_TEMP_COLOR.value,
-    SettingsKey.GPU_HOTSPOT_COLOR.value,
-    SettingsKey.GPU_MEMORY_TEMP_COLOR.value,
-    SettingsKey.GPU_VRAM_COLOR.value,
-    SettingsKey.GPU_CORE_CLOCK_COLOR.value,
-    SettingsKey.GPU_MEMORY_CLOCK_COLOR.value,
-    SettingsKey.GPU_POWER_COLOR.value,
-    SettingsKey.CPU_ALARM_COLOR.value,
-    SettingsKey.CPU_TEMP_ALARM_COLOR.value,
-    SettingsKey.RAM_ALARM_COLOR.value,
-    SettingsKey.DISK_ALARM_COLOR.value,
-    SettingsKey.STORAGE_TEMP_ALARM_COLOR.value,
-    SettingsKey.GPU_CORE_TEMP_ALARM_COLOR.value,
-    SettingsKey.GPU_HOTSPOT_ALARM_COLOR.value,
-    SettingsKey.GPU_MEMORY_TEMP_ALARM_COLOR.value,
-    SettingsKey.VRAM_ALARM_COLOR.value,
-    SettingsKey.DISK_IO_ALARM_COLOR.value,
-    SettingsKey.NET_ALARM_COLOR.value,
-    SettingsKey.GPU_CORE_CLOCK_ALARM_COLOR.value,
-    SettingsKey.GPU_MEMORY_CLOCK_ALARM_COLOR.value,
-    SettingsKey.GPU_POWER_ALARM_COLOR.value
-]
-
-TRAY_SETTING_KEYS = [
-    SettingsKey.TRAY_SHAPE.value,
-    SettingsKey.TRAY_SHOW_TEXT.value,
-    SettingsKey.TRAY_CUSTOM_TEXT.value,
-    SettingsKey.TRAY_TEXT_FONT_SIZE.value,
-    SettingsKey.TRAY_TEXT_COLOR.value,
-    SettingsKey.TRAY_BORDER_ENABLED.value,
-    SettingsKey.TRAY_ICON_COLOR.value,
-    SettingsKey.TRAY_BORDER_COLOR.value,
-    SettingsKey.TRAY_ICON_ALARM_COLOR.value,
-    SettingsKey.TRAY_BORDER_THICKNESS.value,
-    SettingsKey.TRAY_BLINKING_ENABLED.value,
-    SettingsKey.TRAY_BLINK_RATE_SEC.value,
-    SettingsKey.TRAY_BLINK_DURATION_MS.value
-]
-
-WIDGET_SETTING_KEYS = [
-    SettingsKey.SHOW_BAR_GRAPHS.value,
-    SettingsKey.BAR_GRAPH_WIDTH_MULTIPLIER.value,
-    SettingsKey.BAR_GRAPH_HEIGHT_FACTOR.value,
-    SettingsKey.WIDGET_MIN_WIDTH.value,
-    SettingsKey.WIDGET_MAX_WIDTH.value,
-    SettingsKey.WIDGET_PADDING_MODE.value,
-    SettingsKey.WIDGET_PADDING_TOP.value,
-    SettingsKey.WIDGET_PADDING_BOTTOM.value,
-    SettingsKey.WIDGET_PADDING_LEFT.value,
-    SettingsKey.WIDGET_PADDING_RIGHT.value,
-    SettingsKey.WIDGET_PADDING_FACTOR.value
-]
-
-OPACITY_SETTING_KEYS = [
-    SettingsKey.BACKGROUND_ALPHA.value
-]
-
-LABEL_SETTING_KEYS = [
-    SettingsKey.CUSTOM_LABELS.value,
-    SettingsKey.LABEL_TRUNCATE_ENABLED.value,
-    SettingsKey.LABEL_TRUNCATE_LENGTH.value
-]
-
-VISIBILITY_SETTING_KEYS = [
-    SettingsKey.SHOW_CPU.value,
-    SettingsKey.SHOW_CPU_TEMP.value,
-    SettingsKey.SHOW_RAM.value,
-    SettingsKey.SHOW_DISK.value,
-    SettingsKey.SHOW_DISK_IO.value,
-    SettingsKey.SHOW_NET.value,
-    SettingsKey.SHOW_GPU.value,
-    SettingsKey.SHOW_GPU_HOTSPOT.value,
-    SettingsKey.SHOW_GPU_MEMORY_TEMP.value,
-    SettingsKey.SHOW_GPU_VRAM.value,
-    SettingsKey.SHOW_GPU_CORE_CLOCK.value,
-    SettingsKey.SHOW_GPU_MEMORY_CLOCK.value,
-    SettingsKey.SHOW_GPU_POWER.value
-]
-
-HARDWARE_SETTING_KEYS = [
-    SettingsKey.SELECTED_NETWORK_INTERFACE.value,
-    SettingsKey.SELECTED_DISK_PARTITION.value,
-    SettingsKey.SELECTED_DISK_IO_DEVICE.value,
-    SettingsKey.SELECTED_GPU_IDENTIFIER.value,
-    SettingsKey.SELECTED_CPU_IDENTIFIER.value
-]
-
-CUSTOM_SENSOR_SETTING_KEYS = [
-    SettingsKey.CUSTOM_SENSORS.value
-]
-
-UNIT_SETTING_KEYS = [
-    SettingsKey.TEMPERATURE_UNIT.value,
-    SettingsKey.NETWORK_UNIT.value,
-    SettingsKey.DISK_IO_UNIT.value,
-    SettingsKey.VALUE_FORMAT.value,
-    SettingsKey.DISK_IO_DISPLAY_MODE.value,
-    SettingsKey.NETWORK_DISPLAY_MODE.value
-]
-
-THRESHOLD_SETTING_KEYS = [
-    SettingsKey.CPU_THRESHOLD.value,
-    SettingsKey.CPU_TEMP_THRESHOLD.value,
-    SettingsKey.RAM_THRESHOLD.value,
-    SettingsKey.DISK_THRESHOLD.value,
-    SettingsKey.STORAGE_TEMP_THRESHOLD.value,
-    SettingsKey.GPU_CORE_TEMP_THRESHOLD.value,
-    SettingsKey.GPU_HOTSPOT_THRESHOLD.value,
-    SettingsKey.GPU_MEMORY_TEMP_THRESHOLD.value,
-    SettingsKey.VRAM_THRESHOLD.value,
-    SettingsKey.DISK_READ_THRESHOLD.value,
-    SettingsKey.DISK_WRITE_THRESHOLD.value,
-    SettingsKey.NET_UP_THRESHOLD.value,
-    SettingsKey.NET_DOWN_THRESHOLD.value,
-    SettingsKey.GPU_CORE_CLOCK_THRESHOLD.value,
-    SettingsKey.GPU_MEMORY_CLOCK_THRESHOLD.value,
-    SettingsKey.GPU_POWER_THRESHOLD.value
-]
-
-SYSTEM_SETTING_KEYS = [
-    SettingsKey.METRIC_ORDER.value,
-    SettingsKey.UPDATE_INTERVAL_MS.value,
-    SettingsKey.DOCKING_GAP.value
-]
-
-WINDOW_SETTING_KEYS = [
-    SettingsKey.ALWAYS_ON_TOP.value,
-    SettingsKey.POSITION_FIXED.value
-]
-
-
-class TrayShape(Enum):
-    ROUND = "rund"
-    SQUARE = "quadrat"
-    TRIANGLE = "dreieck"
-    HEXAGON = "sechseck"
-    DIAMOND = "diamant"
-    STAR = "stern"
-
-
-class TemperatureUnit(Enum):
-    CELSIUS = "C"
-    KELVIN = "K"
-
-
-class NetworkUnit(Enum):
-    MBIT_S = "MBit/s"
-    GBIT_S = "GBit/s"
-
-
-class DiskIOUnit(Enum):
-    MB_S = "MB/s"
-    GB_S = "GB/s"
-
-
-class ValueFormat(Enum):
-    DECIMAL = "decimal"
-    INTEGER = "integer"
-
-
-class DisplayMode(Enum):
-    BOTH = "both"
-    UP = "up"
-    DOWN = "down"
-    READ = "read"
-    WRITE = "write"
-
-
-class FontWeight(Enum):
-    NORMAL = "normal"
-    BOLD = "bold"
-
-
-class LogLevel(Enum):
-    INFO = "INFO"
-    DEBUG = "DEBUG"
-
-
-DEFAULT_METRIC_ORDER = [
+FONT_SETTING_KEYS = (
+    K.FONT_FAMILY,
+    K.FONT_SIZE,
+    K.FONT_WEIGHT
+)
+
+COLOR_SETTING_KEYS = (
+    K.BACKGROUND_COLOR,
+    K.CPU_COLOR,
+    K.CPU_TEMP_COLOR,
+    K.RAM_COLOR,
+    K.DISK_COLOR,
+    K.STORAGE_TEMP_COLOR,
+    K.DISK_IO_COLOR,
+    K.NET_COLOR,
+    K.GPU_CORE_TEMP_COLOR,
+    K.GPU_HOTSPOT_COLOR,
+    K.GPU_MEMORY_TEMP_COLOR,
+    K.GPU_VRAM_COLOR,
+    K.GPU_CORE_CLOCK_COLOR,
+    K.GPU_MEMORY_CLOCK_COLOR,
+    K.GPU_POWER_COLOR,
+    K.CPU_ALARM_COLOR,
+    K.CPU_TEMP_ALARM_COLOR,
+    K.RAM_ALARM_COLOR,
+    K.DISK_ALARM_COLOR,
+    K.STORAGE_TEMP_ALARM_COLOR,
+    K.GPU_CORE_TEMP_ALARM_COLOR,
+    K.GPU_HOTSPOT_ALARM_COLOR,
+    K.GPU_MEMORY_TEMP_ALARM_COLOR,
+    K.VRAM_ALARM_COLOR,
+    K.DISK_IO_ALARM_COLOR,
+    K.NET_ALARM_COLOR,
+    K.GPU_CORE_CLOCK_ALARM_COLOR,
+    K.GPU_MEMORY_CLOCK_ALARM_COLOR,
+    K.GPU_POWER_ALARM_COLOR
+)
+
+TRAY_SETTING_KEYS = (
+    K.TRAY_SHAPE,
+    K.TRAY_SHOW_TEXT,
+    K.TRAY_CUSTOM_TEXT,
+    K.TRAY_TEXT_FONT_SIZE,
+    K.TRAY_TEXT_COLOR,
+    K.TRAY_BORDER_ENABLED,
+    K.TRAY_ICON_COLOR,
+    K.TRAY_BORDER_COLOR,
+    K.TRAY_ICON_ALARM_COLOR,
+    K.TRAY_BORDER_THICKNESS,
+    K.TRAY_BLINKING_ENABLED,
+    K.TRAY_BLINK_RATE_SEC,
+    K.TRAY_BLINK_DURATION_MS
+)
+
+WIDGET_SETTING_KEYS = (
+    K.SHOW_BAR_GRAPHS,
+    K.BAR_GRAPH_WIDTH_MULTIPLIER,
+    K.BAR_GRAPH_HEIGHT_FACTOR,
+    K.WIDGET_MIN_WIDTH,
+    K.WIDGET_MAX_WIDTH,
+    K.WIDGET_PADDING_MODE,
+    K.WIDGET_PADDING_TOP,
+    K.WIDGET_PADDING_BOTTOM,
+    K.WIDGET_PADDING_LEFT,
+    K.WIDGET_PADDING_RIGHT,
+    K.WIDGET_PADDING_FACTOR
+)
+
+OPACITY_SETTING_KEYS = (
+    K.BACKGROUND_ALPHA,
+)
+
+LABEL_SETTING_KEYS = (
+    K.CUSTOM_LABELS,
+    K.LABEL_TRUNCATE_ENABLED,
+    K.LABEL_TRUNCATE_LENGTH
+)
+
+VISIBILITY_SETTING_KEYS = (
+    K.SHOW_CPU,
+    K.SHOW_CPU_TEMP,
+    K.SHOW_RAM,
+    K.SHOW_DISK,
+    K.SHOW_DISK_IO,
+    K.SHOW_NET,
+    K.SHOW_GPU,
+    K.SHOW_GPU_HOTSPOT,
+    K.SHOW_GPU_MEMORY_TEMP,
+    K.SHOW_GPU_VRAM,
+    K.SHOW_GPU_CORE_CLOCK,
+    K.SHOW_GPU_MEMORY_CLOCK,
+    K.SHOW_GPU_POWER
+)
+
+HARDWARE_SETTING_KEYS = (
+    K.SELECTED_NETWORK_INTERFACE,
+    K.SELECTED_DISK_PARTITION,
+    K.SELECTED_DISK_IO_DEVICE,
+    K.SELECTED_GPU_IDENTIFIER,
+    K.SELECTED_CPU_IDENTIFIER
+)
+
+CUSTOM_SENSOR_SETTING_KEYS = (
+    K.CUSTOM_SENSORS,
+)
+
+UNIT_SETTING_KEYS = (
+    K.TEMPERATURE_UNIT,
+    K.NETWORK_UNIT,
+    K.DISK_IO_UNIT,
+    K.VALUE_FORMAT,
+    K.DISK_IO_DISPLAY_MODE,
+    K.NETWORK_DISPLAY_MODE
+)
+
+THRESHOLD_SETTING_KEYS = (
+    K.CPU_THRESHOLD,
+    K.CPU_TEMP_THRESHOLD,
+    K.RAM_THRESHOLD,
+    K.DISK_THRESHOLD,
+    K.STORAGE_TEMP_THRESHOLD,
+    K.GPU_CORE_TEMP_THRESHOLD,
+    K.GPU_HOTSPOT_THRESHOLD,
+    K.GPU_MEMORY_TEMP_THRESHOLD,
+    K.VRAM_THRESHOLD,
+    K.DISK_READ_THRESHOLD,
+    K.DISK_WRITE_THRESHOLD,
+    K.NET_UP_THRESHOLD,
+    K.NET_DOWN_THRESHOLD,
+    K.GPU_CORE_CLOCK_THRESHOLD,
+    K.GPU_MEMORY_CLOCK_THRESHOLD,
+    K.GPU_POWER_THRESHOLD
+)
+
+SYSTEM_SETTING_KEYS = (
+    K.METRIC_ORDER,
+    K.UPDATE_INTERVAL_MS,
+    K.DOCKING_GAP
+)
+
+WINDOW_SETTING_KEYS = (
+    K.ALWAYS_ON_TOP,
+    K.POSITION_FIXED
+)
+
+LOGGING_SETTING_KEYS = (
+    K.LOG_MAX_SIZE_MB,
+    K.LOG_BACKUP_COUNT,
+    K.LOG_LEVEL
+)
+
+# Set-Varianten der Schlüssellisten für schnelle Zugehörigkeitsprüfungen
+FONT_SETTING_KEY_SET = frozenset(FONT_SETTING_KEYS)
+COLOR_SETTING_KEY_SET = frozenset(COLOR_SETTING_KEYS)
+TRAY_SETTING_KEY_SET = frozenset(TRAY_SETTING_KEYS)
+WIDGET_SETTING_KEY_SET = frozenset(WIDGET_SETTING_KEYS)
+OPACITY_SETTING_KEY_SET = frozenset(OPACITY_SETTING_KEYS)
+LABEL_SETTING_KEY_SET = frozenset(LABEL_SETTING_KEYS)
+VISIBILITY_SETTING_KEY_SET = frozenset(VISIBILITY_SETTING_KEYS)
+HARDWARE_SETTING_KEY_SET = frozenset(HARDWARE_SETTING_KEYS)
+CUSTOM_SENSOR_SETTING_KEY_SET = frozenset(CUSTOM_SENSOR_SETTING_KEYS)
+UNIT_SETTING_KEY_SET = frozenset(UNIT_SETTING_KEYS)
+THRESHOLD_SETTING_KEY_SET = frozenset(THRESHOLD_SETTING_KEYS)
+SYSTEM_SETTING_KEY_SET = frozenset(SYSTEM_SETTING_KEYS)
+WINDOW_SETTING_KEY_SET = frozenset(WINDOW_SETTING_KEYS)
+LOGGING_SETTING_KEY_SET = frozenset(LOGGING_SETTING_KEYS)
+
+
+class StringConstants:
+    """
+    Basisklasse für Gruppen von String-Konstanten, die als Einstellungswerte dienen.
+    Die Attribute sind gewöhnliche Strings, ein Zugriff über .value entfällt.
+    """
+
+    @classmethod
+    def items(cls) -> tuple[tuple[str, str], ...]:
+        """Gibt alle (NAME, Wert)-Paare in Definitionsreihenfolge zurück."""
+        return tuple(
+            (name, value) for name, value in vars(cls).items()
+            if name.isupper() and isinstance(value, str)
+        )
+
+    @classmethod
+    def values(cls) -> tuple[str, ...]:
+        """Gibt alle Werte in Definitionsreihenfolge zurück."""
+        return tuple(value for _, value in cls.items())
+
+
+class TrayShape(StringConstants):
+    ROUND: Final = "rund"
+    SQUARE: Final = "quadrat"
+    TRIANGLE: Final = "dreieck"
+    HEXAGON: Final = "sechseck"
+    DIAMOND: Final = "diamant"
+    STAR: Final = "stern"
+
+TrayShapeT = Literal["rund", "quadrat", "dreieck", "sechseck", "diamant", "stern"]
+
+
+class TemperatureUnit(StringConstants):
+    CELSIUS: Final = "C"
+    KELVIN: Final = "K"
+
+TemperatureUnitT = Literal["C", "K"]
+
+KELVIN_OFFSET: Final = 273.15
+
+
+class NetworkUnit(StringConstants):
+    MBIT_S: Final = "MBit/s"
+    GBIT_S: Final = "GBit/s"
+
+NetworkUnitT = Literal["MBit/s", "GBit/s"]
+
+
+class DiskIOUnit(StringConstants):
+    MB_S: Final = "MB/s"
+    GB_S: Final = "GB/s"
+
+DiskIOUnitT = Literal["MB/s", "GB/s"]
+
+
+class ValueFormat(StringConstants):
+    DECIMAL: Final = "decimal"
+    INTEGER: Final = "integer"
+
+ValueFormatT = Literal["decimal", "integer"]
+
+
+class DisplayMode(StringConstants):
+    BOTH: Final = "both"
+    UP: Final = "up"
+    DOWN: Final = "down"
+    READ: Final = "read"
+    WRITE: Final = "write"
+
+DisplayModeT = Literal["both", "up", "down", "read", "write"]
+
+
+class FontWeight(StringConstants):
+    NORMAL: Final = "normal"
+    BOLD: Final = "bold"
+
+FontWeightT = Literal["normal", "bold"]
+
+
+class LogLevel(StringConstants):
+    INFO: Final = "INFO"
+    DEBUG: Final = "DEBUG"
+
+LogLevelT = Literal["INFO", "DEBUG"]
+
+
+DEFAULT_METRIC_ORDER = (
     "cpu", "cpu_temp", "ram", "disk", "disk_io", "net",
     "gpu", "gpu_hotspot", "gpu_memory_temp", "gpu_vram", "gpu_core_clock",
     "gpu_memory_clock", "gpu_power"
-]
+)
 
-DEFAULT_GEOMETRY = [100, 100, 250, 200]
+DEFAULT_GEOMETRY = (100, 100, 250, 200)
 
 
 class DefaultColors:
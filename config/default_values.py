@@ -1,4 +1,7 @@
 # config/default_values.py
+from types import MappingProxyType
+
+from .config import dumps_json
 from .constants import (
     DEFAULT_METRIC_ORDER, DEFAULT_GEOMETRY, DEFAULT_UPDATE_INTERVAL_MS,
     DEFAULT_BACKGROUND_ALPHA, NETWORK_INTERFACE_ALL,
@@ -7,19 +10,19 @@ from .constants import (
     DefaultThresholds, DefaultFont, DefaultTrayIcon, DefaultLogging, FontWeight
 )
 
-DEFAULT_SETTINGS_BASE = {
+_DEFAULT_SETTINGS_BASE = {
     "language": "german",
 
     # Fenster & Layout
-    "metric_order": DEFAULT_METRIC_ORDER.copy(),
-    "geometry": DEFAULT_GEOMETRY.copy(),
+    "metric_order": list(DEFAULT_METRIC_ORDER),  # wird in ui_manager in-place verändert
+    "geometry": list(DEFAULT_GEOMETRY),
     "background_alpha": DEFAULT_BACKGROUND_ALPHA,
     "background_color": DefaultColors.BACKGROUND,
     "position_fixed": False,
     "always_on_top": True,
     "font_family": "Fira Code",
     "font_size": DefaultFont.SIZE,
-    "font_weight": FontWeight.BOLD.value,
+    "font_weight": FontWeight.BOLD,
     "update_interval_ms": DEFAULT_UPDATE_INTERVAL_MS,
     "docking_gap": 1,
     
@@ -38,12 +41,12 @@ DEFAULT_SETTINGS_BASE = {
     "widget_padding_factor": 0.25,
 
     # Einheiten & Formatierung
-    "temperature_unit": TemperatureUnit.CELSIUS.value,
-    "network_unit": NetworkUnit.MBIT_S.value,
-    "disk_io_unit": DiskIOUnit.MB_S.value,
-    "value_format": ValueFormat.DECIMAL.value,
-    "disk_io_display_mode": DisplayMode.BOTH.value,
-    "network_display_mode": DisplayMode.BOTH.value,
+    "temperature_unit": TemperatureUnit.CELSIUS,
+    "network_unit": NetworkUnit.MBIT_S,
+    "disk_io_unit": DiskIOUnit.MB_S,
+    "value_format": ValueFormat.DECIMAL,
+    "disk_io_display_mode": DisplayMode.BOTH,
+    "network_display_mode": DisplayMode.BOTH,
     "custom_labels": {},
     "label_truncate_enabled": True,
     "label_truncate_length": 15,
@@ -122,7 +125,7 @@ DEFAULT_SETTINGS_BASE = {
     "gpu_power_threshold": DefaultThresholds.GPU_POWER_W,
 
     # Tray Icon
-    "tray_shape": DefaultTrayIcon.SHAPE.value,
+    "tray_shape": DefaultTrayIcon.SHAPE,
     "tray_show_text": DefaultTrayIcon.SHOW_TEXT,
     "tray_custom_text": DefaultTrayIcon.TEXT,
     "tray_text_font_size": DefaultTrayIcon.FONT_SIZE,
@@ -158,3 +161,9 @@ DEFAULT_SETTINGS_BASE = {
     "monitoring_max_file_size_mb": 100,
     "monitoring_max_duration_hours": 24
 }
+
+# Schreibgeschützte Sicht auf die Standardwerte; Änderungen erfolgen nur an Kopien
+DEFAULT_SETTINGS_BASE = MappingProxyType(_DEFAULT_SETTINGS_BASE)
+
+# Einmalig serialisierte Standardwerte für Erststart und "Zurücksetzen"
+DEFAULT_SETTINGS_JSON_BYTES = dumps_json(_DEFAULT_SETTINGS_BASE)
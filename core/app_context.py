@@ -2,20 +2,23 @@
 import logging
 from copy import deepcopy
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QCoreApplication, QObject, Signal
 
 from utils.settings_manager import SettingsManager
 from config import default_values
-from config.config import reconfigure_logging
-from config.constants import SettingsKey
+from config.config import lhm_subsystems_for, reconfigure_logging
+from config.constants import SettingsKey, LOGGING_SETTING_KEY_SET
 from core.translation_manager import TranslationManager
 from core.hardware_manager import HardwareManager
-from core.monitor_manager import MonitorManager
 from core.data_handler import DataHandler
-from monitoring.history_manager import HistoryManager # NEU
+
+if TYPE_CHECKING:
+    from core.monitor_manager import MonitorManager
+    from monitoring.history_manager import HistoryManager
 
 
 class StartupAction(Enum):
@@ -36,7 +39,11 @@ class AppContext(QObject):
         
         # 1. SettingsManager als Erstes initialisieren
         settings_file = self.config_dir / 'settings.json'
-        self.settings_manager = SettingsManager(settings_file, default_values.DEFAULT_SETTINGS_BASE)
+        self.settings_manager = SettingsManager(
+            settings_file,
+            default_values.DEFAULT_SETTINGS_BASE,
+            default_values.DEFAULT_SETTINGS_JSON_BYTES,
+        )
         logging.info(f"SettingsManager für '{settings_file}' initialisiert.")
 
         # 2. Logging mit den geladenen Einstellungen rekonfigurieren
@@ -44,13 +51,12 @@ class AppContext(QObject):
 
         # 3. Weitere kernale Manager initialisieren
         self.translator = TranslationManager()
-        self.hardware_manager = HardwareManager()
+        custom_sensors = self.settings_manager.get_setting(SettingsKey.CUSTOM_SENSORS.value, {})
+        self.hardware_manager = HardwareManager(lhm_subsystems_for(
+            sensor_data.get('identifier', '') for sensor_data in custom_sensors.values()
+        ))
         self._initialize_selected_hardware()
-        self.monitor_manager = MonitorManager()
-        
-        # NEU: HistoryManager initialisieren
-        # Wir übergeben den Kontext (self), damit der Manager später auf main_win zugreifen kann
-        self.history_manager = HistoryManager(self.settings_manager, self.config_dir, self)
+        # MonitorManager und HistoryManager werden erst beim ersten Zugriff erzeugt (siehe Properties)
 
         # 4. Sprache basierend auf den geladenen Einstellungen setzen
         current_lang = self.settings_manager.get_setting(SettingsKey.LANGUAGE.value, "german")
@@ -62,10 +68,27 @@ class AppContext(QObject):
         self._connect_signals()
         logging.info("AppContext vollständig initialisiert.")
 
+    @cached_property
+    def monitor_manager(self) -> "MonitorManager":
+        """Verwaltet die Bildschirmkonfiguration; wird beim ersten Zugriff erzeugt."""
+        from core.monitor_manager import MonitorManager
+        return MonitorManager()
+
+    @cached_property
+    def history_manager(self) -> "HistoryManager":
+        """Zeichnet Monitoring-Daten auf; wird beim ersten Zugriff erzeugt."""
+        from monitoring.history_manager import HistoryManager
+        # Wir übergeben den Kontext (self), damit der Manager später auf main_win zugreifen kann
+        return HistoryManager(self.settings_manager, self.config_dir, self)
+
     def _connect_signals(self):
         """Verbindet Signale zwischen den Managern, um die Entkopplung zu fördern."""
         self.settings_manager.setting_changed.connect(self._on_setting_changed)
         self.settings_manager.setting_changed.connect(self.data_handler.on_setting_changed)
+        if (app := QCoreApplication.instance()):
+            # Entprellte Speichervorgänge beim Beenden nicht verlieren
+            app.aboutToQuit.connect(self.settings_manager.flush_pending_save)
+            app.aboutToQuit.connect(self.data_handler.shutdown)
         logging.debug("Signale im AppContext verbunden.")
         
     def _initialize_selected_hardware(self):
@@ -91,11 +114,7 @@ class AppContext(QObject):
             self.translator.set_language(value)
             self.language_changed.emit(value)
             logging.info(f"Sprache über Signal auf '{value}' geändert.")
-        elif key in [
-            SettingsKey.LOG_MAX_SIZE_MB.value,
-            SettingsKey.LOG_BACKUP_COUNT.value,
-            SettingsKey.LOG_LEVEL.value,
-        ]:
+        elif key in LOGGING_SETTING_KEY_SET:
             reconfigure_logging(self.settings_manager.get_all_settings())
 
     def get_settings(self) -> dict:
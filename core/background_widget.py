@@ -1,24 +1,33 @@
 # core/background_widget.py
 import logging
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QColor, QPainter, QBrush, QPen
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPixmap, QBrush, QPen
+from PySide6.QtCore import Qt, QRectF
 
 class BackgroundWidget(QWidget):
     """Ein benutzerdefiniertes Widget für einen abgerundeten, halbtransparenten Hintergrund."""
+    CORNER_RADIUS = 5.0
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.background_color = QColor(40, 40, 40, 200)
         self.border_color = None
         self.border_width = 0
 
+        # Zeichenobjekte werden nur bei Änderungen neu erzeugt, nicht pro paintEvent
+        self._brush = QBrush(self.background_color)
+        self._pen = None
+        self._bg_pixmap = None
+        self._update_geometry_cache()
+
     def set_background_color(self, color_hex):
         """Setzt die Grundfarbe des Hintergrunds über einen Hex-String."""
         try:
             alpha = self.background_color.alpha()
             self.background_color = QColor(color_hex)
             self.background_color.setAlpha(alpha)
-            self.update()
+            self._brush = QBrush(self.background_color)
+            self._invalidate_pixmap()
         except Exception as e:
             logging.error(f"Ungültiger Farbwert für Hintergrund: {color_hex} - {e}")
 
@@ -29,37 +38,74 @@ class BackgroundWidget(QWidget):
         except (TypeError, ValueError):
             alpha = 200
         self.background_color.setAlpha(max(0, min(255, alpha)))
-        self.update()
+        self._brush = QBrush(self.background_color)
+        self._invalidate_pixmap()
 
     # --- NEUE METHODEN FÜR GRUPPENRAHMEN ---
     def set_border(self, color: QColor, width: int):
         """Legt einen farbigen Rahmen für das Widget fest."""
         self.border_color = color
         self.border_width = width
-        self.update()
+        if color and width > 0:
+            self._pen = QPen(color)
+            self._pen.setWidth(width)
+        else:
+            self._pen = None
+        self._invalidate_pixmap()
 
     def remove_border(self):
         """Entfernt den Rahmen."""
         self.border_color = None
         self.border_width = 0
-        self.update()
+        self._pen = None
+        self._invalidate_pixmap()
     # ----------------------------------------
 
-    def paintEvent(self, event):
-        """Zeichnet das Widget."""
-        painter = QPainter(self)
+    def _invalidate_pixmap(self):
+        """Verwirft das vorgerenderte Hintergrundbild und fordert ein Neuzeichnen an."""
+        self._bg_pixmap = None
+        self.update()
+
+    def _update_geometry_cache(self):
+        """Berechnet Zeichenrechtecke und Pfad für die aktuelle Größe."""
+        self._bg_rect = QRectF(self.rect())
+        # Ein leicht kleineres Rechteck für den Rahmen, damit er "sauber" aussieht
+        self._border_rect = self._bg_rect.adjusted(1, 1, -1, -1)
+        self._bg_path = QPainterPath()
+        self._bg_path.addRoundedRect(self._bg_rect, self.CORNER_RADIUS, self.CORNER_RADIUS)
+        self._bg_pixmap = None
+
+    def _render_pixmap(self) -> QPixmap:
+        """Rendert Hintergrund und optionalen Rahmen einmalig in ein Pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Zeichne den Hintergrund
-        painter.setBrush(QBrush(self.background_color))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(self.rect(), 5.0, 5.0)
+        painter.fillPath(self._bg_path, self._brush)
 
         # Zeichne den optionalen Rahmen (für Gruppen)
-        if self.border_color and self.border_width > 0:
-            pen = QPen(self.border_color)
-            pen.setWidth(self.border_width)
-            painter.setPen(pen)
+        if self._pen is not None:
+            painter.setPen(self._pen)
             painter.setBrush(Qt.BrushStyle.NoBrush) # Wichtig: Nur den Rahmen zeichnen
-            # Ein leicht kleineres Rechteck für den Rahmen, damit er "sauber" aussieht
-            painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 5.0, 5.0)
+            painter.drawRoundedRect(self._border_rect, self.CORNER_RADIUS, self.CORNER_RADIUS)
+        painter.end()
+        return pixmap
+
+    def resizeEvent(self, event):
+        """Berechnet die Zeichengeometrie nur bei Größenänderungen neu."""
+        self._update_geometry_cache()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        """Kopiert den neu zu zeichnenden Bereich aus dem vorgerenderten Hintergrund."""
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._bg_pixmap = self._render_pixmap()
+
+        painter = QPainter(self)
+        painter.setClipRect(event.rect())
+        painter.drawPixmap(0, 0, self._bg_pixmap)
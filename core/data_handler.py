@@ -1,30 +1,127 @@
 from __future__ import annotations
 import logging
+import threading
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Dict, Any, Optional, Callable
 
-from PySide6.QtCore import QObject, Signal, Slot
-from config.constants import SettingsKey, TemperatureUnit, DisplayMode, ValueFormat
+from PySide6.QtCore import QObject, QThread, Signal, Slot
+from config.constants import K, KELVIN_OFFSET, SettingsKey, TemperatureUnit, DisplayMode, ValueFormat
 
 if TYPE_CHECKING:
     from core.app_context import AppContext
 
 
+@dataclass(frozen=True, slots=True)
+class CustomSensor:
+    identifier: str
+    display_name: str
+    unit: str
+    color: str
+    sensor_type: str
+
+
+@dataclass(slots=True)
+class MetricPayload:
+    """Aufbereitete Anzeigedaten einer Metrik; wird pro Metrik ueber alle Ticks wiederverwendet."""
+    value_text: str = ""
+    percent_value: Optional[float] = None
+    is_alarm: bool = False
+    normal_color: str = ""
+    alarm_color: str = ""
+
+
+class DataProcessingWorker(QObject):
+    """Fuehrt die Aufbereitung der Rohdaten im Verarbeitungs-Thread des DataHandlers aus."""
+
+    def __init__(self, handler: "DataHandler"):
+        super().__init__()
+        self._handler = handler
+
+    @Slot(object)
+    def process(self, request: tuple[Dict[str, Any], bool]):
+        data, changed_only = request
+        try:
+            updates, any_alarm = self._handler._build_updates(data, changed_only)
+        except Exception:
+            logging.exception("Fehler bei der Aufbereitung der Monitoring-Daten.")
+            updates, any_alarm = None, False
+        # Immer antworten, damit der DataHandler den naechsten Stand freigibt
+        self._handler._results_ready.emit(updates, any_alarm)
+
+
 class DataHandler(QObject):
     """
     Verarbeitet Rohdaten, konvertiert Einheiten und stellt sie zur Anzeige bereit.
     Sendet ein Signal mit den aufbereiteten Daten, anstatt die UI direkt zu manipulieren.
+    Die Aufbereitung laeuft in einem eigenen Thread; die Signale kommen im GUI-Thread an.
     """
-    metric_updated = Signal(str, dict)
+    metrics_updated = Signal(dict)  # {metric_key: MetricPayload}, hoechstens einmal pro Tick
     alarm_state_changed = Signal(bool)
 
+    _processing_requested = Signal(object)  # GUI -> Worker: (Rohdaten, changed_only)
+    _results_ready = Signal(object, bool)  # Worker -> GUI: (updates, any_alarm)
+
+    THREAD_TERMINATION_TIMEOUT_MS = 2000
+
+    # Globale Einstellungen, die pro Tick gelesen werden (Schluessel -> Default)
+    TICK_SETTING_DEFAULTS = {
+        K.VALUE_FORMAT: None,
+        K.TEMPERATURE_UNIT: "",
+        K.DISK_IO_UNIT: "MB/s",
+        K.DISK_IO_DISPLAY_MODE: None,
+        K.NETWORK_UNIT: "MBit/s",
+        K.NETWORK_DISPLAY_MODE: None,
+        K.DISK_READ_THRESHOLD: float("inf"),
+        K.DISK_WRITE_THRESHOLD: float("inf"),
+        K.NET_UP_THRESHOLD: float("inf"),
+        K.NET_DOWN_THRESHOLD: float("inf"),
+    }
+
     def __init__(self, context: "AppContext", parent: QObject | None = None):
         super().__init__(parent)
         self.context = context
         self.translator = context.translator
         self.settings_manager = context.settings_manager
-        self.custom_sensors = {}  # Cache fuer Custom Sensors
+        self.custom_sensors: Dict[str, CustomSensor] = {}  # Cache fuer Custom Sensors
+        self._tick_settings: Dict[str, Any] = {}
+        self._metric_settings: Dict[str, Dict[str, Any]] = {}
+        self._metric_items: list[tuple[str, Dict[str, Any], Dict[str, Any]]] = []
+        self._snapshot_keys: frozenset[str] = frozenset()
+        # Pro Tick aufgebaute Lookups fuer Storage-Temperaturen und Custom Sensors
+        self._storage_temps_by_key: Dict[str, Optional[float]] = {}
+        self._custom_sensor_values: Dict[str, Any] = {}
+        self._debug_enabled = False
+        self._use_kelvin = False
+        self._na_text = ""
+        # Zuletzt ausgelieferter Anzeigezustand je Metrik, fuer changed_only-Durchlaeufe
+        self._delivered: Dict[str, tuple] = {}
+        # Schuetzt Konfiguration und Snapshot waehrend der Verarbeitung im Worker-Thread
+        self._lock = threading.RLock()
         self._define_metric_configs()
         self._load_custom_sensors()
+        self._refresh_settings_snapshot()
+
+        # Nur im GUI-Thread benutzt: hoechstens ein Datensatz in Arbeit, neuester wartet
+        self._processing = False
+        # Zuletzt gesendeter Alarmzustand; unabhaengig davon, ob sich eine Anzeige geaendert hat
+        self._last_alarm_state: Optional[bool] = None
+        self._pending_data: Optional[Dict[str, Any]] = None
+        self._pending_changed_only = True
+        self._worker_thread = QThread()
+        self._worker_thread.setObjectName("DataHandlerThread")
+        self._worker = DataProcessingWorker(self)
+        self._worker.moveToThread(self._worker_thread)
+        self._processing_requested.connect(self._worker.process)
+        self._results_ready.connect(self._on_results_ready)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._worker_thread.start()
+
+    def shutdown(self):
+        """Beendet den Verarbeitungs-Thread."""
+        if self._worker_thread.isRunning():
+            self._worker_thread.quit()
+            if not self._worker_thread.wait(self.THREAD_TERMINATION_TIMEOUT_MS):
+                logging.critical("DataHandler-Thread hat nicht innerhalb des Timeouts beendet.")
 
     @Slot(str, object)
     def on_setting_changed(self, key: str, value: Any):
@@ -32,6 +129,70 @@ class DataHandler(QObject):
         if key == SettingsKey.CUSTOM_SENSORS.value:
             logging.debug("DataHandler hat eine Aenderung an den Custom Sensors erkannt und aktualisiert den Cache.")
             self.refresh_custom_sensors()
+        elif key in self._snapshot_keys:
+            self._refresh_settings_snapshot()
+            # Sofort neu aufbereiten: neu eingeblendete Metriken befuellen und geaenderte Farben,
+            # Einheiten oder Schwellwerte anzeigen, auch wenn das Hauptfenster unveraenderte
+            # Sensordaten nicht erneut ausliefert
+            if latest_data := self.context.get_latest_monitor_data():
+                self.process_new_data(latest_data)
+
+    def refresh_language(self):
+        """Uebernimmt uebersetzte Texte des Snapshots (z. B. "N/A") nach einem Sprachwechsel."""
+        self._refresh_settings_snapshot()
+
+    def _refresh_settings_snapshot(self):
+        """
+        Liest alle Einstellungen, die process_new_data pro Tick benoetigt, einmalig ein.
+        Wird bei relevanten Einstellungsaenderungen und nach dem Neuladen der Metriken aufgerufen.
+        """
+        with self._lock:
+            self._rebuild_settings_snapshot()
+
+    def _rebuild_settings_snapshot(self):
+        # Farben/Formate koennen sich geaendert haben: naechster Durchlauf sendet alles
+        self._delivered.clear()
+        get = self.settings_manager.get_setting
+        self._tick_settings = {key: get(key, default) for key, default in self.TICK_SETTING_DEFAULTS.items()}
+
+        self._use_kelvin = self._tick_settings[K.TEMPERATURE_UNIT] == TemperatureUnit.KELVIN
+        self._na_text = self.translator.translate("na")
+        self._build_io_templates()
+
+        snapshot_keys = set(self.TICK_SETTING_DEFAULTS)
+        metric_settings = {}
+        for key, config in self.METRIC_CONFIG.items():
+            visibility_key = config["visibility_key"]
+            entry = {"visible": get(visibility_key, True), "threshold": None}
+            snapshot_keys.add(visibility_key)
+
+            # Farben aendern sich nur ueber Einstellungen und werden direkt im
+            # wiederverwendeten Payload hinterlegt statt pro Tick gesetzt
+            if config.get("custom_sensor"):
+                normal_color, alarm_color = self.custom_sensors[key].color, "#FF4500"
+            elif (color_key := config["color_setting_key"]):
+                alarm_key = config["alarm_setting_key"]
+                normal_color, alarm_color = get(color_key), get(alarm_key)
+                snapshot_keys.update((color_key, alarm_key))
+            else:
+                normal_color, alarm_color = "#FFFFFF", "#FF4500"
+            payload = config["_payload"]
+            payload.normal_color = normal_color
+            payload.alarm_color = alarm_color
+
+            if (threshold_key := config["threshold_setting_key"]):
+                entry["threshold"] = get(threshold_key)
+                snapshot_keys.add(threshold_key)
+
+            metric_settings[key] = entry
+
+        self._metric_settings = metric_settings
+        self._snapshot_keys = frozenset(snapshot_keys)
+        # Vorberechnete Iterationsliste fuer process_new_data, sichtbare Metriken zuerst
+        self._metric_items = sorted(
+            ((key, config, metric_settings[key]) for key, config in self.METRIC_CONFIG.items()),
+            key=lambda item: not item[2]["visible"],
+        )
 
     def _define_metric_configs(self):
         """Definiert eine zentrale Konfiguration fuer alle Metriken."""
@@ -51,6 +212,35 @@ class DataHandler(QObject):
             "gpu_power": {"data_key": "gpu_power", "format": "{value:.1f} W", "color_key": SettingsKey.GPU_POWER_COLOR, "threshold_key": SettingsKey.GPU_POWER_THRESHOLD},
         }
         self._add_storage_configs()
+        for key, config in self.METRIC_CONFIG.items():
+            self._prepare_metric_config(key, config)
+
+    @staticmethod
+    def _prepare_metric_config(metric_key: str, config: Dict[str, Any]) -> None:
+        """
+        Loest die Einstellungs-Schluessel einer Metrik einmalig zu Strings auf und legt
+        das pro Tick wiederverwendete Payload-Objekt und Format-Dict an.
+        """
+        color_key_enum = config.get("color_key")
+        threshold_key_enum = config.get("threshold_key")
+        color_setting_key = color_key_enum.value if color_key_enum else None
+        config["visibility_key"] = f"show_{metric_key}"
+        config["color_setting_key"] = color_setting_key
+        config["alarm_setting_key"] = color_setting_key.replace("_color", "_alarm_color") if color_setting_key else None
+        config["threshold_setting_key"] = threshold_key_enum.value if threshold_key_enum else None
+        for optional_key in ("value_func", "data_key", "na_value", "percent_key"):
+            config.setdefault(optional_key, None)
+        config["is_temperature"] = config.get("unit_setting") == SettingsKey.TEMPERATURE_UNIT
+        if "alarm_func" not in config:
+            if config["threshold_setting_key"]:
+                config["alarm_func"] = DataHandler._create_threshold_alarm_func(config.get("percent_key"))
+            else:
+                config["alarm_func"] = DataHandler._never_alarm
+        format_string = config.get("format", "")
+        config["format_float"] = format_string
+        config["format_int"] = format_string.replace(":.1f", ":.0f").replace(":.2f", ":.0f")
+        config["_payload"] = MetricPayload()
+        config["_format_values"] = {"value": None, "unit": ""}
 
     def _load_custom_sensors(self):
         """Laedt Custom Sensors aus den Einstellungen und fuegt sie zur METRIC_CONFIG hinzu."""
@@ -62,13 +252,13 @@ class DataHandler(QObject):
 
             metric_key = f"custom_{sensor_id}"
 
-            self.custom_sensors[metric_key] = {
-                "identifier": sensor_data.get("identifier", ""),
-                "display_name": sensor_data.get("display_name", ""),
-                "unit": sensor_data.get("unit", ""),
-                "color": sensor_data.get("color", "#FFFFFF"),
-                "sensor_type": sensor_data.get("sensor_type", ""),
-            }
+            self.custom_sensors[metric_key] = CustomSensor(
+                identifier=sensor_data.get("identifier", ""),
+                display_name=sensor_data.get("display_name", ""),
+                unit=sensor_data.get("unit", ""),
+                color=sensor_data.get("color", "#FFFFFF"),
+                sensor_type=sensor_data.get("sensor_type", ""),
+            )
 
             self.METRIC_CONFIG[metric_key] = {
                 "value_func": self._create_custom_sensor_value_func(metric_key),
@@ -78,6 +268,7 @@ class DataHandler(QObject):
                 "threshold_key": None,
                 "custom_sensor": True,
             }
+            self._prepare_metric_config(metric_key, self.METRIC_CONFIG[metric_key])
 
         logging.info(f"Loaded {len(self.custom_sensors)} custom sensors")
 
@@ -92,25 +283,26 @@ class DataHandler(QObject):
         if metric_key not in self.custom_sensors:
             return None
 
-        identifier = self.custom_sensors[metric_key]["identifier"]
-        custom_sensor_data = data.get("custom_sensors", {})
-        value = custom_sensor_data.get(identifier)
+        identifier = self.custom_sensors[metric_key].identifier
+        value = self._custom_sensor_values.get(identifier)
 
         if value is not None:
-            logging.debug(f"Custom Sensor {metric_key} ({identifier}): {value}")
+            logging.debug("Custom Sensor %s (%s): %s", metric_key, identifier, value)
             return float(value)
 
-        logging.debug(f"Custom Sensor {metric_key} ({identifier}): Kein Wert verfuegbar")
+        logging.debug("Custom Sensor %s (%s): Kein Wert verfuegbar", metric_key, identifier)
         return None
 
     def refresh_custom_sensors(self):
         """Laedt Custom Sensors neu und aktualisiert die METRIC_CONFIG."""
-        keys_to_remove = [key for key in self.METRIC_CONFIG.keys() if key.startswith("custom_")]
-        for key in keys_to_remove:
-            del self.METRIC_CONFIG[key]
+        with self._lock:
+            keys_to_remove = [key for key in self.METRIC_CONFIG.keys() if key.startswith("custom_")]
+            for key in keys_to_remove:
+                del self.METRIC_CONFIG[key]
 
-        self.custom_sensors.clear()
-        self._load_custom_sensors()
+            self.custom_sensors.clear()
+            self._load_custom_sensors()
+            self._refresh_settings_snapshot()
 
         logging.info("Custom Sensors im DataHandler aktualisiert.")
 
@@ -133,200 +325,248 @@ class DataHandler(QObject):
             }
 
     def _get_storage_temp_value(self, data: Dict[str, Any], storage_key: str) -> Optional[float]:
-        """Extrahiert eine spezifische Storage-Temperatur aus den Rohdaten."""
-        storage_temps = data.get("storage_temps", [])
+        """Extrahiert eine spezifische Storage-Temperatur aus dem pro Tick aufgebauten Index."""
+        storage_temps = self._storage_temps_by_key
         if not storage_temps:
-            logging.debug(f"Keine Storage-Temperaturen in den Daten gefunden fuer Key: {storage_key}")
+            logging.debug("Keine Storage-Temperaturen in den Daten gefunden fuer Key: %s", storage_key)
             return None
 
-        for drive in storage_temps:
-            if drive.get("key") == storage_key:
-                temp_value = drive.get("temp")
-                logging.debug(
-                    f"Storage-Temperatur gefunden fuer {storage_key}: {temp_value}\N{DEGREE SIGN}C"
-                )
-                return temp_value
-
-        logging.debug(
-            f"Storage-Key '{storage_key}' nicht in den verfuegbaren Daten gefunden: "
-            f"{[d.get('key') for d in storage_temps]}"
-        )
-        return None
+        if storage_key in storage_temps:
+            temp_value = storage_temps[storage_key]
+            logging.debug("Storage-Temperatur gefunden fuer %s: %s\N{DEGREE SIGN}C", storage_key, temp_value)
+            return temp_value
 
-    def _is_metric_visible(self, metric_key: str) -> bool:
-        """Prueft, ob eine Metrik in der UI angezeigt wird."""
-        visibility_key = f"show_{metric_key}"
-        return self.settings_manager.get_setting(visibility_key, True)
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Storage-Key '%s' nicht in den verfuegbaren Daten gefunden: %s", storage_key, list(storage_temps)
+            )
+        return None
 
-    def process_new_data(self, data: Dict[str, Any]):
-        """Verarbeitet neue Rohdaten und sendet Signale mit aufbereiteten Informationen."""
+    def process_new_data(self, data: Dict[str, Any], changed_only: bool = False):
+        """
+        Uebergibt neue Rohdaten an den Verarbeitungs-Thread. Treffen Daten ein, waehrend noch
+        ein Datensatz verarbeitet wird, wird nur der neueste nachgereicht.
+
+        Mit changed_only=True (regulaerer Tick) enthaelt metrics_updated nur Metriken, deren
+        Anzeige sich seit der letzten Auslieferung geaendert hat; sonst werden alle gesendet.
+        """
+        if self._processing:
+            # Ein zurueckgehaltener vollstaendiger Durchlauf darf nicht verloren gehen
+            self._pending_changed_only = changed_only and (
+                self._pending_data is None or self._pending_changed_only
+            )
+            self._pending_data = data
+            return
+        self._processing = True
+        self._processing_requested.emit((data, changed_only))
+
+    def invalidate_delivered_state(self):
+        """Erzwingt, dass der naechste Durchlauf wieder alle sichtbaren Metriken sendet."""
+        with self._lock:
+            self._delivered.clear()
+
+    @Slot(object, bool)
+    def _on_results_ready(self, updates: Optional[Dict[str, MetricPayload]], any_alarm: bool):
+        """Sendet die Ergebnisse im GUI-Thread und startet ggf. den zurueckgehaltenen Datensatz."""
+        if updates is not None:
+            self.metrics_updated.emit(updates)
+        # Auch ohne Anzeigeaenderung senden, z. B. wenn die alarmierende Metrik ausgeblendet wurde
+        if any_alarm != self._last_alarm_state:
+            self._last_alarm_state = any_alarm
+            self.alarm_state_changed.emit(any_alarm)
+        # Erst nach dem Ausliefern freigeben: die Payload-Objekte werden im naechsten Tick wiederverwendet
+        self._processing = False
+        if (data := self._pending_data) is not None:
+            self._pending_data = None
+            self.process_new_data(data, self._pending_changed_only)
+
+    def _build_updates(
+        self, data: Dict[str, Any], changed_only: bool = False
+    ) -> tuple[Optional[Dict[str, MetricPayload]], bool]:
+        """Bereitet alle Metriken auf (laeuft im Verarbeitungs-Thread)."""
+        with self._lock:
+            return self._build_updates_locked(data, changed_only)
+
+    def _build_updates_locked(
+        self, data: Dict[str, Any], changed_only: bool
+    ) -> tuple[Optional[Dict[str, MetricPayload]], bool]:
         any_alarm = False
+        # Einmal pro Tick indizieren statt pro Storage-Metrik linear zu suchen
+        self._storage_temps_by_key = {drive.get("key"): drive.get("temp") for drive in data.get("storage_temps") or ()}
+        self._custom_sensor_values = data.get("custom_sensors") or {}
+
+        # Debug-Ausgaben nur aufbauen, wenn DEBUG aktiv ist (einmal pro Tick geprueft)
+        self._debug_enabled = logging.root.isEnabledFor(logging.DEBUG)
+        if self._debug_enabled:
+            self._log_raw_sensor_data(data)
+
+        updates = {}
+        delivered = self._delivered
+        for key, config, metric_settings in self._metric_items:
+            if not metric_settings["visible"]:
+                break  # Unsichtbare Metriken stehen am Ende der Liste und werden nicht angezeigt
+            payload = self._process_single_metric(key, config, metric_settings, data)
+            if payload.is_alarm:
+                any_alarm = True
+            state = (
+                payload.value_text, payload.percent_value, payload.is_alarm,
+                payload.normal_color, payload.alarm_color,
+            )
+            if changed_only and delivered.get(key) == state:
+                continue
+            delivered[key] = state
+            updates[key] = payload
+        # Keine Aenderung: kein leeres metrics_updated senden
+        return (updates or None), any_alarm
 
+    def _log_raw_sensor_data(self, data: Dict[str, Any]):
+        """Protokolliert Storage- und Custom-Sensor-Rohwerte (nur bei aktivem DEBUG)."""
         if "storage_temps" in data:
-            logging.debug(f"Verarbeite Storage-Temperaturen: {len(data['storage_temps'])} Sensoren")
+            logging.debug("Verarbeite Storage-Temperaturen: %d Sensoren", len(data["storage_temps"]))
             for temp_data in data["storage_temps"]:
-                logging.debug(
-                    f"  Storage: {temp_data.get('key')} = {temp_data.get('temp')}\N{DEGREE SIGN}C"
-                )
+                logging.debug("  Storage: %s = %s\N{DEGREE SIGN}C", temp_data.get("key"), temp_data.get("temp"))
 
         if "custom_sensors" in data:
-            logging.debug(f"Verarbeite Custom Sensors: {len(data['custom_sensors'])} Sensoren")
+            logging.debug("Verarbeite Custom Sensors: %d Sensoren", len(data["custom_sensors"]))
             for identifier, value in data["custom_sensors"].items():
-                logging.debug(f"  Custom: {identifier} = {value}")
-
-        for key, config in self.METRIC_CONFIG.items():
-            is_alarm = self._process_single_metric(key, config, data)
-            if is_alarm:
-                any_alarm = True
-        self.alarm_state_changed.emit(any_alarm)
-
-    def _process_single_metric(self, key: str, config: Dict[str, Any], data: Dict[str, Any]) -> bool:
-        """Verarbeitet eine einzelne Metrik, sendet ein Signal und gibt den Alarmstatus zurueck."""
-        is_visible = self._is_metric_visible(key)
-
-        raw_value = self._extract_raw_value(config, data)
-        display_value = self._convert_value_unit(raw_value, config)
+                logging.debug("  Custom: %s = %s", identifier, value)
+
+    def _process_single_metric(
+        self, key: str, config: Dict[str, Any], metric_settings: Dict[str, Any], data: Dict[str, Any]
+    ) -> MetricPayload:
+        """Verarbeitet eine einzelne Metrik und gibt die aufbereiteten Anzeigedaten zurueck."""
+        # Rohwert-Extraktion und Einheitenumrechnung inline, da pro Metrik und Tick aufgerufen
+        if (value_func := config["value_func"]) is not None:
+            raw_value = value_func(data)
+        elif (data_key := config["data_key"]) is not None:
+            raw_value = data.get(data_key)
+            if raw_value == config["na_value"]:
+                raw_value = None
+        else:
+            raw_value = data
 
-        is_alarm = False
-        if is_visible:
-            is_alarm = config.get("alarm_func", self._is_alarm)(config, data, raw_value)
+        display_value = raw_value
+        if raw_value is not None and self._use_kelvin and config["is_temperature"]:
+            display_value = float(raw_value) + KELVIN_OFFSET
 
-        if config.get("custom_sensor"):
-            normal_color = self.custom_sensors.get(key, {}).get("color", "#FFFFFF")
-            alarm_color = "#FF4500"
-        else:
-            color_key_enum = config.get("color_key")
-            normal_color, alarm_color = "#FFFFFF", "#FF4500"
-            if color_key_enum:
-                color_key = color_key_enum.value
-                alarm_key = color_key.replace("_color", "_alarm_color")
-                normal_color = self.settings_manager.get_setting(color_key)
-                alarm_color = self.settings_manager.get_setting(alarm_key)
+        is_alarm = config["alarm_func"](config, data, raw_value, metric_settings)
 
         if display_value is None:
-            value_text, percent_value = self.translator.translate("na"), None
+            value_text, percent_value = self._na_text, None
         else:
             value_text = self._format_value(config, display_value, key)
-            percent_value = data.get(config.get("percent_key"))
-
-        payload = {
-            "value_text": value_text,
-            "percent_value": percent_value,
-            "is_alarm": is_alarm,
-            "normal_color": normal_color,
-            "alarm_color": alarm_color,
-        }
+            percent_value = data.get(config["percent_key"])
 
-        if key.startswith("storage_temp_") or key.startswith("custom_"):
-            logging.debug(f"Sende Metrik-Update fuer {key}: {value_text}")
+        # Das Payload-Objekt wird pro Metrik wiederverwendet; Empfaenger muessen die Werte
+        # kopieren, wenn sie sie ueber den Slot-Aufruf hinaus behalten wollen.
+        payload = config["_payload"]
+        payload.value_text = value_text
+        payload.percent_value = percent_value
+        payload.is_alarm = is_alarm
 
-        self.metric_updated.emit(key, payload)
-        return is_alarm
+        if self._debug_enabled and key.startswith(("storage_temp_", "custom_")):
+            logging.debug("Sende Metrik-Update fuer %s: %s", key, value_text)
 
-    def _extract_raw_value(self, config: Dict[str, Any], data: Dict[str, Any]) -> Optional[Any]:
-        if (value_func := config.get("value_func")):
-            return value_func(data)
-        if (data_key := config.get("data_key")):
-            value = data.get(data_key)
-            return None if value == config.get("na_value") else value
-        return data
-
-    def _convert_value_unit(self, value: Any, config: Dict[str, Any]) -> Any:
-        if value is None:
-            return None
-        if (unit_setting := config.get("unit_setting")) == SettingsKey.TEMPERATURE_UNIT:
-            if self.settings_manager.get_setting(unit_setting.value) == TemperatureUnit.KELVIN.value:
-                return float(value) + 273.15
-        return value
+        return payload
 
     def _format_value(self, config: Dict[str, Any], value: Any, metric_key: str = None) -> str:
         if (format_func := config.get("format_func")):
             return format_func(value)[0]
 
-        format_string = config.get("format", "")
-        if self.settings_manager.get_setting(SettingsKey.VALUE_FORMAT.value) == ValueFormat.INTEGER.value:
-            format_string = format_string.replace(":.1f", ":.0f").replace(":.2f", ":.0f")
+        is_integer = self._tick_settings[K.VALUE_FORMAT] == ValueFormat.INTEGER
+        format_string = config["format_int" if is_integer else "format_float"]
 
         unit_symbol = ""
         if config.get("custom_sensor") and metric_key:
-            unit_symbol = self.custom_sensors.get(metric_key, {}).get("unit", "")
-        elif (unit_setting := config.get("unit_setting")):
-            unit = self.settings_manager.get_setting(unit_setting.value, "")
+            unit_symbol = self.custom_sensors[metric_key].unit if metric_key in self.custom_sensors else ""
+        elif config.get("unit_setting"):
+            unit = self._tick_settings[K.TEMPERATURE_UNIT]
             unit_symbol = "\N{DEGREE SIGN}C" if unit == "C" else (" K" if unit == "K" else unit)
 
-        format_values = {"unit": unit_symbol}
+        # Feste Schluessel pro Metrik: Felder ueberschreiben statt das Mapping neu aufzubauen
+        format_values = config["_format_values"]
+        format_values["unit"] = unit_symbol
         if isinstance(value, dict):
             format_values.update(value)
         else:
             format_values["value"] = value
-        return format_string.format(**format_values)
-
-    def _is_alarm(self, config: Dict[str, Any], data: Dict[str, Any], raw_value: Optional[float]) -> bool:
-        if not (threshold_key_enum := config.get("threshold_key")):
-            return False
-        threshold = self.settings_manager.get_setting(threshold_key_enum.value)
-        if threshold is None:
-            return False
-
-        value_to_check = data.get(config.get("percent_key")) if config.get("percent_key") else raw_value
-        return value_to_check is not None and float(value_to_check) > float(threshold)
-
-    def _is_disk_io_alarm(self, config, data, raw_value) -> bool:
-        read_thresh = self.settings_manager.get_setting(SettingsKey.DISK_READ_THRESHOLD.value, float("inf"))
-        write_thresh = self.settings_manager.get_setting(SettingsKey.DISK_WRITE_THRESHOLD.value, float("inf"))
-        read_alarm = data.get("disk_read_mbps", 0) > read_thresh
-        write_alarm = data.get("disk_write_mbps", 0) > write_thresh
-        mode = self.settings_manager.get_setting(SettingsKey.DISK_IO_DISPLAY_MODE.value)
-        if mode == DisplayMode.READ.value:
+        return format_string.format_map(format_values)
+
+    @staticmethod
+    def _never_alarm(config, data, raw_value, metric_settings) -> bool:
+        return False
+
+    @staticmethod
+    def _create_threshold_alarm_func(percent_key: Optional[str]) -> Callable[..., bool]:
+        """
+        Erstellt eine auf die Metrik spezialisierte Alarmpruefung: Prozentwerte werden
+        direkt aus den Rohdaten gelesen, sonst wird der Rohwert verglichen.
+        """
+        if percent_key:
+            def percent_alarm(config, data, raw_value, metric_settings) -> bool:
+                threshold = metric_settings["threshold"]
+                value = data.get(percent_key)
+                return threshold is not None and value is not None and float(value) > float(threshold)
+            return percent_alarm
+
+        def raw_value_alarm(config, data, raw_value, metric_settings) -> bool:
+            threshold = metric_settings["threshold"]
+            return threshold is not None and raw_value is not None and float(raw_value) > float(threshold)
+        return raw_value_alarm
+
+    def _is_disk_io_alarm(self, config, data, raw_value, metric_settings) -> bool:
+        tick = self._tick_settings
+        read_alarm = data.get("disk_read_mbps", 0) > tick[K.DISK_READ_THRESHOLD]
+        write_alarm = data.get("disk_write_mbps", 0) > tick[K.DISK_WRITE_THRESHOLD]
+        mode = tick[K.DISK_IO_DISPLAY_MODE]
+        if mode == DisplayMode.READ:
             return read_alarm
-        if mode == DisplayMode.WRITE.value:
+        if mode == DisplayMode.WRITE:
             return write_alarm
         return read_alarm or write_alarm
 
-    def _is_net_alarm(self, config, data, raw_value) -> bool:
-        up_thresh = self.settings_manager.get_setting(SettingsKey.NET_UP_THRESHOLD.value, float("inf"))
-        down_thresh = self.settings_manager.get_setting(SettingsKey.NET_DOWN_THRESHOLD.value, float("inf"))
-        up_alarm = data.get("net_up_mbps", 0) > up_thresh
-        down_alarm = data.get("net_down_mbps", 0) > down_thresh
-        mode = self.settings_manager.get_setting(SettingsKey.NETWORK_DISPLAY_MODE.value)
-        if mode == DisplayMode.UP.value:
+    def _is_net_alarm(self, config, data, raw_value, metric_settings) -> bool:
+        tick = self._tick_settings
+        up_alarm = data.get("net_up_mbps", 0) > tick[K.NET_UP_THRESHOLD]
+        down_alarm = data.get("net_down_mbps", 0) > tick[K.NET_DOWN_THRESHOLD]
+        mode = tick[K.NETWORK_DISPLAY_MODE]
+        if mode == DisplayMode.UP:
             return up_alarm
-        if mode == DisplayMode.DOWN.value:
+        if mode == DisplayMode.DOWN:
             return down_alarm
         return up_alarm or down_alarm
 
+    def _build_io_templates(self):
+        """Baut die Format-Templates fuer Disk-I/O und Netzwerk aus den aktuellen Einstellungen."""
+        tick = self._tick_settings
+        fmt = ".0f" if tick[K.VALUE_FORMAT] == ValueFormat.INTEGER else ".1f"
+
+        unit, mode = tick[K.DISK_IO_UNIT], tick[K.DISK_IO_DISPLAY_MODE]
+        r_str, w_str = f"R:{{read:{fmt}}}", f"W:{{write:{fmt}}}"
+        if mode == DisplayMode.READ:
+            self._disk_io_template = f"{r_str} {unit}"
+        elif mode == DisplayMode.WRITE:
+            self._disk_io_template = f"{w_str} {unit}"
+        else:
+            self._disk_io_template = f"{r_str} {w_str} {unit}"
+
+        unit, mode = tick[K.NETWORK_UNIT], tick[K.NETWORK_DISPLAY_MODE]
+        self._net_in_gbit = unit == "GBit/s"
+        up_str, down_str = f"\u25B2{{up:{fmt}}}", f"\u25BC{{down:{fmt}}}"
+        if mode == DisplayMode.UP:
+            self._net_template = f"{up_str} {unit}"
+        elif mode == DisplayMode.DOWN:
+            self._net_template = f"{down_str} {unit}"
+        else:
+            self._net_template = f"{up_str} {down_str} {unit}"
+
     def _format_disk_io(self, data: Dict[str, Any]) -> tuple[str, tuple[float, float]]:
-        s = self.settings_manager
-        unit = s.get_setting(SettingsKey.DISK_IO_UNIT.value, "MB/s")
-        mode = s.get_setting(SettingsKey.DISK_IO_DISPLAY_MODE.value)
         read, write = data.get("disk_read_mbps", 0), data.get("disk_write_mbps", 0)
-        fmt = ".0f" if s.get_setting(SettingsKey.VALUE_FORMAT.value) == ValueFormat.INTEGER.value else ".1f"
-
-        r_str, w_str = f"R:{read:{fmt}}", f"W:{write:{fmt}}"
-        if mode == DisplayMode.READ.value:
-            text = f"{r_str} {unit}"
-        elif mode == DisplayMode.WRITE.value:
-            text = f"{w_str} {unit}"
-        else:
-            text = f"{r_str} {w_str} {unit}"
-        return text, (read, write)
+        return self._disk_io_template.format(read=read, write=write), (read, write)
 
     def _format_network(self, data: Dict[str, Any]) -> tuple[str, tuple[float, float]]:
-        s = self.settings_manager
-        unit = s.get_setting(SettingsKey.NETWORK_UNIT.value, "MBit/s")
-        mode = s.get_setting(SettingsKey.NETWORK_DISPLAY_MODE.value)
         up, down = data.get("net_up_mbps", 0), data.get("net_down_mbps", 0)
-        fmt = ".0f" if s.get_setting(SettingsKey.VALUE_FORMAT.value) == ValueFormat.INTEGER.value else ".1f"
-
-        if unit == "GBit/s":
+        if self._net_in_gbit:
             up /= 1000
             down /= 1000
-        up_str, down_str = f"\u25B2{up:{fmt}}", f"\u25BC{down:{fmt}}"
-
-        if mode == DisplayMode.UP.value:
-            text = f"{up_str} {unit}"
-        elif mode == DisplayMode.DOWN.value:
-            text = f"{down_str} {unit}"
-        else:
-            text = f"{up_str} {down_str} {unit}"
-        return text, (up, down)
+        return self._net_template.format(up=up, down=down), (up, down)
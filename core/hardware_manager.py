@@ -1,17 +1,24 @@
 # core/hardware_manager.py
+import hashlib
+import io
 import logging
 import os
 import sys
+import time
 import traceback
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from functools import wraps
 from pathlib import Path
 from typing import Any, List, Dict, Optional, Tuple
 
 from utils.system_utils import psutil, PSUTIL_AVAILABLE
-from config.config import CONFIG_DIR
+from config.config import CONFIG_DIR, LHM_SUBSYSTEMS, lhm_subsystem_for_identifier
 from config.constants import AppInfo
 from .sensor_cache import load_sensor_cache, save_sensor_cache
-from .sensor_mapping import find_sensor, diagnose_sensor_matching, get_available_sensors_for_hardware
+from .sensor_mapping import (
+    find_sensor, resolve_all, diagnose_sensor_matching, get_available_sensors_for_hardware, invalidate_sensor_search_cache,
+)
 
 try:
     import clr
@@ -19,6 +26,78 @@ try:
 except ImportError:
     LHM_SUPPORT = False
 
+# Teilstrings zur Einordnung von hw.HardwareType (verschiedene LHM-Versionen)
+CPU_TYPE_INDICATORS = frozenset({'cpu', 'processor', 'amd', 'intel'})
+GPU_TYPE_INDICATORS = frozenset({'gpu', 'graphics', 'nvidia', 'amd', 'radeon', 'geforce', 'quadro'})
+STORAGE_TYPE_INDICATORS = frozenset({'storage', 'hdd', 'ssd', 'nvme', 'm2', 'disk'})
+MOTHERBOARD_TYPE_INDICATORS = frozenset({'motherboard', 'mainboard', 'controller', 'superio'})
+
+# Zuordnung der LHM-HardwareType-Namen zu den Kategorien der Erkennung
+HARDWARE_TYPE_CATEGORY: Dict[str, str] = {
+    'Cpu': 'CPU',
+    'GpuNvidia': 'GPU',
+    'GpuAmd': 'GPU',
+    'GpuIntel': 'GPU',
+    'Storage': 'Storage',
+    'Motherboard': 'Motherboard',
+    'SuperIO': 'Motherboard',
+    'EmbeddedController': 'Motherboard',
+    'Memory': 'Other',
+    'Network': 'Other',
+    'Cooler': 'Other',
+    'Psu': 'Other',
+    'Battery': 'Other',
+}
+
+# GPU-Metrikschlüssel -> kanonischer Sensorname aus sensor_mapping.SENSOR_MAP
+_GPU_SENSOR_MAP: Tuple[Tuple[str, str], ...] = (
+    ('gpu_core_temp', 'GPU_CORE_TEMP'),
+    ('gpu_hotspot_temp', 'GPU_HOTSPOT_TEMP'),
+    ('gpu_memory_temp', 'GPU_MEMORY_TEMP'),
+    ('core_clock', 'GPU_CORE_CLOCK'),
+    ('memory_clock', 'GPU_MEMORY_CLOCK'),
+    ('power', 'GPU_POWER'),
+    ('vram_used', 'VRAM_USED'),
+    ('vram_total', 'VRAM_TOTAL'),
+)
+
+
+class _NullDebugInfo(list):
+    """Verwirft alle Einträge; Ersatz für debug_info, wenn niemand die Zeilen liest."""
+    __slots__ = ()
+
+    def append(self, item):
+        pass
+
+    def extend(self, items):
+        pass
+
+
+_NULL_DEBUG_INFO = _NullDebugInfo()
+
+
+def _ttl_cached(seconds: float):
+    """Cacht das Ergebnis einer argumentlosen Methode pro Instanz für `seconds` Sekunden."""
+    def decorator(method):
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self):
+            now = time.monotonic()
+            cached = self._ttl_cache.get(name)
+            if cached is not None and now < cached[0]:
+                return list(cached[1])
+            value = method(self)
+            self._ttl_cache[name] = (now + seconds, value)
+            return list(value)
+        return wrapper
+    return decorator
+
+
+def _new_debug_info() -> Optional[List[str]]:
+    """Liefert nur bei aktivem DEBUG-Logging eine echte Liste für Such-Details."""
+    return [] if logging.getLogger().isEnabledFor(logging.DEBUG) else None
+
 
 @dataclass(frozen=True)
 class HardwareOperationResult:
@@ -36,9 +115,18 @@ class HardwareSelectionState:
 class HardwareManager:
     """Verwaltet LibreHardwareMonitor-Integration und grundlegende Hardware-Abfragen."""
     REQUIRED_DLLS = ("HidSharp.dll", "LibreHardwareMonitorLib.dll")
-
-    def __init__(self):
+    # Obergrenze, damit der Identifier-Cache bei ständig neuen CLR-Wrappern nicht unbegrenzt wächst
+    ID_CACHE_MAX_ENTRIES = 4096
+    # Mindestabstand zwischen zwei hw.Update()-Aufrufen derselben Hardware
+    MIN_UPDATE_INTERVAL_S = 0.25
+    # Gültigkeitsdauer der psutil-Listen (Laufwerke, Partitionen, Netzwerkkarten)
+    DEVICE_LIST_TTL_S = 5.0
+    # Maximale Verschachtelungstiefe der Sub-Hardware im Diagnosebericht
+    MAX_REPORT_DEPTH = 8
+
+    def __init__(self, subsystems: Optional[Dict[str, bool]] = None):
         self.pythonnet_available = LHM_SUPPORT
+        self.subsystems: Dict[str, bool] = dict(LHM_SUBSYSTEMS if subsystems is None else subsystems)
         self.lhm_support = False
         self.computer = None
         self.lhm_error: str | None = None
@@ -53,14 +141,30 @@ class HardwareManager:
         self.storage_display_names: Dict[str, str] = {}
         self.selected_cpu_id = "auto"
         self.selected_gpu_id = "auto"
+        # Identifier -> (Hardware, Sensor), bei der Erkennung einmal aufgebaut
+        self._sensor_by_id: Dict[str, Tuple[Any, Any]] = {}
+        # Name -> erste Hardware dieses Namens (wie die frühere lineare Suche)
+        self._hw_by_name: Dict[str, Any] = {}
+        # Identifier -> CPU/GPU für die Auswahl
+        self._cpu_by_id: Dict[str, Any] = {}
+        self._gpu_by_id: Dict[str, Any] = {}
 
         # Cache-System
         self.sensor_cache = load_sensor_cache()
-        self.cache_updated = False
+        # Anzahl geänderter, noch nicht gespeicherter Cache-Einträge
+        self._dirty_entries = 0
         self.hardware_fingerprint = ""
-
-        # Diagnose-Informationen
-        self.initialization_log = []
+        # id(CLR-Objekt) -> (Objekt, str(Identifier)); vermeidet wiederholtes CLR-Marshalling
+        self._id_cache: Dict[int, Tuple[Any, str]] = {}
+        # Hardware-Identifier -> Zeitpunkt des letzten hw.Update() über _maybe_update
+        self._last_update: Dict[str, float] = {}
+        # Methodenname -> (Ablaufzeitpunkt, Ergebnis) für _ttl_cached
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
+        # Identifier, für die bereits vor einem deaktivierten Subsystem gewarnt wurde
+        self._disabled_subsystem_warnings: set = set()
+
+        # Diagnose-Informationen; Einträge als (Format, *Argumente), formatiert erst im Bericht
+        self.initialization_log: List[Tuple[Any, ...]] = []
         self.failed_sensors: Dict[str, Any] = {}
         self.hardware_detected: Dict[str, int] = {}
         self.last_operation_result = HardwareOperationResult(True, "Hardware manager bereit.")
@@ -70,7 +174,32 @@ class HardwareManager:
         else:
             self.lhm_error = "pythonnet/clr konnte nicht importiert werden."
             logging.error(self.lhm_error)
-            self.initialization_log.append(f"FEHLER: {self.lhm_error}")
+            self._log_init("FEHLER: %s", self.lhm_error)
+
+    def _ident(self, obj) -> str:
+        """Liefert str(obj.Identifier) und merkt sich das Ergebnis pro CLR-Objekt."""
+        key = id(obj)
+        entry = self._id_cache.get(key)
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+        ident = str(obj.Identifier)
+        if len(self._id_cache) >= self.ID_CACHE_MAX_ENTRIES:
+            self._id_cache.clear()
+        # Das Objekt wird mitgespeichert, damit seine id() nicht neu vergeben werden kann
+        self._id_cache[key] = (obj, ident)
+        return ident
+
+    def _log_init(self, fmt: str, *args):
+        """Merkt sich einen Eintrag für das Initialisierungs-Log, ohne ihn sofort zu formatieren."""
+        self.initialization_log.append((fmt, *args))
+
+    def _maybe_update(self, hw):
+        """Ruft hw.Update() höchstens einmal pro MIN_UPDATE_INTERVAL_S auf."""
+        now = time.monotonic()
+        key = self._ident(hw)
+        if now - self._last_update.get(key, -self.MIN_UPDATE_INTERVAL_S) >= self.MIN_UPDATE_INTERVAL_S:
+            hw.Update()
+            self._last_update[key] = now
 
     @property
     def gpu_supported(self) -> bool:
@@ -144,7 +273,7 @@ class HardwareManager:
                     f"Benötigt: {', '.join(self.REQUIRED_DLLS)} | Gesucht in: {searched}"
                 )
                 logging.error(self.lhm_error)
-                self.initialization_log.append(f"FEHLER: {self.lhm_error}")
+                self._log_init("FEHLER: %s", self.lhm_error)
                 return
 
             dll_directory = next(iter(dll_paths.values())).parent
@@ -155,27 +284,21 @@ class HardwareManager:
             from LibreHardwareMonitor.Hardware import Computer
 
             self.computer = Computer()
-            self.computer.IsCpuEnabled = True
-            self.computer.IsGpuEnabled = True
-            self.computer.IsStorageEnabled = True
-            self.computer.IsMotherboardEnabled = True
-            self.computer.IsControllerEnabled = True
-            self.computer.IsNetworkEnabled = True
-            self.computer.IsPsuEnabled = True
+            for name, enabled in self.subsystems.items():
+                setattr(self.computer, name, enabled)
             self.computer.Open()
 
-            self._create_hardware_fingerprint()
+            fingerprint_parts = self._create_hardware_fingerprint()
 
             cached_fingerprint = self.sensor_cache.get('_hardware_fingerprint', '')
             if cached_fingerprint != self.hardware_fingerprint:
                 logging.info("Hardware-Konfiguration geändert - Cache wird zurückgesetzt")
+                logging.debug("Aktuelle Hardware-Konfiguration: %s", fingerprint_parts)
                 self.sensor_cache = {'_hardware_fingerprint': self.hardware_fingerprint}
-                self.cache_updated = True
+                self._dirty_entries += 1
 
             self._detect_hardware_with_diagnostics()
-
-            if self.cache_updated:
-                save_sensor_cache(self.sensor_cache)
+            self._save_sensor_cache_if_dirty()
                 
             self._log_final_status()
             self.lhm_error = None
@@ -186,126 +309,161 @@ class HardwareManager:
             self.lhm_support = False
             self.lhm_error = f"Fehler bei LHM-Initialisierung: {e}"
             logging.error(f"{self.lhm_error}\n{traceback.format_exc()}")
-            self.initialization_log.append(f"FEHLER: {self.lhm_error}")
+            self._log_init("FEHLER: %s", self.lhm_error)
 
-    def _create_hardware_fingerprint(self):
-        """Erstellt einen Fingerprint der aktuellen Hardware-Konfiguration."""
-        fingerprint_parts = []
-        
-        for hw in self.computer.Hardware:
-            hw_info = f"{hw.HardwareType}:{hw.Name}:{hw.Identifier}"
-            fingerprint_parts.append(hw_info)
-        
-        self.hardware_fingerprint = "|".join(sorted(fingerprint_parts))
-        logging.debug(f"Hardware-Fingerprint erstellt: {len(fingerprint_parts)} Geräte")
+    def _create_hardware_fingerprint(self) -> List[str]:
+        """Erstellt einen Fingerprint (Hash) der aktuellen Hardware-Konfiguration.
+
+        Gespeichert wird nur der kurze Digest; die Einzelteile werden zurückgegeben,
+        damit sie bei einer Abweichung für die Diagnose geloggt werden können.
+        """
+        fingerprint_parts = sorted(
+            f"{hw.HardwareType}:{hw.Name}:{self._ident(hw)}" for hw in self.computer.Hardware
+        )
+        self.hardware_fingerprint = hashlib.blake2b(
+            "|".join(fingerprint_parts).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        logging.debug("Hardware-Fingerprint erstellt: %d Geräte", len(fingerprint_parts))
+        return fingerprint_parts
 
     def _detect_hardware_with_diagnostics(self):
         """Erkennt Hardware mit detaillierter Diagnose-Ausgabe."""
-        self.initialization_log.append("=== HARDWARE-ERKENNUNG GESTARTET ===")
-        
-        hardware_count = {'CPU': 0, 'GPU': 0, 'Storage': 0, 'Motherboard': 0, 'Other': 0}
-        
+        self._log_init("=== HARDWARE-ERKENNUNG GESTARTET ===")
+
+        # Phase 1: Hardware einmal aufzählen und nach Kategorie einsortieren
+        buckets: Dict[str, List[Tuple[Any, str]]] = defaultdict(list)
         for hw in self.computer.Hardware:
-            hw.Update()
             hw_type_str = str(hw.HardwareType)
-            hw_type_lower = hw_type_str.lower()
-            
-            self.initialization_log.append(f"Gefunden: {hw.Name} ({hw_type_str})")
-            
-            if self._is_cpu_hardware(hw_type_lower):
-                hardware_count['CPU'] += 1
-                self.cpus.append(hw) # GEÄNDERT: CPU zur Liste hinzufügen
-                self.initialization_log.append(f"  CPU erkannt: {hw.Name}")
-            elif self._is_gpu_hardware(hw_type_lower):
-                hardware_count['GPU'] += 1
-                self.gpus.append(hw)
-                self.initialization_log.append(f"  GPU erkannt: {hw.Name}")
-            elif self._is_storage_hardware(hw_type_lower):
-                hardware_count['Storage'] += 1
-                self._process_storage_with_diagnostics(hw)
-            elif self._is_motherboard_hardware(hw_type_lower):
-                hardware_count['Motherboard'] += 1
-                self._process_motherboard_with_diagnostics(hw)
-            else:
-                hardware_count['Other'] += 1
-                self.initialization_log.append(f"  Andere Hardware (wird für Explorer bereitgestellt): {hw_type_str}")
+            buckets[self._categorize_hardware(hw_type_str)].append((hw, hw_type_str))
+            self._hw_by_name.setdefault(hw.Name, hw)
+
+        handlers = {
+            'CPU': self._register_cpu,
+            'GPU': self._register_gpu,
+            'Storage': lambda hw, _type: self._process_storage_with_diagnostics(hw),
+            'Motherboard': lambda hw, _type: self._process_motherboard_with_diagnostics(hw),
+            'Other': self._register_other_hardware,
+        }
+
+        # Phase 2: je Kategorie erst alle Geräte aktualisieren, dann verarbeiten
+        hardware_count = {category: len(buckets.get(category, ())) for category in handlers}
+        for category, handler in handlers.items():
+            entries = buckets.get(category)
+            if not entries:
+                continue
+            for hw, _type in entries:
+                hw.Update()
+                self._index_sensors(hw)
+            for hw, hw_type_str in entries:
+                self._log_init("Gefunden: %s (%s)", hw.Name, hw_type_str)
+                handler(hw, hw_type_str)
 
         self.hardware_detected = hardware_count
-        self.initialization_log.append(f"Hardware-Zusammenfassung: {hardware_count}")
+        self._log_init("Hardware-Zusammenfassung: %s", hardware_count)
+
+    def _register_cpu(self, hw, hw_type_str: str):
+        """Nimmt eine erkannte CPU in die Auswahlliste auf."""
+        self.cpus.append(hw)
+        self._cpu_by_id.setdefault(self._ident(hw), hw)
+        self._log_init("  CPU erkannt: %s", hw.Name)
+
+    def _register_gpu(self, hw, hw_type_str: str):
+        """Nimmt eine erkannte GPU in die Auswahlliste auf."""
+        self.gpus.append(hw)
+        self._gpu_by_id.setdefault(self._ident(hw), hw)
+        self._log_init("  GPU erkannt: %s", hw.Name)
+
+    def _register_other_hardware(self, hw, hw_type_str: str):
+        """Vermerkt Hardware ohne eigene Verarbeitung (nur im Explorer sichtbar)."""
+        self._log_init("  Andere Hardware (wird für Explorer bereitgestellt): %s", hw_type_str)
+
+    def _index_sensors(self, hw):
+        """Nimmt alle Sensoren einer Hardware in den Identifier-Index auf."""
+        for sensor in hw.Sensors:
+            self._sensor_by_id[self._ident(sensor)] = (hw, sensor)
+
+    def _categorize_hardware(self, hw_type_str: str) -> str:
+        """Ordnet einen HardwareType einer Kategorie zu; unbekannte Namen über Teilstrings."""
+        category = HARDWARE_TYPE_CATEGORY.get(hw_type_str)
+        if category is not None:
+            return category
+
+        hw_type_lower = hw_type_str.lower()
+        if self._is_cpu_hardware(hw_type_lower):
+            return 'CPU'
+        if self._is_gpu_hardware(hw_type_lower):
+            return 'GPU'
+        if self._is_storage_hardware(hw_type_lower):
+            return 'Storage'
+        if self._is_motherboard_hardware(hw_type_lower):
+            return 'Motherboard'
+        return 'Other'
 
     def _is_cpu_hardware(self, hw_type_lower: str) -> bool:
         """Erweiterte CPU-Erkennung für verschiedene LibreHardwareMonitor-Versionen."""
-        cpu_indicators = ['cpu', 'processor', 'amd', 'intel']
-        return any(indicator in hw_type_lower for indicator in cpu_indicators)
+        return any(indicator in hw_type_lower for indicator in CPU_TYPE_INDICATORS)
 
     def _is_gpu_hardware(self, hw_type_lower: str) -> bool:
         """Erweiterte GPU-Erkennung für verschiedene Hardware-Typen."""
-        gpu_indicators = ['gpu', 'graphics', 'nvidia', 'amd', 'radeon', 'geforce', 'quadro']
-        return any(indicator in hw_type_lower for indicator in gpu_indicators)
+        return any(indicator in hw_type_lower for indicator in GPU_TYPE_INDICATORS)
 
     def _is_storage_hardware(self, hw_type_lower: str) -> bool:
         """Erweiterte Storage-Erkennung."""
-        storage_indicators = ['storage', 'hdd', 'ssd', 'nvme', 'm2', 'disk']
-        return any(indicator in hw_type_lower for indicator in storage_indicators)
+        return any(indicator in hw_type_lower for indicator in STORAGE_TYPE_INDICATORS)
         
     def _is_motherboard_hardware(self, hw_type_lower: str) -> bool:
         """Prüft, ob es sich um ein Mainboard oder einen relevanten Controller handelt."""
-        return any(indicator in hw_type_lower for indicator in ['motherboard', 'mainboard', 'controller', 'superio'])
+        return any(indicator in hw_type_lower for indicator in MOTHERBOARD_TYPE_INDICATORS)
 
     def _process_motherboard_with_diagnostics(self, mobo_hw):
         """Verarbeitet Mainboard-Hardware, um deren Sensoren für den Explorer verfügbar zu machen."""
-        self.initialization_log.append(f"  Mainboard/Controller-Sensoren werden analysiert: {mobo_hw.Name}")
+        self._log_init("  Mainboard/Controller-Sensoren werden analysiert: %s", mobo_hw.Name)
         
         sensor_count = len(get_available_sensors_for_hardware(mobo_hw))
-        self.initialization_log.append(f"    {sensor_count} Sensoren gefunden (verfügbar im Explorer).")
+        self._log_init("    %d Sensoren gefunden (verfügbar im Explorer).", sensor_count)
 
     def _process_gpu_with_diagnostics(self, gpu_hw):
         """GPU-Verarbeitung mit detaillierter Diagnose."""
-        self.initialization_log.append(f"  GPU-Sensoren suchen für: {gpu_hw.Name}")
-        
-        available_sensors = get_available_sensors_for_hardware(gpu_hw)
-        sensor_types = {}
-        for sensor in available_sensors:
-            sensor_type = sensor['type']
-            if sensor_type not in sensor_types:
-                sensor_types[sensor_type] = 0
-            sensor_types[sensor_type] += 1
-        
-        self.initialization_log.append(f"    Verfügbare Sensor-Typen: {sensor_types}")
-        
-        gpu_sensor_map = {
-            'gpu_core_temp': 'GPU_CORE_TEMP', 'gpu_hotspot_temp': 'GPU_HOTSPOT_TEMP', 
-            'gpu_memory_temp': 'GPU_MEMORY_TEMP', 'core_clock': 'GPU_CORE_CLOCK',
-            'memory_clock': 'GPU_MEMORY_CLOCK', 'power': 'GPU_POWER',
-            'vram_used': 'VRAM_USED', 'vram_total': 'VRAM_TOTAL'
-        }
+        self._log_init("  GPU-Sensoren suchen für: %s", gpu_hw.Name)
+        # Sensor-Statistiken nur bei DEBUG-Logging sammeln
+        verbose = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        if verbose:
+            sensor_types = Counter(str(sensor.SensorType) for sensor in gpu_hw.Sensors)
+            self._log_init("    Verfügbare Sensor-Typen: %s", dict(sensor_types))
         
         temp_gpu_sensors = {}
-        found_sensors = []
+        found_sensors = [] if verbose else None
         failed_sensors = []
+
+        # Alle GPU-Sensoren in einem gemeinsamen Suchlauf über den Hardware-Baum
+        debug_infos = {canonical_name: [] for _, canonical_name in _GPU_SENSOR_MAP} if verbose else {}
+        resolved = self._find_or_discover_sensors(
+            [canonical_name for _, canonical_name in _GPU_SENSOR_MAP], gpu_hw,
+            hw_id=self._ident(gpu_hw),
+            debug_infos=debug_infos
+        )
         
-        for key, canonical_name in gpu_sensor_map.items():
-            debug_info = []
-            sensor = self._find_or_discover_sensor(
-                canonical_name, gpu_hw, 
-                hw_id=str(gpu_hw.Identifier),
-                debug_info=debug_info
-            )
-            
+        for key, canonical_name in _GPU_SENSOR_MAP:
+            sensor = resolved.get(canonical_name)
             if sensor:
                 temp_gpu_sensors[key] = sensor
-                found_sensors.append(f"{key}: {sensor.Name}")
+                if verbose:
+                    found_sensors.append(f"{key}: {sensor.Name}")
             else:
                 failed_sensors.append(key)
-                self.failed_sensors[f"{gpu_hw.Name}_{canonical_name}"] = {'hardware': gpu_hw.Name, 'sensor_type': canonical_name, 'debug_info': debug_info}
+                self.failed_sensors[f"{gpu_hw.Name}_{canonical_name}"] = {
+                    'hardware': gpu_hw.Name, 'hardware_item': gpu_hw,
+                    'sensor_type': canonical_name, 'debug_info': debug_infos.get(canonical_name)
+                }
         
-        self.initialization_log.append(f"    Gefundene Sensoren: {found_sensors}")
+        self._log_init("    Gefundene Sensoren: %s", found_sensors if verbose else list(temp_gpu_sensors))
         if failed_sensors:
-            self.initialization_log.append(f"    Fehlgeschlagene Sensoren: {failed_sensors}")
+            self._log_init("    Fehlgeschlagene Sensoren: %s", failed_sensors)
         
         if temp_gpu_sensors:
             self.gpu_sensors = temp_gpu_sensors
-            self.initialization_log.append(f"  GPU-Sensoren für '{gpu_hw.Name}' aktiviert")
+            self._log_init("  GPU-Sensoren für '%s' aktiviert", gpu_hw.Name)
 
     def _process_storage_with_diagnostics(self, storage_hw):
         """Storage-Verarbeitung mit detaillierter Diagnose."""
@@ -313,35 +471,69 @@ class HardwareManager:
         
         for sensor in storage_hw.Sensors:
             if str(sensor.SensorType) == 'Temperature':
-                unique_key = f"{storage_hw.Name.replace(' ', '_')}_{str(sensor.Identifier)}"
+                unique_key = f"{storage_hw.Name.replace(' ', '_')}_{self._ident(sensor)}"
                 self.storage_sensors[unique_key] = sensor
                 self.storage_display_names[unique_key] = f"{storage_hw.Name} ({sensor.Name})"
                 temp_sensors_found += 1
         
-        self.initialization_log.append(f"  Storage: {storage_hw.Name} - {temp_sensors_found} Temperatur-Sensoren")
+        self._log_init("  Storage: %s - %d Temperatur-Sensoren", storage_hw.Name, temp_sensors_found)
 
     def _find_or_discover_sensor(self, canonical_name, hardware_item, hw_id=None, debug_info=None):
         """Verbesserte Sensor-Suche mit Cache und Fallback."""
-        if debug_info is None:
-            debug_info = []
-            
-        cache_key = f"{hw_id}_{canonical_name}" if hw_id else canonical_name
-        
+        debug_infos = {canonical_name: debug_info} if debug_info is not None else None
+        return self._find_or_discover_sensors(
+            (canonical_name,), hardware_item, hw_id=hw_id, debug_infos=debug_infos
+        ).get(canonical_name)
+
+    def _find_or_discover_sensors(self, canonical_names, hardware_item, hw_id=None, debug_infos=None):
+        """Sensor-Suche für mehrere kanonische Namen: erst der Cache, dann ein gemeinsamer Suchlauf."""
+        # Ohne Debug-Sammlung (kein Eintrag in debug_infos) darf resolve_all seinen Such-Cache nutzen
+        if debug_infos is None:
+            debug_infos = {}
+
+        found = {}
+        missing = []
+        for canonical_name in canonical_names:
+            debug_info = debug_infos.get(canonical_name, _NULL_DEBUG_INFO)
+            cache_key = f"{hw_id}_{canonical_name}" if hw_id else canonical_name
+            sensor = self._cached_sensor(cache_key, hardware_item, debug_info)
+            if sensor is not None:
+                found[canonical_name] = sensor
+            else:
+                missing.append(canonical_name)
+
+        if not missing:
+            return found
+
+        resolved = resolve_all(hardware_item, missing, debug_infos)
+        for canonical_name in missing:
+            sensor = resolved.get(canonical_name)
+            if sensor is None:
+                continue
+            cache_key = f"{hw_id}_{canonical_name}" if hw_id else canonical_name
+            sensor_id = self._ident(sensor)
+            if self.sensor_cache.get(cache_key) != sensor_id:
+                self.sensor_cache[cache_key] = sensor_id
+                self._dirty_entries += 1
+            debug_infos.get(canonical_name, _NULL_DEBUG_INFO).append("In Cache gespeichert")
+            found[canonical_name] = sensor
+        return found
+
+    def _cached_sensor(self, cache_key, hardware_item, debug_info):
+        """Liefert den im Sensor-Cache hinterlegten Sensor, sofern er noch zur Hardware gehört."""
         if cached_id := self.sensor_cache.get(cache_key):
+            hit = self._sensor_by_id.get(cached_id)
+            if hit is not None and (
+                hit[0] is hardware_item or self._ident(hit[0]) == self._ident(hardware_item)
+            ):
+                debug_info.append(f"Aus Cache gefunden: {hit[1].Name}")
+                return hit[1]
+            # Index veraltet (z. B. nach einer Aktualisierung): direkt in der Hardware suchen
             for sensor in hardware_item.Sensors:
-                if str(sensor.Identifier) == cached_id:
+                if self._ident(sensor) == cached_id:
                     debug_info.append(f"Aus Cache gefunden: {sensor.Name}")
                     return sensor
             debug_info.append(f"Cache-Eintrag ungültig, führe neue Suche durch")
-        
-        sensor = find_sensor(canonical_name, hardware_item, debug_info)
-        
-        if sensor:
-            self.sensor_cache[cache_key] = str(sensor.Identifier)
-            self.cache_updated = True
-            debug_info.append("In Cache gespeichert")
-            return sensor
-        
         return None
     
     # NEUE METHODE
@@ -359,7 +551,7 @@ class HardwareManager:
                 self.cpu_sensor = None
                 return selected_cpu_id
         else:
-            target_cpu = next((cpu for cpu in self.cpus if str(cpu.Identifier) == selected_cpu_id), None)
+            target_cpu = self._cpu_by_id.get(selected_cpu_id)
 
         if not target_cpu and selected_cpu_id != "auto" and self.cpus:
             logging.warning(f"CPU mit ID '{selected_cpu_id}' nicht gefunden. Fallback auf automatische Auswahl.")
@@ -371,10 +563,10 @@ class HardwareManager:
             return selected_cpu_id
 
         logging.info(f"Lade Temperatursensor für ausgewählte CPU: {target_cpu.Name}")
-        debug_info = []
+        debug_info = _new_debug_info()
         self.cpu_sensor = self._find_or_discover_sensor(
             'CPU_PACKAGE_TEMP', target_cpu,
-            hw_id=str(target_cpu.Identifier),
+            hw_id=self._ident(target_cpu),
             debug_info=debug_info
         )
 
@@ -382,12 +574,14 @@ class HardwareManager:
             logging.info(f"Aktiver CPU-Temperatursensor gesetzt auf: {self.cpu_sensor.Name}")
         else:
             logging.warning(f"Konnte keinen Temperatur-Sensor für CPU '{target_cpu.Name}' finden.")
-            self.failed_sensors['CPU_PACKAGE_TEMP'] = {'hardware': target_cpu.Name, 'debug_info': debug_info}
+            self.failed_sensors['CPU_PACKAGE_TEMP'] = {
+                'hardware': target_cpu.Name, 'hardware_item': target_cpu,
+                'sensor_type': 'CPU_PACKAGE_TEMP', 'debug_info': debug_info
+            }
 
-        if self.cache_updated:
-            save_sensor_cache(self.sensor_cache)
+        self._save_sensor_cache_if_dirty()
 
-        return str(target_cpu.Identifier)
+        return self._ident(target_cpu)
 
     def update_selected_gpu_sensors(self, selected_gpu_id: str) -> str:
         """Aktualisiert die aktiven GPU-Sensoren für eine spezifische GPU."""
@@ -403,7 +597,7 @@ class HardwareManager:
                 logging.warning("Automatische GPU-Auswahl fehlgeschlagen: Keine GPUs gefunden.")
                 return selected_gpu_id
         else:
-            target_gpu = next((gpu for gpu in self.gpus if str(gpu.Identifier) == selected_gpu_id), None)
+            target_gpu = self._gpu_by_id.get(selected_gpu_id)
 
         if not target_gpu and selected_gpu_id != "auto" and self.gpus:
             logging.warning(f"GPU mit ID '{selected_gpu_id}' nicht gefunden. Fallback auf automatische Auswahl.")
@@ -416,10 +610,9 @@ class HardwareManager:
         logging.info(f"Lade Sensoren für ausgewählte GPU: {target_gpu.Name}")
         self._process_gpu_with_diagnostics(target_gpu)
         
-        if self.cache_updated:
-            save_sensor_cache(self.sensor_cache)
+        self._save_sensor_cache_if_dirty()
             
-        return str(target_gpu.Identifier)
+        return self._ident(target_gpu)
 
     def apply_hardware_selection(self, selected_cpu_id: str, selected_gpu_id: str) -> HardwareSelectionState:
         """Aktiviert CPU- und GPU-Auswahl in einem konsistenten Schritt."""
@@ -430,6 +623,16 @@ class HardwareManager:
             gpu_identifier=resolved_gpu_id,
         )
 
+    def _save_sensor_cache_if_dirty(self):
+        """Schreibt den Sensor-Cache nur, wenn sich Einträge geändert haben."""
+        if self._dirty_entries:
+            save_sensor_cache(self.sensor_cache)
+            self._dirty_entries = 0
+
+    def discard_sensor_cache_changes(self):
+        """Verwirft ausstehende Cache-Änderungen, ohne sie zu speichern."""
+        self._dirty_entries = 0
+
     def _set_operation_result(self, success: bool, message: str, **details: Any) -> HardwareOperationResult:
         """Speichert das Ergebnis der letzten Hardware-Lifecycle-Operation."""
         self.last_operation_result = HardwareOperationResult(
@@ -447,6 +650,11 @@ class HardwareManager:
         self.gpu_sensors.clear()
         self.storage_sensors.clear()
         self.storage_display_names.clear()
+        self._sensor_by_id.clear()
+        self._hw_by_name.clear()
+        self._cpu_by_id.clear()
+        self._gpu_by_id.clear()
+        self._last_update.clear()
         self.initialization_log.clear()
         self.failed_sensors.clear()
         self.hardware_detected.clear()
@@ -473,69 +681,91 @@ class HardwareManager:
             
         logging.info("=" * 60)
 
-    def _add_hardware_to_report_recursively(self, hw, parts_list, indent_level=0):
+    def _snapshot_sensor(self, sensor) -> Tuple[str, str, str, Any]:
+        """Liest Typ, Name, Identifier und Wert eines Sensors in einem Schritt aus."""
+        return str(sensor.SensorType), sensor.Name, self._ident(sensor), sensor.Value
+
+    def _add_hardware_to_report_recursively(self, hw, buf: io.StringIO, indent_level=0, visited=None):
         """Hilfsfunktion, die rekursiv Hardware und Sub-Hardware zum Diagnosebericht hinzufügt."""
+        if visited is None:
+            visited = set()
+        hw_id = self._ident(hw)
+        # Über mehrere Wege erreichbare oder zyklisch verknüpfte Sub-Hardware nur einmal ausgeben
+        if hw_id in visited or indent_level > self.MAX_REPORT_DEPTH:
+            return
+        visited.add(hw_id)
+
         indent = "  " * indent_level
-        hw.Update()
-        parts_list.append(f"\n{indent}=== {hw.Name} ({hw.HardwareType}) ===")
-        parts_list.append(f"{indent}Identifier: {hw.Identifier}")
-        
-        sensors_by_type = {}
-        for sensor in hw.Sensors:
-            sensor_type = str(sensor.SensorType)
-            if sensor_type not in sensors_by_type:
-                sensors_by_type[sensor_type] = []
-            
-            value_str = f"{sensor.Value:.2f}" if sensor.Value is not None else "N/A"
-            sensors_by_type[sensor_type].append({'name': sensor.Name, 'value': value_str, 'id': str(sensor.Identifier)})
-        
-        for sensor_type, sensors in sensors_by_type.items():
-            parts_list.append(f"\n{indent}{sensor_type} ({len(sensors)}):")
-            for sensor in sensors:
-                parts_list.append(f"{indent}  - {sensor['name']}: {sensor['value']} | ID: {sensor['id']}")
-        
+        self._maybe_update(hw)
+        buf.write(f"\n{indent}=== {hw.Name} ({hw.HardwareType}) ===\n")
+        buf.write(f"{indent}Identifier: {hw_id}\n")
+
+        # Sensordaten einmal aus den CLR-Objekten lesen, danach nur noch mit Python-Tupeln arbeiten
+        snapshot = [self._snapshot_sensor(sensor) for sensor in hw.Sensors]
+
+        sensors_by_type = defaultdict(list)
+        for sensor_type, name, sensor_id, value in snapshot:
+            value_str = "N/A" if value is None else format(value, ".2f")
+            sensors_by_type[sensor_type].append(f"{indent}  - {name}: {value_str} | ID: {sensor_id}\n")
+
+        for sensor_type, lines in sensors_by_type.items():
+            buf.write(f"\n{indent}{sensor_type} ({len(lines)}):\n")
+            buf.writelines(lines)
+
         # Rekursiver Aufruf für Sub-Hardware
         for sub_hw in hw.SubHardware:
-            self._add_hardware_to_report_recursively(sub_hw, parts_list, indent_level + 1)
+            self._add_hardware_to_report_recursively(sub_hw, buf, indent_level + 1, visited)
+
+    @staticmethod
+    def _failed_sensor_debug_info(info: Dict[str, Any]) -> List[str]:
+        """Liefert die Such-Details eines fehlgeschlagenen Sensors, bei Bedarf durch erneute Suche."""
+        debug_info = info.get('debug_info')
+        if debug_info is None and info.get('hardware_item') is not None:
+            # Ohne DEBUG-Logging wurde bei der Initialisierung nichts gesammelt
+            debug_info = []
+            find_sensor(info['sensor_type'], info['hardware_item'], debug_info)
+            info['debug_info'] = debug_info
+        return debug_info or []
 
     def run_sensor_diagnosis(self) -> str:
         """Umfassende Sensor-Diagnose mit detaillierten Informationen, jetzt rekursiv."""
         if not self.computer:
             return "LibreHardwareMonitor ist nicht initialisiert."
         
-        diagnosis_parts = [
-            "=== ERWEITERTE SENSOR-DIAGNOSE ===",
-            f"Hardware-Fingerprint: {self.hardware_fingerprint[:50]}...",
-            f"Cache-Einträge: {len(self.sensor_cache)}", ""
-        ]
-        
+        buf = io.StringIO()
+        buf.write("=== ERWEITERTE SENSOR-DIAGNOSE ===\n")
+        buf.write(f"Hardware-Fingerprint: {self.hardware_fingerprint}\n")
+        buf.write(f"Cache-Einträge: {len(self.sensor_cache)}\n\n")
+
         if self.initialization_log:
-            diagnosis_parts.append("=== INITIALISIERUNGS-LOG ===")
-            diagnosis_parts.extend(self.initialization_log)
-            diagnosis_parts.append("")
-        
+            buf.write("=== INITIALISIERUNGS-LOG ===\n")
+            buf.writelines(fmt % tuple(args) + "\n" for fmt, *args in self.initialization_log)
+            buf.write("\n")
+
         if self.failed_sensors:
-            diagnosis_parts.append("=== FEHLGESCHLAGENE SENSOREN ===")
+            buf.write("=== FEHLGESCHLAGENE SENSOREN ===\n")
             for sensor_key, info in self.failed_sensors.items():
-                diagnosis_parts.append(f"Sensor: {sensor_key}")
-                diagnosis_parts.append(f"Hardware: {info['hardware']}")
-                if 'debug_info' in info and info['debug_info']:
-                    diagnosis_parts.append("Debug-Informationen:")
-                    for debug_line in info['debug_info']:
-                        diagnosis_parts.append(f"  {debug_line}")
-                diagnosis_parts.append("")
-        
-        diagnosis_parts.append("=== VOLLSTÄNDIGE HARDWARE-ÜBERSICHT ===")
+                buf.write(f"Sensor: {sensor_key}\n")
+                buf.write(f"Hardware: {info['hardware']}\n")
+                debug_lines = self._failed_sensor_debug_info(info)
+                if debug_lines:
+                    buf.write("Debug-Informationen:\n")
+                    buf.writelines(f"  {debug_line}\n" for debug_line in debug_lines)
+                buf.write("\n")
+
+        buf.write("=== VOLLSTÄNDIGE HARDWARE-ÜBERSICHT ===\n")
+        visited = set()
         for hw in self.computer.Hardware:
-            self._add_hardware_to_report_recursively(hw, diagnosis_parts)
+            self._add_hardware_to_report_recursively(hw, buf, visited=visited)
 
-        diagnosis_parts.append("\n\n=== CACHE-INFORMATIONEN ===")
+        buf.write("\n\n=== CACHE-INFORMATIONEN ===\n")
         for key, value in self.sensor_cache.items():
             if not key.startswith('_'):
-                diagnosis_parts.append(f"{key}: {value}")
-        
-        return "\n".join(diagnosis_parts)
+                buf.write(f"{key}: {value}\n")
+
+        return buf.getvalue().removesuffix("\n")
 
+    @_ttl_cached(DEVICE_LIST_TTL_S)
     def get_available_disks(self) -> list[str]:
         if not PSUTIL_AVAILABLE: 
             return []
@@ -545,6 +775,7 @@ class HardwareManager:
             logging.error(f"Fehler beim Abrufen verfügbarer Festplatten: {e}")
             return []
 
+    @_ttl_cached(DEVICE_LIST_TTL_S)
     def get_available_network_interfaces(self) -> list[str]:
         if not PSUTIL_AVAILABLE: 
             return ["all"]
@@ -554,6 +785,7 @@ class HardwareManager:
             logging.error(f"Fehler beim Abrufen verfügbarer Netzwerk-Interfaces: {e}")
             return ["all"]
 
+    @_ttl_cached(DEVICE_LIST_TTL_S)
     def get_available_disk_partitions(self) -> list[str]:
         if not PSUTIL_AVAILABLE: 
             return []
@@ -577,28 +809,29 @@ class HardwareManager:
         if not self.computer:
             return {}
             
-        for hw in self.computer.Hardware:
-            if hw.Name == hardware_name:
-                hw.Update()
-                return {
-                    'hardware_name': hw.Name,
-                    'hardware_type': str(hw.HardwareType),
-                    'identifier': str(hw.Identifier),
-                    'sensors': get_available_sensors_for_hardware(hw),
-                    'sensor_count': len(list(hw.Sensors))
-                }
-        return {}
+        hw = self._hw_by_name.get(hardware_name)
+        if hw is None:
+            return {}
+
+        self._maybe_update(hw)
+        sensors = get_available_sensors_for_hardware(hw)
+        return {
+            'hardware_name': hw.Name,
+            'hardware_type': str(hw.HardwareType),
+            'identifier': self._ident(hw),
+            'sensors': sensors,
+            'sensor_count': len(sensors)
+        }
 
     def test_sensor_recognition(self, canonical_name: str, hardware_name: str) -> str:
         """Testet die Sensor-Erkennung für spezifische Hardware."""
         if not self.computer:
             return "LibreHardwareMonitor nicht verfügbar"
             
-        for hw in self.computer.Hardware:
-            if hw.Name == hardware_name:
-                return diagnose_sensor_matching(canonical_name, hw)
-                
-        return f"Hardware '{hardware_name}' nicht gefunden"
+        hw = self._hw_by_name.get(hardware_name)
+        if hw is None:
+            return f"Hardware '{hardware_name}' nicht gefunden"
+        return diagnose_sensor_matching(canonical_name, hw)
 
     def redetect_hardware(self, reset_cache: bool = False) -> HardwareOperationResult:
         """FÃ¼hrt eine neue Hardware-Erkennung aus und liefert ein strukturiertes Ergebnis."""
@@ -611,18 +844,19 @@ class HardwareManager:
             if reset_cache:
                 old_fingerprint = self.sensor_cache.get('_hardware_fingerprint', '')
                 self.sensor_cache = {'_hardware_fingerprint': old_fingerprint}
-                self.cache_updated = False
+                self._dirty_entries = 1
                 logging.info("Sensor-Cache wird zurÃ¼ckgesetzt und Hardware neu erkannt.")
             else:
                 logging.info("Aktualisiere Hardware- und Sensor-Erkennung...")
 
             self._clear_detected_state()
+            self._id_cache.clear()
+            self._ttl_cache.clear()
+            invalidate_sensor_search_cache()
             self._detect_hardware_with_diagnostics()
             self._restore_selected_sensors()
 
-            if reset_cache or self.cache_updated:
-                save_sensor_cache(self.sensor_cache)
-                self.cache_updated = False
+            self._save_sensor_cache_if_dirty()
 
             self._log_final_status()
             message = (
@@ -659,15 +893,60 @@ class HardwareManager:
             return None
         
         try:
-            for hw in self.computer.Hardware:
-                hw.Update()
-                for sensor in hw.Sensors:
-                    if str(sensor.Identifier) == identifier:
-                        if hasattr(sensor, 'Value') and sensor.Value is not None:
-                            return float(sensor.Value)
-                        else:
-                            return None
+            entry = self._sensor_by_id.get(identifier)
+            if entry is None:
+                # Sensor erst nach der Erkennung aufgetaucht: einmalig suchen und indizieren
+                for hw in self.computer.Hardware:
+                    self._maybe_update(hw)
+                    self._index_sensors(hw)
+                entry = self._sensor_by_id.get(identifier)
+                if entry is None:
+                    self._warn_if_subsystem_disabled(identifier)
+                    return None
+            else:
+                self._maybe_update(entry[0])
+
+            sensor = entry[1]
+            if hasattr(sensor, 'Value') and sensor.Value is not None:
+                return float(sensor.Value)
             return None
         except Exception as e:
             logging.error(f"Fehler beim Testen des Custom Sensors '{identifier}': {e}")
             return None
+
+    def _warn_if_subsystem_disabled(self, identifier: str):
+        """Warnt einmal je Identifier, wenn dessen LHM-Subsystem nicht geöffnet wurde."""
+        subsystem = lhm_subsystem_for_identifier(identifier)
+        if subsystem is None or self.subsystems.get(subsystem) or identifier in self._disabled_subsystem_warnings:
+            return
+        self._disabled_subsystem_warnings.add(identifier)
+        logging.warning(
+            "Custom-Sensor '%s' gehört zum deaktivierten LHM-Subsystem '%s' und liefert erst nach "
+            "einem Neustart der Anwendung Werte.", identifier, subsystem
+        )
+
+    def read_many(self, identifiers: List[str]) -> Dict[str, float]:
+        """Liest mehrere Sensoren und aktualisiert dabei jede betroffene Hardware nur einmal."""
+        if not self.computer:
+            return {}
+
+        sensors_by_hw: Dict[int, Tuple[Any, List[Tuple[str, Any]]]] = {}
+        for identifier in identifiers:
+            entry = self._sensor_by_id.get(identifier)
+            if entry is None:
+                self._warn_if_subsystem_disabled(identifier)
+                continue
+            hw, sensor = entry
+            sensors_by_hw.setdefault(id(hw), (hw, []))[1].append((identifier, sensor))
+
+        values: Dict[str, float] = {}
+        for hw, sensors in sensors_by_hw.values():
+            try:
+                self._maybe_update(hw)
+                for identifier, sensor in sensors:
+                    value = sensor.Value
+                    if value is not None:
+                        values[identifier] = float(value)
+            except Exception as e:
+                logging.error(f"Fehler beim Lesen der Sensoren von '{hw.Name}': {e}")
+        return values
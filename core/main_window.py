@@ -6,11 +6,12 @@ import logging
 import subprocess
 from typing import Callable, Dict, Any, Optional, TYPE_CHECKING, TypeVar
 
-from PySide6.QtCore import QThread, QTimer, Slot
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QMainWindow,
     QApplication,
     QMessageBox,
+    QProgressDialog,
     QWidget,
     QLabel,
     QPushButton,
@@ -33,11 +34,55 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+class _DatabaseRecreateSignals(QObject):
+    """Signalträger für _DatabaseRecreateJob, da QRunnable kein QObject ist."""
+    finished = Signal(bool)
+
+
+class _DatabaseRecreateJob(QRunnable):
+    """Erstellt die Monitoring-Datenbank in einem Pool-Thread neu."""
+
+    def __init__(self, history_manager):
+        super().__init__()
+        self.history_manager = history_manager
+        # Im GUI-Thread erzeugt, daher landet finished per Queued-Verbindung wieder dort
+        self.signals = _DatabaseRecreateSignals()
+
+    def run(self):
+        try:
+            success = self.history_manager.recreate_database()
+        except Exception:
+            logging.exception("Fehler beim Neuerstellen der Monitoring-Datenbank.")
+            success = False
+        self.signals.finished.emit(success)
+
+
+def _quantize_value(value: Any) -> Any:
+    """Rundet Messwerte auf Anzeigegenauigkeit, damit unsichtbare Schwankungen den Fingerprint nicht ändern."""
+    if isinstance(value, float):
+        return round(value, 1)
+    if isinstance(value, (tuple, list)):
+        return tuple(_quantize_value(item) for item in value)
+    if isinstance(value, dict):
+        # z. B. custom_sensors und die Einträge von storage_temps
+        return tuple(sorted((key, _quantize_value(item)) for key, item in value.items()))
+    return value
+
+
+def _data_fingerprint(data: Dict[str, Any]) -> Optional[int]:
+    """Liefert einen Hash der quantisierten Daten oder None, wenn Werte nicht hashbar sind."""
+    try:
+        return hash(tuple(sorted((key, _quantize_value(value)) for key, value in data.items())))
+    except TypeError:
+        return None
+
+
 class SystemMonitor(QMainWindow):
     """
     Hauptfenster-Klasse, die als Orchestrator für die UI und den Worker-Thread dient.
     Erhält alle Abhängigkeiten über den AppContext.
     """
+    DB_RECREATE_TIMEOUT_MS = 5000
     THREAD_TERMINATION_TIMEOUT_MS = 5000
 
     def __init__(self, context: AppContext):
@@ -49,6 +94,7 @@ class SystemMonitor(QMainWindow):
         self.history_manager = context.history_manager
         
         self.last_data: Dict[str, Any] = {}
+        self._last_data_hash: Optional[int] = None
         self.latest_health_report: Dict[str, Any] = {}
         self.thread: Optional[QThread] = None
         self.worker: Optional[HardwareMonitorWorker] = None
@@ -58,6 +104,12 @@ class SystemMonitor(QMainWindow):
         self._no_tray_toggle_button: Optional[QPushButton] = None
         self._no_tray_help_button: Optional[QPushButton] = None
         self._no_tray_exit_button: Optional[QPushButton] = None
+        self._db_recreate_progress: Optional[QProgressDialog] = None
+        self._db_recreate_signals: Optional[_DatabaseRecreateSignals] = None
+        # Statische Texte der Tray-Meldungen; bei Sprachwechsel neu befüllt
+        self._tr_memory_title = ""
+        self._tr_lhm_error_title = ""
+        self._refresh_cached_translations()
 
         logging.info("=== SystemMonitor UI wird initialisiert ===")
 
@@ -69,9 +121,8 @@ class SystemMonitor(QMainWindow):
             self._setup_no_tray_fallback_window()
 
         # Signale verbinden
-        self.context.data_handler.metric_updated.connect(self.detachable_manager.update_widget_display)
+        self.context.data_handler.metrics_updated.connect(self.detachable_manager.update_widgets_display)
         self.context.data_handler.alarm_state_changed.connect(self.tray_icon_manager.update_alarm_state)
-        self.settings_manager.setting_changed.connect(self.on_setting_changed)
         self.context.language_changed.connect(self.refresh_language_ui)
         self.history_manager.database_corrupt.connect(self.handle_corrupt_database) # NEU
         self._schedule_startup_actions()
@@ -99,19 +150,60 @@ class SystemMonitor(QMainWindow):
         msg_box.setDefaultButton(QMessageBox.StandardButton.Yes)
         
         if msg_box.exec() == QMessageBox.StandardButton.Yes:
-            if self.history_manager.recreate_database():
-                QMessageBox.information(self, self.translator.translate("dlg_db_recreated_title"),
-                                        self.translator.translate("dlg_db_recreated_text"))
-            else:
-                QMessageBox.critical(self, self.translator.translate("shared_error_title"),
-                                     self.translator.translate("dlg_db_recreate_failed_text"))
+            self._start_database_recreation()
+
+    def _start_database_recreation(self):
+        """Erstellt die Datenbank im Hintergrund neu und zeigt währenddessen einen Busy-Dialog."""
+        if self._db_recreate_signals is not None:
+            return
+
+        progress = QProgressDialog(self.translator.translate("dlg_db_recreating_text"), "", 0, 0, self)
+        progress.setWindowTitle(self.translator.translate("dlg_db_corrupt_title"))
+        progress.setCancelButton(None)
+        progress.setMinimumDuration(0)
+        progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+        progress.show()
+        self._db_recreate_progress = progress
+
+        job = _DatabaseRecreateJob(self.history_manager)
+        # Referenz halten, bis das Ergebnis eingetroffen ist
+        self._db_recreate_signals = job.signals
+        job.signals.finished.connect(self._on_database_recreated, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(job)
+
+    @Slot(bool)
+    def _on_database_recreated(self, success: bool):
+        """Schließt den Busy-Dialog und meldet das Ergebnis im GUI-Thread."""
+        self._db_recreate_signals = None
+        if self._db_recreate_progress is not None:
+            self._db_recreate_progress.close()
+            self._db_recreate_progress.deleteLater()
+            self._db_recreate_progress = None
+
+        if success:
+            QMessageBox.information(self, self.translator.translate("dlg_db_recreated_title"),
+                                    self.translator.translate("dlg_db_recreated_text"))
+        else:
+            QMessageBox.critical(self, self.translator.translate("shared_error_title"),
+                                 self.translator.translate("dlg_db_recreate_failed_text"))
+
+    def invalidate_delivered_data(self):
+        """Erzwingt, dass der nächste Tick trotz unveränderter Daten wieder alle Metriken ausliefert."""
+        self._last_data_hash = None
+        self.context.data_handler.invalidate_delivered_state()
 
     @Slot(dict)
     def on_data_updated(self, data: dict):
         """Empfängt Daten vom Worker, speichert sie und leitet sie weiter."""
         self.last_data = data
         self.context.set_latest_monitor_data(data)
-        self.context.data_handler.process_new_data(data)
+        # Unveränderter Tick (Sensoren aktualisieren langsamer als das Abfrageintervall): nichts ausliefern
+        data_hash = _data_fingerprint(data)
+        if data_hash is not None and data_hash == self._last_data_hash:
+            return
+        self._last_data_hash = data_hash
+        # Regulärer Tick: nur geänderte Metriken an die Widgets ausliefern
+        self.context.data_handler.process_new_data(data, changed_only=True)
 
     @Slot(dict)
     def on_health_report_updated(self, report: dict):
@@ -121,18 +213,16 @@ class SystemMonitor(QMainWindow):
     def get_latest_health_report(self) -> Dict[str, Any]:
         return deepcopy(self.latest_health_report)
         
-    def on_setting_changed(self, key: str, value: Any):
-        """Reagiert auf globale Einstellungsänderungen."""
-        if key == SettingsKey.UPDATE_INTERVAL_MS.value:
-            self.restart_worker_thread()
-            return
-
-        if self.worker:
-            self.worker.queue_setting_update(key, value)
+    def _refresh_cached_translations(self):
+        """Übersetzt die statischen Titel der Tray-Meldungen in der aktuellen Sprache."""
+        self._tr_memory_title = self.translator.translate("tray_warning_memory_title")
+        self._tr_lhm_error_title = self.translator.translate("lhm_error_title")
 
     @Slot(str)
     def refresh_language_ui(self, _language_name: str = ""):
         """Aktualisiert alle UI-Komponenten nach einem Sprachwechsel."""
+        self._refresh_cached_translations()
+        self.context.data_handler.refresh_language()
         self.ui_manager.refresh_metric_definitions()
         self.tray_icon_manager.refresh_language()
         self.action_handler.refresh_open_windows_for_language_change()
@@ -214,6 +304,8 @@ class SystemMonitor(QMainWindow):
         self.worker.health_report_updated.connect(self.on_health_report_updated)
         self.worker.sensor_error.connect(self.handle_sensor_error)
         self.worker.memory_warning.connect(self.handle_memory_warning)
+        # Qt stellt Änderungen in die Event-Loop des Worker-Threads zu; keine Sperren nötig
+        self.settings_manager.setting_changed.connect(self.worker.update_setting, Qt.ConnectionType.QueuedConnection)
 
         self.thread.start()
         logging.info(f"Worker-Thread gestartet (Intervall: {interval}ms)")
@@ -248,6 +340,11 @@ class SystemMonitor(QMainWindow):
         """Stoppt den Worker-Thread sicher."""
         if not self.thread or not self.worker: return
         
+        try:
+            self.settings_manager.setting_changed.disconnect(self.worker.update_setting)
+        except (RuntimeError, TypeError):
+            pass
+
         try:
             self.worker.stop()
             self.thread.quit()
@@ -262,9 +359,8 @@ class SystemMonitor(QMainWindow):
 
     def handle_sensor_error(self, sensor_type: str, message: str):
         """Zeigt eine Sensor-Fehlermeldung im Tray an."""
-        title = self.translator.translate("lhm_error_title")
         self.tray_icon_manager.show_message(
-            title,
+            self._tr_lhm_error_title,
             message,
             self.tray_icon_manager.tray_icon.MessageIcon.Warning,
             5000,
@@ -281,13 +377,13 @@ class SystemMonitor(QMainWindow):
         details = self.translator.translate("tray_warning_memory_details", mem_mb=f"{current_memory_mb:.1f}")
         full_message = f"{warning_message}\n{details}"
         
-        logging.warning(f"{self.translator.translate('tray_warning_memory_title')}: {full_message}")
+        logging.warning(f"{self._tr_memory_title}: {full_message}")
         
         if not self.settings_manager.get_setting(SettingsKey.PERF_SHOW_WARNINGS.value, True):
             return
 
         self.tray_icon_manager.show_message(
-            self.translator.translate("tray_warning_memory_title"), 
+            self._tr_memory_title,
             full_message,
             self.tray_icon_manager.tray_icon.MessageIcon.Critical, 10000
         )
@@ -314,7 +410,20 @@ class SystemMonitor(QMainWindow):
 
         self._stop_worker_thread()
 
+        try:
+            self.context.data_handler.shutdown()
+        except Exception:
+            logging.exception("Fehler beim Beenden des DataHandler-Threads.")
+
+        try:
+            self.settings_manager.flush_pending_save()
+        except Exception:
+            logging.exception("Fehler beim Speichern ausstehender Einstellungen.")
+
         if hasattr(self, "history_manager"):
+            if self._db_recreate_signals is not None:
+                # Laufende Neuerstellung abwarten, bevor die Verbindung geschlossen wird
+                QThreadPool.globalInstance().waitForDone(self.DB_RECREATE_TIMEOUT_MS)
             try:
                 self.history_manager.shutdown()
             except Exception:
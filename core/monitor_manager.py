@@ -9,7 +9,7 @@ from PySide6.QtGui import QScreen
 from PySide6.QtWidgets import QApplication
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MonitorInfo:
     """Informationen über einen Monitor."""
     name: str
@@ -37,6 +37,12 @@ class MonitorManager:
     def __init__(self):
         self.monitors: Dict[str, MonitorInfo] = {}
         self.primary_monitor: Optional[str] = None
+        # (Name, links, oben, rechts, unten) je Monitor; Grenzen inklusive wie bei QRect.contains
+        self._monitor_bounds: List[Tuple[str, int, int, int, int]] = []
+        # Name -> (links, oben, rechts, unten) der verfügbaren Fläche (ohne Taskbar)
+        self._available_bounds: Dict[str, Tuple[int, int, int, int]] = {}
+        # (Name, x, y) des Monitor-Zentrums für die Suche nach dem nächstgelegenen Monitor
+        self._monitor_centers: List[Tuple[str, int, int]] = []
         self.update_monitor_info()
         
     def update_monitor_info(self) -> bool:
@@ -45,6 +51,9 @@ class MonitorManager:
         """
         old_monitors = self.monitors
         self.monitors = {}
+        self._monitor_bounds = []
+        self._available_bounds = {}
+        self._monitor_centers = []
         
         try:
             app = QApplication.instance()
@@ -71,6 +80,22 @@ class MonitorManager:
                 self.monitors[monitor_name] = monitor_info
                 if monitor_info.is_primary:
                     self.primary_monitor = monitor_name
+
+            self._monitor_bounds = [
+                (name, info.geometry.left(), info.geometry.top(), info.geometry.right(), info.geometry.bottom())
+                for name, info in self.monitors.items()
+            ]
+            self._available_bounds = {
+                name: (
+                    info.available_geometry.left(), info.available_geometry.top(),
+                    info.available_geometry.right(), info.available_geometry.bottom(),
+                )
+                for name, info in self.monitors.items()
+            }
+            self._monitor_centers = [
+                (name, center.x(), center.y())
+                for name, center in ((name, info.geometry.center()) for name, info in self.monitors.items())
+            ]
             
             # Prüfe auf relevante Änderungen in Anzahl, Namen oder Geometrie
             configuration_changed = (
@@ -108,8 +133,12 @@ class MonitorManager:
 
     def get_monitor_at_position(self, position: QPoint) -> Optional[str]:
         """Findet den Namen des Monitors an der angegebenen Position."""
-        for name, monitor in self.monitors.items():
-            if monitor.geometry.contains(position):
+        return self._monitor_name_at(position.x(), position.y())
+
+    def _monitor_name_at(self, x: int, y: int) -> Optional[str]:
+        """Sucht über die vorberechneten Monitorgrenzen, ohne QRect-Aufrufe pro Monitor."""
+        for name, left, top, right, bottom in self._monitor_bounds:
+            if left <= x <= right and top <= y <= bottom:
                 return name
         return None
     
@@ -122,12 +151,11 @@ class MonitorManager:
         
         if target_monitor_name:
             if size:
-                window_rect = QRect(position, size)
-                monitor_rect = self.monitors[target_monitor_name].available_geometry
-                if monitor_rect.contains(window_rect):
+                monitor = self.monitors[target_monitor_name]
+                if monitor.available_geometry.contains(QRect(position, size)):
                     return PositionValidationResult(True, position, target_monitor_name, "Position ist vollständig sichtbar")
                 
-                corrected_pos = self._clamp_to_monitor(position, size, target_monitor_name)
+                corrected_pos = self._clamp_to_monitor(position, size, monitor)
                 return PositionValidationResult(False, corrected_pos, target_monitor_name, "Position korrigiert, um auf Monitor zu passen")
             return PositionValidationResult(True, position, target_monitor_name, "Position ist auf Monitor sichtbar")
         
@@ -171,12 +199,35 @@ class MonitorManager:
         return QPoint(max(available.x(), final_x), max(available.y(), final_y))
     
     def repair_invalid_positions(self, positions: Dict[str, QPoint], sizes: Optional[Dict[str, QSize]] = None) -> Dict[str, QPoint]:
-        """Repariert eine Liste von Positionen, die außerhalb sichtbarer Bereiche liegen."""
+        """
+        Repariert eine Liste von Positionen, die außerhalb sichtbarer Bereiche liegen.
+        Alle Widgets werden in einem Durchlauf über die vorberechneten Monitorgrenzen geprüft;
+        nur Positionen außerhalb aller Monitore laufen über die allgemeine Validierung.
+        """
         corrected_positions = {}
         sizes = sizes or {}
+        default_size = QSize(200, 50)
+        available_bounds = self._available_bounds
         
         for widget_name, position in positions.items():
-            widget_size = sizes.get(widget_name, QSize(200, 50))
+            widget_size = sizes.get(widget_name, default_size)
+            x, y = position.x(), position.y()
+            monitor_name = self._monitor_name_at(x, y)
+            if monitor_name is not None:
+                left, top, right, bottom = available_bounds[monitor_name]
+                width, height = widget_size.width(), widget_size.height()
+                # Entspricht available_geometry.contains(QRect(position, size))
+                if left <= x and top <= y and x + width - 1 <= right and y + height - 1 <= bottom:
+                    corrected_positions[widget_name] = position
+                    continue
+                corrected_pos = QPoint(
+                    max(left, min(x, right - width)),
+                    max(top, min(y, bottom - height)),
+                )
+                corrected_positions[widget_name] = corrected_pos
+                logging.info(f"Position für '{widget_name}' korrigiert: {position} -> {corrected_pos}")
+                continue
+
             validation_result = self.validate_position(position, widget_size)
             
             if validation_result.is_valid:
@@ -203,12 +254,8 @@ class MonitorManager:
         """Gibt eine Liste aller verfügbaren Monitor-Namen zurück."""
         return list(self.monitors.keys())
     
-    def _clamp_to_monitor(self, position: QPoint, size: QSize, monitor_name: str) -> QPoint:
+    def _clamp_to_monitor(self, position: QPoint, size: QSize, monitor: MonitorInfo) -> QPoint:
         """Passt die Position an, damit das Fenster vollständig auf dem Monitor sichtbar ist."""
-        monitor = self.monitors.get(monitor_name)
-        if not monitor:
-            return position
-        
         monitor_rect = monitor.available_geometry
         new_x = max(monitor_rect.x(), min(position.x(), monitor_rect.right() - size.width()))
         new_y = max(monitor_rect.y(), min(position.y(), monitor_rect.bottom() - size.height()))
@@ -217,18 +264,15 @@ class MonitorManager:
     
     def _find_best_alternative_position(self, position: QPoint, size: Optional[QSize] = None) -> Tuple[Optional[QPoint], Optional[str]]:
         """Findet die beste alternative Position auf dem nächstgelegenen sichtbaren Monitor."""
-        if not self.monitors:
+        if not self._monitor_centers:
             return None, None
         
-        # Finde den Monitor, dessen Zentrum am nächsten zur ungültigen Position liegt
-        min_distance = float('inf')
-        best_monitor_name = None
-        for name, monitor in self.monitors.items():
-            center = monitor.geometry.center()
-            distance = (position - center).manhattanLength()
-            if distance < min_distance:
-                min_distance = distance
-                best_monitor_name = name
+        # Finde den Monitor, dessen Zentrum am nächsten zur ungültigen Position liegt (Manhattan-Distanz)
+        x, y = position.x(), position.y()
+        best_monitor_name = min(
+            self._monitor_centers,
+            key=lambda entry: abs(x - entry[1]) + abs(y - entry[2]),
+        )[0]
         
         if best_monitor_name:
             safe_size = size or QSize(200, 50)
@@ -238,12 +282,15 @@ class MonitorManager:
     
     def _log_monitor_configuration(self):
         """Loggt die aktuell erkannte Monitor-Konfiguration."""
-        logging.info(f"Monitor-Konfiguration aktualisiert: {len(self.monitors)} Monitore gefunden.")
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        logging.info("Monitor-Konfiguration aktualisiert: %d Monitore gefunden.", len(self.monitors))
         for name, monitor in self.monitors.items():
-            primary_tag = "[PRIMARY]" if monitor.is_primary else ""
+            geometry = monitor.geometry
             logging.info(
-                f"  - {name}: {monitor.geometry.width()}x{monitor.geometry.height()} "
-                f"bei ({monitor.geometry.x()},{monitor.geometry.y()}) {primary_tag}"
+                "  - %s: %dx%d bei (%d,%d) %s",
+                name, geometry.width(), geometry.height(), geometry.x(), geometry.y(),
+                "[PRIMARY]" if monitor.is_primary else "",
             )
     
     def __str__(self) -> str:
@@ -1,31 +1,55 @@
 # core/sensor_cache.py
+import atexit
 import json
 import logging
+import os
+import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-from config.config import CONFIG_DIR, save_atomic
+from config.config import CONFIG_DIR, loads_json, save_atomic
 
 # KORREKTUR: Verwendet pathlib für konsistente Pfad-Objekte
 CACHE_FILE = CONFIG_DIR / 'sensor_cache.json'
 CACHE_VERSION = "2.0"  # Version für zukünftige Kompatibilitätsprüfungen
 
+# Zuletzt geparster Cache samt (st_mtime_ns, st_size) der Datei; erspart erneutes Einlesen
+_cache_memo: Optional[Tuple[Tuple[int, int], Dict[str, str]]] = None
+
+# Verzögertes Schreiben: mehrere Speicheraufrufe innerhalb des Fensters ergeben einen Schreibvorgang
+SAVE_DEBOUNCE_S = 0.25
+_pending_cache: Optional[Dict[str, str]] = None
+_pending_timer: Optional[threading.Timer] = None
+_pending_lock = threading.Lock()
+# Serialisiert das eigentliche Schreiben, damit Leser auf einen laufenden Schreibvorgang warten
+_flush_lock = threading.Lock()
+
 def load_sensor_cache() -> Dict[str, str]:
     """
     Lädt die Zuordnung von internen Sensor-Namen zu Hardware-Identifiern mit verbesserter Validierung.
+    Solange sich die Datei nicht geändert hat, wird eine Kopie des zuletzt geparsten Cache geliefert.
     """
-    if not CACHE_FILE.exists():
+    global _cache_memo
+    # Ausstehende Änderungen zuerst schreiben, sonst würde ein veralteter Stand gelesen
+    flush_pending_cache()
+    try:
+        stat = CACHE_FILE.stat()
+    except FileNotFoundError:
         logging.info("Keine Sensor-Cache-Datei gefunden. Wird beim ersten Start erstellt.")
         return _create_empty_cache()
-    
+
+    file_stamp = (stat.st_mtime_ns, stat.st_size)
+    if _cache_memo is not None and _cache_memo[0] == file_stamp:
+        return dict(_cache_memo[1])
+
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+        with open(CACHE_FILE, 'rb') as f:
             content = f.read().strip()
             if not content:
                 logging.warning("Sensor-Cache-Datei ist leer, erstelle neuen Cache")
                 return _create_empty_cache()
             
-            cache = json.loads(content)
+            cache = loads_json(content)
             
             if not isinstance(cache, dict):
                 logging.warning("Sensor-Cache enthält kein Dictionary, erstelle neuen Cache")
@@ -38,7 +62,9 @@ def load_sensor_cache() -> Dict[str, str]:
                 cache = _migrate_cache(cache, cache_version)
             
             # Cache-Validierung
-            if not _validate_cache_structure(cache):
+            # Sensor-Einträge einmal ermitteln und für Validierung und Logging wiederverwenden
+            sensor_items = _sensor_items(cache)
+            if not _validate_cache_structure(cache, sensor_items):
                 logging.warning("Cache-Struktur ungültig, erstelle neuen Cache")
                 return _create_empty_cache()
             
@@ -50,9 +76,10 @@ def load_sensor_cache() -> Dict[str, str]:
                     logging.info(f"Cache ist {cache_age_days:.1f} Tage alt und wird als veraltet betrachtet")
                     # Behalten, aber mit Warnung - nicht automatisch löschen
             
-            sensor_count = len([k for k in cache.keys() if not k.startswith('_')])
+            sensor_count = len(sensor_items)
             logging.info(f"{sensor_count} Sensor-Identifier aus dem Cache geladen (Version {cache_version})")
-            return cache
+            _cache_memo = (file_stamp, cache)
+            return dict(cache)
             
     except json.JSONDecodeError as e:
         logging.error(f"Sensor-Cache JSON-Dekodierung fehlgeschlagen: {e}")
@@ -69,40 +96,79 @@ def load_sensor_cache() -> Dict[str, str]:
 def save_sensor_cache(cache: Dict[str, str]) -> bool:
     """
     Speichert die Zuordnung von internen Sensor-Namen zu Hardware-Identifiern atomar.
-    Erweitert um Metadaten und Validierung.
+    Erweitert um Metadaten und Validierung. Validiert sofort, geschrieben wird erst nach
+    SAVE_DEBOUNCE_S ohne weitere Aufrufe in einem Hintergrund-Thread.
     """
+    global _pending_cache, _pending_timer
     try:
-        # Cache-Metadaten hinzufügen/aktualisieren
-        enriched_cache = cache.copy()
-        enriched_cache['_cache_version'] = CACHE_VERSION
-        enriched_cache['_last_updated'] = time.time()
-        
-        # Erstelle Timestamp nur beim ersten Mal
-        if '_created_timestamp' not in enriched_cache:
-            enriched_cache['_created_timestamp'] = time.time()
-        
-        # Statistiken hinzufügen
-        sensor_count = len([k for k in cache.keys() if not k.startswith('_')])
-        enriched_cache['_sensor_count'] = sensor_count
+        # Cache-Metadaten in einem Schritt ergänzen; die Kopie bleibt nötig, weil der
+        # verzögerte Schreiber den Snapshot hält, während der Aufrufer weiter ändert
+        now = time.time()
+        sensor_items = _sensor_items(cache)
+        enriched_cache = {
+            **cache,
+            '_cache_version': CACHE_VERSION,
+            '_last_updated': now,
+            # Erstelle Timestamp nur beim ersten Mal
+            '_created_timestamp': cache.get('_created_timestamp', now),
+            '_sensor_count': len(sensor_items),
+        }
         
         # Validierung vor dem Speichern
-        if not _validate_cache_structure(enriched_cache):
+        # Die Metadaten ändern die Sensor-Einträge nicht, daher gelten sensor_items weiter
+        if not _validate_cache_structure(enriched_cache, sensor_items):
             logging.error("Cache-Struktur vor dem Speichern ungültig")
             return False
         
-        # Atomares Speichern
-        success = save_atomic(enriched_cache, CACHE_FILE)
-        if success:
-            logging.debug(f"Sensor-Cache gespeichert: {sensor_count} Sensoren")
-        else:
-            logging.error("Atomares Speichern des Sensor-Cache fehlgeschlagen")
-        
-        return success
+        with _pending_lock:
+            _pending_cache = enriched_cache
+            if _pending_timer is not None:
+                _pending_timer.cancel()
+            _pending_timer = threading.Timer(SAVE_DEBOUNCE_S, flush_pending_cache)
+            _pending_timer.daemon = True
+            _pending_timer.start()
+        return True
         
     except Exception as e:
         logging.error(f"Fehler beim Speichern des Sensor-Cache: {e}")
         return False
 
+def flush_pending_cache() -> bool:
+    """Schreibt einen ausstehenden Cache sofort atomar. Gibt True zurück, wenn nichts ausstand."""
+    global _pending_cache, _pending_timer
+    with _flush_lock:
+        with _pending_lock:
+            cache, _pending_cache = _pending_cache, None
+            timer, _pending_timer = _pending_timer, None
+        if timer is not None:
+            timer.cancel()
+        if cache is None:
+            return True
+
+        _invalidate_cache_memo()
+        success = save_atomic(cache, CACHE_FILE)
+        if success:
+            logging.debug(f"Sensor-Cache gespeichert: {cache.get('_sensor_count', 0)} Sensoren")
+        else:
+            logging.error("Atomares Speichern des Sensor-Cache fehlgeschlagen")
+        return success
+
+def _discard_pending_cache():
+    """Verwirft einen noch nicht geschriebenen Cache, z. B. vor dem Löschen der Datei."""
+    global _pending_cache, _pending_timer
+    with _pending_lock:
+        _pending_cache = None
+        if _pending_timer is not None:
+            _pending_timer.cancel()
+            _pending_timer = None
+
+atexit.register(flush_pending_cache)
+
+def _invalidate_cache_memo():
+    """Verwirft den im Speicher gehaltenen Cache, z. B. nach Schreiben oder Löschen."""
+    global _cache_memo
+    _cache_memo = None
+
 def _create_empty_cache() -> Dict[str, str]:
     """Erstellt einen neuen, leeren Cache mit Metadaten."""
     return {
@@ -131,8 +197,15 @@ def _migrate_cache(old_cache: Dict[str, str], old_version: str) -> Dict[str, str
     logging.info(f"Cache erfolgreich von Version {old_version} migriert")
     return migrated_cache
 
-def _validate_cache_structure(cache: Dict[str, str]) -> bool:
-    """Validiert die Struktur und Integrität des Cache."""
+def _sensor_items(cache: Dict[str, str]) -> List[Tuple[str, str]]:
+    """Liefert die Sensor-Einträge ohne interne Metadaten-Schlüssel."""
+    return [(k, v) for k, v in cache.items() if not k.startswith('_')]
+
+def _validate_cache_structure(cache: Dict[str, str], sensor_items: Optional[List[Tuple[str, str]]] = None) -> bool:
+    """
+    Validiert die Struktur und Integrität des Cache.
+    Bereits ermittelte Sensor-Einträge können übergeben werden, um einen weiteren Durchlauf zu sparen.
+    """
     try:
         # Grundlegende Typ-Prüfung
         if not isinstance(cache, dict):
@@ -145,22 +218,24 @@ def _validate_cache_structure(cache: Dict[str, str]) -> bool:
                 logging.warning(f"Cache-Metadaten fehlen: {meta_key}")
                 return False
         
-        # Sensor-Einträge validieren
-        sensor_entries = {k: v for k, v in cache.items() if not k.startswith('_')}
+        # Sensor-Einträge validieren (JSON-Schlüssel sind immer Strings)
+        if sensor_items is None:
+            sensor_items = _sensor_items(cache)
         
-        for key, value in sensor_entries.items():
-            # Sensor-Schlüssel sollten bestimmte Muster haben
-            if not isinstance(key, str) or not isinstance(value, str):
-                logging.warning(f"Ungültiger Cache-Eintrag: {key} -> {value}")
-                return False
-            
-            # Wert sollte wie eine Hardware-Identifier aussehen
-            if not value or len(value) < 5:
-                logging.warning(f"Verdächtig kurzer Identifier: {key} -> {value}")
-                return False
+        # Sammelprüfung; der Einzeleintrag wird nur für die Fehlermeldung gesucht
+        if not all(isinstance(v, str) for _, v in sensor_items):
+            key, value = next((k, v) for k, v in sensor_items if not isinstance(v, str))
+            logging.warning(f"Ungültiger Cache-Eintrag: {key} -> {value}")
+            return False
+        
+        # Wert sollte wie eine Hardware-Identifier aussehen
+        if sensor_items and min(len(v) for _, v in sensor_items) < 5:
+            key, value = next((k, v) for k, v in sensor_items if len(v) < 5)
+            logging.warning(f"Verdächtig kurzer Identifier: {key} -> {value}")
+            return False
         
         # Sensor-Count validieren
-        expected_count = len(sensor_entries)
+        expected_count = len(sensor_items)
         stored_count = cache.get('_sensor_count', -1)
         if stored_count != expected_count:
             logging.warning(f"Sensor-Count stimmt nicht überein: erwartet {expected_count}, gespeichert {stored_count}")
@@ -178,10 +253,15 @@ def _backup_corrupted_cache():
         return
         
     try:
-        import shutil
         backup_name = f"sensor_cache_corrupted_{int(time.time())}.json.bak"
         backup_path = CONFIG_DIR / backup_name
-        shutil.copy2(CACHE_FILE, backup_path)
+        try:
+            # Hardlink statt Kopie: die Datei wird nur per os.replace ersetzt oder gelöscht,
+            # der alte Inhalt bleibt über den Link erhalten
+            os.link(CACHE_FILE, backup_path)
+        except OSError:
+            import shutil
+            shutil.copy2(CACHE_FILE, backup_path)
         logging.info(f"Korrupter Cache gesichert als: {backup_path}")
     except Exception as e:
         logging.error(f"Fehler beim Backup des korrupten Cache: {e}")
@@ -194,7 +274,7 @@ def get_cache_statistics() -> Dict[str, any]:
         'cache_exists': CACHE_FILE.exists(),
         'cache_file_size': CACHE_FILE.stat().st_size if CACHE_FILE.exists() else 0,
         'cache_version': cache.get('_cache_version', 'unknown'),
-        'sensor_count': len([k for k in cache.keys() if not k.startswith('_')]),
+        'sensor_count': len(_sensor_items(cache)),
         'created_timestamp': cache.get('_created_timestamp', 0),
         'last_updated': cache.get('_last_updated', 0),
         'cache_age_days': 0
@@ -208,19 +288,23 @@ def get_cache_statistics() -> Dict[str, any]:
 
 def clear_cache() -> bool:
     """Löscht die Cache-Datei komplett."""
-    try:
-        if CACHE_FILE.exists():
-            # Backup vor dem Löschen
-            _backup_corrupted_cache()
-            CACHE_FILE.unlink()
-            logging.info("Sensor-Cache erfolgreich gelöscht")
-            return True
-        else:
-            logging.info("Sensor-Cache-Datei existiert nicht")
+    _discard_pending_cache()
+    _invalidate_cache_memo()
+    # Ein gerade laufender Schreibvorgang darf die Datei nicht nach dem Löschen neu anlegen
+    with _flush_lock:
+        try:
+            if CACHE_FILE.exists():
+                # Backup vor dem Löschen
+                _backup_corrupted_cache()
+                CACHE_FILE.unlink()
+                logging.info("Sensor-Cache erfolgreich gelöscht")
+                return True
+            else:
+                logging.info("Sensor-Cache-Datei existiert nicht")
+                return False
+        except Exception as e:
+            logging.error(f"Fehler beim Löschen des Sensor-Cache: {e}")
             return False
-    except Exception as e:
-        logging.error(f"Fehler beim Löschen des Sensor-Cache: {e}")
-        return False
 
 def invalidate_cache_for_hardware(hardware_fingerprint: str) -> bool:
     """Invalidiert den Cache, wenn sich die Hardware-Konfiguration geändert hat."""
@@ -1,9 +1,29 @@
 # core/sensor_mapping.py
 import logging
 import re
-from typing import Dict, Optional, List, Tuple
+import sys
+from typing import Dict, Optional, List, NamedTuple, Tuple
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import JaroWinkler
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    process = None
+    JaroWinkler = None
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+# process.cdist benötigt zusätzlich NumPy; fehlt es, wird dauerhaft paarweise bewertet
+_cdist_supported = RAPIDFUZZ_AVAILABLE
+
 # Erweiterte SENSOR_MAP mit mehreren Suchstrategien und Hardware-spezifischen Begriffen
 SENSOR_MAP = {
     # CPU Temperature - erweitert für verschiedene Hersteller
@@ -129,10 +149,180 @@ SENSOR_MAP = {
     }
 }
 
-def similarity_score(a: str, b: str) -> float:
-    """Berechnet die Ähnlichkeit zwischen zwei Strings (0.0 - 1.0)."""
+class _PreparedMapping(NamedTuple):
+    """Einmalig kleingeschriebene Form eines SENSOR_MAP-Eintrags für find_sensor."""
+    terms: Tuple[Tuple[str, str, bool], ...]  # (Begriff, kleingeschrieben, ist Prioritätsbegriff)
+    search_terms_lower: Tuple[str, ...]
+    exclude_re: Optional[re.Pattern]  # Alternation aller Ausschlussbegriffe oder None
+    sensor_type: str  # kleingeschrieben
+
+
+def _compile_alternation(terms) -> Optional[re.Pattern]:
+    """Fasst Teilstring-Begriffe zu einem Regex zusammen, den re in einem Durchlauf in C prüft."""
+    escaped = [re.escape(term) for term in terms]
+    return re.compile('|'.join(escaped)) if escaped else None
+
+
+def _prepare_mapping(mapping: Dict) -> _PreparedMapping:
+    priority_terms = frozenset(term.lower() for term in mapping.get('priority_terms', []))
+    terms = tuple((term, term.lower(), term.lower() in priority_terms) for term in mapping['search_terms'])
+    search_terms_lower = tuple(term_lower for _, term_lower, _ in terms)
+    return _PreparedMapping(
+        terms=terms,
+        search_terms_lower=search_terms_lower,
+        exclude_re=_compile_alternation(term.lower() for term in mapping.get('exclude_terms', [])),
+        sensor_type=sys.intern(mapping['sensor_type'].lower()),
+    )
+
+
+_PREPARED_SENSOR_MAP: Dict[str, _PreparedMapping] = {
+    canonical_name: _prepare_mapping(mapping) for canonical_name, mapping in SENSOR_MAP.items()
+}
+
+
+# Flache Begriffsliste über alle Mappings (jeder kleingeschriebene Begriff genau einmal) und je
+# kanonischem Namen die Spalte jedes seiner Begriffe darin, parallel zu _PreparedMapping.terms.
+# So lassen sich Sensornamen für beliebig viele Mappings mit einer einzigen Matrix bewerten.
+ALL_TERMS: Tuple[str, ...] = tuple(dict.fromkeys(
+    term_lower for prepared in _PREPARED_SENSOR_MAP.values() for term_lower in prepared.search_terms_lower
+))
+_TERM_COLUMN = {term_lower: column for column, term_lower in enumerate(ALL_TERMS)}
+TERM_COLUMNS: Dict[str, Tuple[int, ...]] = {
+    canonical_name: tuple(_TERM_COLUMN[term_lower] for term_lower in prepared.search_terms_lower)
+    for canonical_name, prepared in _PREPARED_SENSOR_MAP.items()
+}
+
+
+def _build_global_term_automaton(prepared_map: Dict[str, _PreparedMapping]) -> Optional[object]:
+    """
+    Baut einen Aho-Corasick-Automaten über die Suchbegriffe aller Mappings. Jeder Begriff trägt die
+    (kanonischer Name, Begriffsindex)-Paare aller Mappings, in denen er vorkommt, sodass ein einziger
+    Durchlauf pro Sensorname die Treffer sämtlicher kanonischer Namen liefert.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    owners: Dict[str, List[Tuple[str, int]]] = {}
+    for canonical_name, prepared in prepared_map.items():
+        seen = set()
+        for index, term_lower in enumerate(prepared.search_terms_lower):
+            # Bei doppelten Begriffen zählt wie in der Schleife das erste Vorkommen
+            if term_lower not in seen:
+                seen.add(term_lower)
+                owners.setdefault(term_lower, []).append((canonical_name, index))
+    if not owners:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term_lower, term_owners in owners.items():
+        automaton.add_word(term_lower, tuple(term_owners))
+    automaton.make_automaton()
+    return automaton
+
+
+_GLOBAL_TERM_AUTOMATON = _build_global_term_automaton(_PREPARED_SENSOR_MAP)
+
+# Gefundene Sensoren je (kanonischer Name, Hardware-Identifier); die Topologie ändert sich
+# erst bei einer neuen Hardware-Erkennung, dann muss invalidate_sensor_search_cache() laufen
+_sensor_search_cache: Dict[Tuple[str, str], object] = {}
+# Identifier der Unter-Hardware, die für die Suche bereits einmal aktualisiert wurde. Für den
+# Namensabgleich genügt das, weil LHM Sensoren erst beim ersten Update anlegt; Werte liest
+# später der Aufrufer über den gefundenen Sensor.
+_updated_sub_hardware: set = set()
+# (kleingeschriebener Name, kleingeschriebener Typ) je Sensor-Identifier, interniert, damit
+# wiederholte Suchen keine neuen Strings für dieselben Sensoren anlegen
+_sensor_keys_cache: Dict[str, Tuple[str, str]] = {}
+
+def invalidate_sensor_search_cache():
+    """Verwirft alle gemerkten Suchergebnisse von find_sensor, z. B. nach einer Hardware-Neuerkennung."""
+    _sensor_search_cache.clear()
+    _updated_sub_hardware.clear()
+    _sensor_keys_cache.clear()
+
+def _sensor_keys(sensor) -> Tuple[str, str]:
+    """Liefert (Name, Typ) eines Sensors kleingeschrieben; einmal je Identifier berechnet und interniert."""
+    identifier = str(sensor.Identifier)
+    keys = _sensor_keys_cache.get(identifier)
+    if keys is None:
+        keys = (sys.intern(sensor.Name.lower()), sys.intern(str(sensor.SensorType).lower()))
+        _sensor_keys_cache[identifier] = keys
+    return keys
+
+# Jaro-Winkler (rapidfuzz) liefert für kurze Namen deutlich höhere Werte als SequenceMatcher,
+# daher gelten je nach Verfahren eigene Schwellen:
+# MIN_CANDIDATE_SCORE - Fuzzy-Treffer bis einschließlich dieser Ähnlichkeit werden in find_sensor verworfen
+# PRIORITY_FUZZY_SCORE - ab dieser Ähnlichkeit erhält ein Prioritätsbegriff den Bonus
+if RAPIDFUZZ_AVAILABLE:
+    MIN_CANDIDATE_SCORE = 0.6
+    PRIORITY_FUZZY_SCORE = 0.85
+else:
+    MIN_CANDIDATE_SCORE = 0.3
+    PRIORITY_FUZZY_SCORE = 0.6
+
+def similarity_score(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """
+    Berechnet die Ähnlichkeit zwischen zwei Strings (0.0 - 1.0); nutzt Jaro-Winkler aus rapidfuzz,
+    falls installiert, sonst SequenceMatcher. Jaro-Winkler gewichtet gemeinsame Präfixe höher,
+    was zu Sensornamen wie "gpu core clock" passt.
+    Werte unter score_cutoff dürfen als 0.0 geliefert werden, damit rapidfuzz früh abbrechen kann.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return JaroWinkler.normalized_similarity(a.lower(), b.lower(), score_cutoff=score_cutoff)
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
+def _substring_hit(prepared: _PreparedMapping, sensor_name: str) -> Optional[Tuple[float, str, bool]]:
+    """
+    Liefert (Score, Begriff, Priorität) für den besten Teilstring-Treffer oder None.
+    Ein Prioritätsbegriff schlägt jeden anderen Treffer, sonst gewinnt der erste Begriff der Liste.
+    """
+    hit = None
+    for term, term_lower, term_is_priority in prepared.terms:
+        if term_lower in sensor_name:
+            if term_is_priority:
+                return (1.2, term, True)
+            if hit is None:
+                hit = (1.0, term, False)
+    return hit
+
+def _hit_from_indices(prepared: _PreparedMapping, indices) -> Tuple[float, str, bool]:
+    """Wie _substring_hit, aber für die vom Automaten gefundenen Begriffsindizes eines Mappings."""
+    terms = prepared.terms
+    priority_indices = [index for index in indices if terms[index][2]]
+    term, _, term_is_priority = terms[min(priority_indices or indices)]
+    return (1.2, term, True) if term_is_priority else (1.0, term, False)
+
+def _substring_hits(targets: List[Tuple[str, _PreparedMapping]], sensor_name: str) -> Dict[str, Tuple[float, str, bool]]:
+    """Teilstring-Treffer eines Sensornamens für alle übergebenen Mappings; mit Automat in einem Durchlauf."""
+    if _GLOBAL_TERM_AUTOMATON is None:
+        hits = {}
+        for canonical_name, prepared in targets:
+            if (hit := _substring_hit(prepared, sensor_name)) is not None:
+                hits[canonical_name] = hit
+        return hits
+
+    indices_by_name: Dict[str, set] = {}
+    for _, term_owners in _GLOBAL_TERM_AUTOMATON.iter(sensor_name):
+        for canonical_name, index in term_owners:
+            indices_by_name.setdefault(canonical_name, set()).add(index)
+    return {
+        canonical_name: _hit_from_indices(prepared, indices_by_name[canonical_name])
+        for canonical_name, prepared in targets
+        if canonical_name in indices_by_name
+    }
+
+def _similarity_matrix(names: List[str], terms: List[str], score_cutoff: float = 0.0) -> List[List[float]]:
+    """
+    Bewertet alle (bereits kleingeschriebenen) Namen gegen alle Begriffe; Zeile je Name, Spalte je Begriff.
+    Mit rapidfuzz und NumPy in einem einzigen cdist-Aufruf, sonst paarweise über similarity_score.
+    """
+    global _cdist_supported
+    if _cdist_supported:
+        try:
+            matrix = process.cdist(names, terms, scorer=JaroWinkler.normalized_similarity, score_cutoff=score_cutoff)
+            return matrix.tolist()
+        except ImportError:
+            logging.debug("rapidfuzz.process.cdist ohne NumPy nicht verfügbar, bewerte paarweise.")
+            _cdist_supported = False
+    return [[similarity_score(term, name, score_cutoff) for term in terms] for name in names]
+
 
 def is_hardware_compatible(canonical_name: str, hardware_item) -> bool:
     """Prüft, ob ein Hardware-Typ grundsätzlich zum Sensor-Mapping passt."""
@@ -150,78 +340,38 @@ def is_hardware_compatible(canonical_name: str, hardware_item) -> bool:
         for expected in expected_types
     )
 
-def find_sensor(canonical_name: str, hardware_item, debug_info: Optional[List[str]] = None) -> Optional[object]:
+def _score_candidates(prepared: _PreparedMapping, entries: List[Tuple[object, str, Optional[Tuple[float, str, bool]]]],
+                      fuzzy_rows: Dict[str, List[float]], columns: Tuple[int, ...], candidates: List[Dict]):
     """
-    Findet den besten Sensor für einen kanonischen Namen, indem ein Hardware-Element 
-    und dessen Unter-Hardware rekursiv durchsucht werden.
+    Bewertet die (Sensor, kleingeschriebener Name, Teilstring-Treffer)-Einträge eines Hardware-Knotens
+    für ein Mapping und hängt passende Kandidaten an. Ein Prioritätstreffer (1.2) ist nicht zu schlagen;
+    Sensoren ohne Teilstring-Treffer nutzen ihre Zeile aus fuzzy_rows, deren Spalten `columns` den
+    Begriffen des Mappings entsprechen.
     """
-    if debug_info is None:
-        debug_info = []
-
-    mapping = SENSOR_MAP.get(canonical_name)
-    if not mapping:
-        debug_info.append(f"Kein Mapping fuer '{canonical_name}' in SENSOR_MAP gefunden")
-        return None
-
-    search_terms = mapping['search_terms']
-    exclude_terms = mapping.get('exclude_terms', [])
-    priority_terms = mapping.get('priority_terms', [])
-    sensor_type_target = mapping['sensor_type'].lower()
-    
-    debug_info.append(f"Suche: Starte rekursive Suche nach '{canonical_name}' (Typ: {sensor_type_target}) auf '{hardware_item.Name}'")
-    
-    candidates = []
-    
-    def search_recursively(current_hw, depth=0):
-        """Sammelt alle potenziellen Sensor-Kandidaten aus dem Hardware-Baum."""
-        indent = "  " * depth
-        debug_info.append(f"{indent} Lese Sensoren von '{current_hw.Name}'...")
-
-        for sensor in current_hw.Sensors:
-            sensor_name = sensor.Name.lower()
-            sensor_type = str(sensor.SensorType).lower()
-
-            if sensor_type != sensor_type_target:
-                continue
-            
-            if any(exclude_term.lower() in sensor_name for exclude_term in exclude_terms):
-                continue
-            
-            best_score = 0.0
-            matched_term = ""
-            is_priority = False
-            
-            for term in search_terms:
-                term_lower = term.lower()
-                
-                if term_lower in sensor_name:
-                    score = 1.0
-                    if term in priority_terms:
-                        score = 1.2
-                        is_priority = True
-                else:
-                    score = similarity_score(term_lower, sensor_name)
-                    if score > 0.6:
-                        if term in priority_terms:
-                            score += 0.1
-                            is_priority = True
-                
+    for sensor, sensor_name, hit in entries:
+        if hit is not None:
+            best_score, matched_term, is_priority = hit
+        else:
+            best_score, matched_term, is_priority = 0.0, "", False
+            row = fuzzy_rows[sensor_name]
+            for (term, _, term_is_priority), column in zip(prepared.terms, columns):
+                score = row[column]
+                if score > PRIORITY_FUZZY_SCORE and term_is_priority:
+                    score += 0.1
+                    is_priority = True
                 if score > best_score:
                     best_score = score
                     matched_term = term
-            
-            if best_score > 0.3:
-                candidates.append({
-                    'sensor': sensor, 'score': best_score, 'term': matched_term,
-                    'is_priority': is_priority, 'name': sensor.Name
-                })
-        
-        for sub_hw in current_hw.SubHardware:
-            sub_hw.Update()
-            search_recursively(sub_hw, depth + 1)
 
-    search_recursively(hardware_item)
+        if best_score > MIN_CANDIDATE_SCORE:
+            candidates.append({
+                'sensor': sensor, 'score': best_score, 'term': matched_term,
+                'is_priority': is_priority, 'name': sensor.Name
+            })
 
+
+def _select_best_candidate(canonical_name: str, hardware_item, candidates: List[Dict], debug_info: List[str]) -> Optional[object]:
+    """Wählt den besten Kandidaten (Prioritätstreffer vor Score) und protokolliert das Ergebnis."""
     if not candidates:
         debug_info.append(f"   Keine passenden Kandidaten fuer '{canonical_name}' im gesamten Baum von '{hardware_item.Name}' gefunden.")
         logging.warning(f"Sensor '{canonical_name}' konnte auf '{hardware_item.Name}' oder dessen Unter-Hardware nicht gefunden werden.")
@@ -239,6 +389,137 @@ def find_sensor(canonical_name: str, hardware_item, debug_info: Optional[List[st
     return best_candidate['sensor']
 
 
+def resolve_all(hardware_item, canonical_names=None,
+                debug_infos: Optional[Dict[str, List[str]]] = None) -> Dict[str, object]:
+    """
+    Findet die besten Sensoren für mehrere kanonische Namen (Standard: alle aus SENSOR_MAP) in einem
+    einzigen Durchlauf über ein Hardware-Element und dessen Unter-Hardware. Jeder Sensor wird dabei
+    nur einmal kleingeschrieben und einmal durch den gemeinsamen Begriffs-Automaten geführt.
+    Liefert {kanonischer Name: Sensor} für alle gefundenen Namen.
+    Namen mit Eintrag in debug_infos werden immer vollständig gesucht und ihr Suchverlauf dort
+    protokolliert; alle anderen dürfen aus dem Such-Cache kommen.
+    """
+    if canonical_names is None:
+        canonical_names = SENSOR_MAP.keys()
+    if debug_infos is None:
+        debug_infos = {}
+    hw_id = str(hardware_item.Identifier)
+
+    resolved: Dict[str, object] = {}
+    searches: Dict[str, Tuple[_PreparedMapping, List[str], List[Dict]]] = {}
+    targets_by_type: Dict[str, List[Tuple[str, _PreparedMapping]]] = {}
+    for canonical_name in canonical_names:
+        debug_info = debug_infos.get(canonical_name)
+        use_cache = debug_info is None
+        if debug_info is None:
+            debug_info = []
+
+        prepared = _PREPARED_SENSOR_MAP.get(canonical_name)
+        if not prepared:
+            debug_info.append(f"Kein Mapping fuer '{canonical_name}' in SENSOR_MAP gefunden")
+            continue
+
+        if use_cache and (cached_sensor := _sensor_search_cache.get((canonical_name, hw_id))) is not None:
+            resolved[canonical_name] = cached_sensor
+            continue
+
+        debug_info.append(f"Suche: Starte rekursive Suche nach '{canonical_name}' (Typ: {prepared.sensor_type}) auf '{hardware_item.Name}'")
+        searches[canonical_name] = (prepared, debug_info, [])
+        targets_by_type.setdefault(prepared.sensor_type, []).append((canonical_name, prepared))
+
+    if not searches:
+        return resolved
+
+    # Fuzzy-Spalten: Vereinigung der Begriffe aller gesuchten Mappings, je Mapping auf diese abgebildet
+    search_columns = sorted({column for canonical_name in searches for column in TERM_COLUMNS[canonical_name]})
+    search_terms = [ALL_TERMS[column] for column in search_columns]
+    local_column = {column: index for index, column in enumerate(search_columns)}
+    mapping_columns = {
+        canonical_name: tuple(local_column[column] for column in TERM_COLUMNS[canonical_name])
+        for canonical_name in searches
+    }
+
+    # Explizite Tiefensuche statt Rekursion; Kinder werden umgekehrt aufgelegt,
+    # damit die Besuchsreihenfolge (und damit die Reihenfolge gleichwertiger Kandidaten) erhalten bleibt
+    stack = [(hardware_item, 0)]
+    while stack:
+        current_hw, depth = stack.pop()
+        read_line = f"{'  ' * depth} Lese Sensoren von '{current_hw.Name}'..."
+        for _, debug_info, _ in searches.values():
+            debug_info.append(read_line)
+
+        # Erst nach Typ und Ausschlüssen filtern, damit nur relevante Mappings bewertet werden
+        node_entries: Dict[str, List] = {}
+        for sensor in current_hw.Sensors:
+            sensor_name, sensor_type = _sensor_keys(sensor)
+            targets = targets_by_type.get(sensor_type)
+            if not targets:
+                continue
+
+            active_targets = [
+                (canonical_name, prepared) for canonical_name, prepared in targets
+                if prepared.exclude_re is None or not prepared.exclude_re.search(sensor_name)
+            ]
+            hits = _substring_hits(active_targets, sensor_name)
+            for canonical_name, _ in active_targets:
+                node_entries.setdefault(canonical_name, []).append((sensor, sensor_name, hits.get(canonical_name)))
+
+        # Namen ohne Teilstring-Treffer für alle Mappings zusammen in einem Matrix-Aufruf bewerten
+        fuzzy_names = list(dict.fromkeys(
+            sensor_name for entries in node_entries.values() for _, sensor_name, hit in entries if hit is None
+        ))
+        fuzzy_rows = (
+            dict(zip(fuzzy_names, _similarity_matrix(fuzzy_names, search_terms, MIN_CANDIDATE_SCORE)))
+            if fuzzy_names else {}
+        )
+
+        for canonical_name, entries in node_entries.items():
+            prepared, _, candidates = searches[canonical_name]
+            _score_candidates(prepared, entries, fuzzy_rows, mapping_columns[canonical_name], candidates)
+
+        sub_hardware = list(current_hw.SubHardware)
+        for sub_hw in sub_hardware:
+            sub_hw_id = str(sub_hw.Identifier)
+            if sub_hw_id not in _updated_sub_hardware:
+                sub_hw.Update()
+                _updated_sub_hardware.add(sub_hw_id)
+        stack.extend((sub_hw, depth + 1) for sub_hw in reversed(sub_hardware))
+
+    for canonical_name, (_, debug_info, candidates) in searches.items():
+        sensor = _select_best_candidate(canonical_name, hardware_item, candidates, debug_info)
+        if sensor is not None:
+            _sensor_search_cache[(canonical_name, hw_id)] = sensor
+            resolved[canonical_name] = sensor
+    return resolved
+
+
+def find_sensor(canonical_name: str, hardware_item, debug_info: Optional[List[str]] = None) -> Optional[object]:
+    """
+    Findet den besten Sensor für einen kanonischen Namen, indem ein Hardware-Element 
+    und dessen Unter-Hardware rekursiv durchsucht werden.
+    Ohne debug_info wird ein zuvor gefundener Sensor aus dem Such-Cache geliefert;
+    mit debug_info wird immer vollständig gesucht, damit der Suchverlauf protokolliert wird.
+    Für mehrere Namen auf derselben Hardware ist resolve_all günstiger.
+    """
+    debug_infos = {canonical_name: debug_info} if debug_info is not None else None
+    return resolve_all(hardware_item, (canonical_name,), debug_infos).get(canonical_name)
+
+
+def score_all(sensor_names: List[str], canonical_names=None) -> List[List[float]]:
+    """
+    Reine Namensähnlichkeit (ohne Typfilter, Teilstring-Regeln und Prioritätsbonus) jedes Sensornamens
+    zu jedem kanonischen Namen (Standard: alle aus SENSOR_MAP): Zeile je Sensor, Spalte je Name,
+    jeweils der beste Wert über die Begriffe des Mappings. Alle Begriffe werden in einem Aufruf bewertet.
+    """
+    if canonical_names is None:
+        canonical_names = list(SENSOR_MAP)
+    columns = [TERM_COLUMNS.get(canonical_name, ()) for canonical_name in canonical_names]
+    if not sensor_names:
+        return []
+    matrix = _similarity_matrix([name.lower() for name in sensor_names], ALL_TERMS)
+    return [[max((row[column] for column in mapping_columns), default=0.0) for mapping_columns in columns] for row in matrix]
+
+
 def get_available_sensors_for_hardware(hardware_item, recursive: bool = False, depth: int = 0) -> List[Dict]:
     """
     Hilfsfunktion für Debug: Gibt alle verfügbaren Sensoren einer Hardware zurück.
@@ -280,9 +561,10 @@ def diagnose_sensor_matching(canonical_name: str, hardware_item) -> str:
     result += "\n"
     
     available_sensors = get_available_sensors_for_hardware(hardware_item, recursive=True)
+    scores = score_all([sensor['name'] for sensor in available_sensors], (canonical_name,))
     result += f"Verfuegbare Sensoren im Baum von '{hardware_item.Name}' ({len(available_sensors)}):\n"
-    for sensor in available_sensors:
+    for sensor, (score,) in zip(available_sensors, scores):
         value_str = f"{sensor['value']:.2f}" if sensor['value'] is not None else "N/A"
-        result += f"  - [{sensor['hardware_name']}] {sensor['name']} | Typ: {sensor['type']} | Wert: {value_str}\n"
+        result += f"  - [{sensor['hardware_name']}] {sensor['name']} | Typ: {sensor['type']} | Wert: {value_str} | Aehnlichkeit: {score:.2f}\n"
     
     return result
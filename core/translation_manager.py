@@ -1,10 +1,11 @@
 # core/translation_manager.py
 import json
 import logging
+import mmap
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Tuple
 
-from config.config import CONFIG_DIR
+from config.config import CONFIG_DIR, ORJSON_AVAILABLE, dumps_json, loads_json, orjson
 from core.translations import LANG_DE, LANG_EN
 
 
@@ -20,10 +21,11 @@ class TranslationManager:
     GERMAN = "german"
     ENGLISH = "english"
     FALLBACK_LANGUAGE = GERMAN
+    FORMAT_CACHE_MAX_ENTRIES = 1024
 
     def __init__(self) -> None:
         """Initialisiert den TranslationManager."""
-        self.language_dir = Path(CONFIG_DIR) / "language"
+        self.language_dir = CONFIG_DIR / "language"
         self.language_dir.mkdir(exist_ok=True)
 
         self._hardcoded_languages: Dict[str, Dict[str, str]] = {
@@ -31,8 +33,12 @@ class TranslationManager:
             self.ENGLISH: LANG_EN
         }
         self._file_languages: Dict[str, Dict[str, str]] = {}
+        # Je Sprache ein vollständig aufgelöstes Wörterbuch (Fallback < hartkodiert < Datei)
+        self._resolved_languages: Dict[str, Dict[str, str]] = {}
         self.current_language: str = self.FALLBACK_LANGUAGE
         self.translations: Dict[str, str] = {}
+        # (Schlüssel, sortierte kwargs) -> formatierter Text der aktiven Sprache
+        self._format_cache: Dict[Tuple[str, Tuple[Tuple[str, type, Any], ...]], str] = {}
 
         self._create_language_templates()
         self.scan_languages()
@@ -48,8 +54,7 @@ class TranslationManager:
             template_file = self.language_dir / f"{lang_name}.json"
             if not template_file.exists():
                 try:
-                    with open(template_file, 'w', encoding='utf-8') as f:
-                        json.dump(lang_data, f, indent=4, ensure_ascii=False)
+                    template_file.write_bytes(dumps_json(lang_data))
                     logging.info(f"Sprachvorlage für '{lang_name}' erstellt: {template_file}")
                 except IOError as e:
                     logging.exception(f"Konnte Sprachvorlage für '{lang_name}' nicht erstellen.")
@@ -60,23 +65,51 @@ class TranslationManager:
         for file_path in self.language_dir.glob("*.json"):
             lang_name = file_path.stem.lower()
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if not content:
-                        logging.warning(f"Sprachdatei '{file_path.name}' ist leer und wird übersprungen.")
-                        continue
-
-                    data = json.loads(content)
-                    if isinstance(data, dict):
-                        self._file_languages[lang_name] = data
-                        logging.info(f"Sprache '{lang_name}' aus Datei geladen.")
-                    else:
-                        logging.warning(f"Sprachdatei '{file_path.name}' enthält kein valides Dictionary.")
+                if file_path.stat().st_size == 0:
+                    logging.warning(f"Sprachdatei '{file_path.name}' ist leer und wird übersprungen.")
+                    continue
+
+                data = self._read_language_file(file_path)
+                if isinstance(data, dict):
+                    self._file_languages[lang_name] = data
+                    logging.info(f"Sprache '{lang_name}' aus Datei geladen.")
+                else:
+                    logging.warning(f"Sprachdatei '{file_path.name}' enthält kein valides Dictionary.")
             except json.JSONDecodeError:
                 logging.exception(f"Sprachdatei '{file_path.name}' ist korrupt. Wird übersprungen.")
             except IOError:
                 logging.exception(f"Fehler beim Laden der Sprachdatei '{file_path.name}'.")
 
+        self._resolve_languages()
+
+    @staticmethod
+    def _read_language_file(file_path: Path) -> Any:
+        """
+        Parst eine nicht leere Sprachdatei. Mit orjson direkt aus der gemappten Datei,
+        sodass der Inhalt nicht zusätzlich als Bytes-Objekt im Speicher liegt.
+        """
+        if not ORJSON_AVAILABLE:
+            return loads_json(file_path.read_bytes())
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Die memoryview muss vor dem Schließen des mmap freigegeben sein
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+    def _resolve_languages(self) -> None:
+        """
+        Führt Fallback-, hartkodierte und Datei-Übersetzungen einmal pro Sprache zusammen,
+        damit translate mit einem einzigen Lookup auskommt.
+        """
+        fallback = self._hardcoded_languages[self.FALLBACK_LANGUAGE]
+        self._resolved_languages = {
+            lang_name: {
+                **fallback,
+                **self._hardcoded_languages.get(lang_name, {}),
+                **self._file_languages.get(lang_name, {}),
+            }
+            for lang_name in self.get_available_languages()
+        }
+
     def get_available_languages(self) -> List[str]:
         """Gibt eine Liste aller verfügbaren Sprachen zurück."""
         hardcoded_keys = set(self._hardcoded_languages.keys())
@@ -92,11 +125,7 @@ class TranslationManager:
         requested_language = language_name.lower()
         language_name = requested_language
         
-        # Merge dictionaries to ensure all keys are present
-        base_translations = self._hardcoded_languages.get(language_name, self._hardcoded_languages[self.FALLBACK_LANGUAGE]).copy()
-        
         if language_name in self._file_languages:
-            base_translations.update(self._file_languages[language_name])
             logging.info(f"Aktive Sprache auf '{language_name}' (aus Datei mit Fallback) gesetzt.")
         elif language_name in self._hardcoded_languages:
             logging.info(f"Aktive Sprache auf '{language_name}' (hardcoded) gesetzt.")
@@ -104,30 +133,42 @@ class TranslationManager:
             language_name = self.FALLBACK_LANGUAGE
             logging.warning(f"Sprache '{requested_language}' nicht gefunden, verwende '{self.FALLBACK_LANGUAGE}'.")
 
-        self.translations = base_translations
+        # Bereits beim Scannen zusammengeführt; enthält alle Schlüssel der Fallback-Sprache
+        self.translations = self._resolved_languages[language_name]
         self.current_language = language_name
+        self._format_cache.clear()
 
     def translate(self, key: str, **kwargs: Any) -> str:
         """
         Gibt den übersetzten Text für einen Schlüssel zurück. Greift bei
         Fehlschlägen auf die Fallback-Sprache und dann auf den Schlüssel selbst zurück.
         """
-        # 1. Versuche, aus der aktuellen Sprache zu übersetzen
+        # Die aktive Sprache enthält bereits alle Schlüssel der Fallback-Sprache
         text = self.translations.get(key)
-        
-        # 2. Wenn nicht erfolgreich, versuche Fallback-Sprache
         if text is None:
-            fallback_dict = self._hardcoded_languages[self.FALLBACK_LANGUAGE]
-            text = fallback_dict.get(key)
-            if text is None:
-                logging.warning(f"Übersetzungsschlüssel '{key}' weder in '{self.current_language}' noch im Fallback '{self.FALLBACK_LANGUAGE}' gefunden.")
-                return key  # 3. Letzter Ausweg: Schlüssel selbst zurückgeben
+            logging.warning(f"Übersetzungsschlüssel '{key}' weder in '{self.current_language}' noch im Fallback '{self.FALLBACK_LANGUAGE}' gefunden.")
+            return key  # Letzter Ausweg: Schlüssel selbst zurückgeben
 
-        # Formatierung anwenden
+        # Formatierung anwenden; wiederkehrende Kombinationen aus dem Cache
         if kwargs:
             try:
-                return text.format(**kwargs)
+                # Typ gehört zum Schlüssel, da z. B. 1 und 1.0 gleich hashen, aber anders formatiert werden
+                cache_key = (key, tuple((name, type(value), value) for name, value in sorted(kwargs.items())))
+                cached = self._format_cache.get(cache_key)
+            except TypeError:
+                # Nicht hashbare Argumente: ohne Cache formatieren
+                cache_key, cached = None, None
+            if cached is not None:
+                return cached
+            try:
+                formatted = text.format(**kwargs)
             except (KeyError, IndexError):
                 logging.error(f"Fehler beim Formatieren des Texts für Schlüssel '{key}'. Originaltext wird zurückgegeben.")
+                return text
+            if cache_key is not None:
+                if len(self._format_cache) >= self.FORMAT_CACHE_MAX_ENTRIES:
+                    self._format_cache.clear()
+                self._format_cache[cache_key] = formatted
+            return formatted
         
         return text
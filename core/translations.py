@@ -653,6 +653,7 @@ LANG_DE = {
     "dlg_db_recreated_title": "Erfolgreich",
     "dlg_db_recreated_text": "Die Monitoring-Datenbank wurde erfolgreich neu erstellt.",
     "dlg_db_recreate_failed_text": "Die Datenbank konnte nicht neu erstellt werden. Bitte prüfen Sie die Log-Dateien.",
+    "dlg_db_recreating_text": "Die Monitoring-Datenbank wird neu erstellt...",
     
         # various
     "help_license_libs_text_firacode": "Die Anwendung verwendet die Schriftart Fira Code.<br>Quelle: <a href='https://github.com/tonsky/FiraCode'>https://github.com/tonsky/FiraCode</a><br>Lizenz: SIL Open Font License 1.1.",
@@ -1327,6 +1328,7 @@ LANG_EN = {
     "dlg_db_recreated_title": "Success",
     "dlg_db_recreated_text": "The monitoring database was successfully recreated.",
     "dlg_db_recreate_failed_text": "The database could not be recreated. Please check the log files.",
+    "dlg_db_recreating_text": "Recreating the monitoring database...",
     
     # various
     "help_license_libs_text_firacode": "The application uses the Fira Code font.<br>Source: <a href='https://github.com/tonsky/FiraCode'>https://github.com/tonsky/FiraCode</a><br>License: SIL Open Font License 1.1.",
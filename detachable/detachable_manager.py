@@ -4,15 +4,15 @@ import logging
 import uuid
 from typing import TYPE_CHECKING, Callable, Dict, Set, Optional, List
 
-from PySide6.QtCore import QObject, Slot, QRect, QPoint, Qt, QTimer, QSize, Signal
+from PySide6.QtCore import QObject, Slot, QRect, QPoint, Qt, QTimer, QSize, Signal, QRunnable, QThreadPool
 from PySide6.QtGui import QFont, QFontMetrics
 from PySide6.QtWidgets import QApplication
 
 from detachable.detachable_widget import DetachableWidget
 from detachable.magnetic_docking import MagneticDocker, DockingType
-from detachable.position_persistence import load_layout, save_layout
+from detachable.position_persistence import load_layout, save_layout, save_layout_payload
 from detachable.group_manager import GroupManager, GroupType, GroupInfo
-from config.config import CONFIG_DIR
+from config.config import CONFIG_DIR, dumps_json
 from config.constants import SettingsKey, LayoutSection
 
 if TYPE_CHECKING:
@@ -20,6 +20,18 @@ if TYPE_CHECKING:
     from core.monitor_manager import MonitorManager
 
 
+class _LayoutSaveJob(QRunnable):
+    """Schreibt einen bereits serialisierten Layout-Snapshot in einem Pool-Thread."""
+
+    def __init__(self, payload: bytes):
+        super().__init__()
+        self.payload = payload
+
+    def run(self):
+        if not save_layout_payload(self.payload, CONFIG_DIR):
+            logging.error("Session-Layout konnte im Hintergrund nicht gespeichert werden.")
+
+
 class DetachableManager(QObject):
     """
     Verwaltet losgelöste Widgets, deren Layout, Gruppierung und
@@ -28,6 +40,7 @@ class DetachableManager(QObject):
     layout_modified = Signal()
     MIN_FONT_SIZE = 6
     RESERVED_LAYOUT_NAMES = {"_last_session"}
+    BACKGROUND_SAVE_TIMEOUT_MS = 2000
 
     def __init__(self, main_window: SystemMonitor, monitor_manager: Optional[MonitorManager] = None):
         super().__init__()
@@ -50,6 +63,9 @@ class DetachableManager(QObject):
         self.save_timer.setInterval(500)
         self.save_timer.timeout.connect(self._save_layout_to_session)
         self.layout_modified.connect(self.save_timer.start)
+        # Ein einzelner Thread hält die Reihenfolge der Hintergrund-Speichervorgänge ein
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
 
 
         if self.monitor_manager:
@@ -72,17 +88,19 @@ class DetachableManager(QObject):
             self.hidden_widget_states = {}
         return self.hidden_widget_states
 
-    @Slot(str, dict)
-    def update_widget_display(self, metric_key: str, data: dict):
+    @Slot(dict)
+    def update_widgets_display(self, updates: dict):
         """
-        Slot, der vom DataHandler-Signal aufgerufen wird.
-        Aktualisiert das entsprechende Widget mit den aufbereiteten Daten.
+        Slot, der vom DataHandler-Signal einmal pro Tick aufgerufen wird.
+        Aktualisiert alle aktiven Widgets mit den aufbereiteten Daten.
         """
-        if widget := self.active_widgets.get(metric_key):
-            widget.update_data(data["value_text"], data["percent_value"])
-            widget.set_value_style(
-                data["is_alarm"], data["normal_color"], data["alarm_color"]
-            )
+        active_widgets = self.active_widgets
+        for metric_key, payload in updates.items():
+            if widget := active_widgets.get(metric_key):
+                widget.update_data(payload.value_text, payload.percent_value)
+                widget.set_value_style(
+                    payload.is_alarm, payload.normal_color, payload.alarm_color
+                )
 
     def are_all_widgets_in_single_stack(self) -> bool:
         """
@@ -197,14 +215,21 @@ class DetachableManager(QObject):
     @Slot()
     def _save_layout_to_session(self):
         """Slot, der vom save_timer aufgerufen wird, um die Session zu speichern."""
-        self.save_layout_as("_last_session", allow_reserved=True)
+        self.save_layout_as("_last_session", allow_reserved=True, background=True)
+
+    def wait_for_background_saves(self):
+        """Wartet auf ausstehende Hintergrund-Speichervorgänge, damit ein synchrones Speichern nicht überschrieben wird."""
+        if not self._save_pool.waitForDone(self.BACKGROUND_SAVE_TIMEOUT_MS):
+            logging.warning("Hintergrund-Speichern des Layouts wurde nicht rechtzeitig beendet.")
 
     def _normalize_layout_name(self, name: Optional[str]) -> str:
         return str(name or "").strip()
 
-    def save_layout_as(self, name: str, allow_reserved: bool = False) -> bool:
+    def save_layout_as(self, name: str, allow_reserved: bool = False, background: bool = False) -> bool:
         """
         Speichert das aktuelle Layout unter einem bestimmten Namen.
+        Mit background=True wird der Snapshot hier serialisiert und im Save-Pool geschrieben;
+        Fehler werden dann nur protokolliert, ein Rollback findet nicht statt.
         """
         name = self._normalize_layout_name(name)
         if not name:
@@ -235,6 +260,18 @@ class DetachableManager(QObject):
 
         previous_layout = self.layouts.get(name)
         self.layouts[name] = layout_data
+        if background:
+            try:
+                payload = dumps_json(self.layouts)
+            except Exception:
+                logging.exception("Layout '%s' konnte nicht serialisiert werden.", name)
+                return False
+            self._save_pool.start(_LayoutSaveJob(payload))
+            self.active_layout_name = name
+            logging.debug("Layout '%s' mit %d Widgets zum Speichern eingereiht.", name, len(widget_data))
+            return True
+
+        self.wait_for_background_saves()
         if not save_layout(self.layouts, CONFIG_DIR):
             if previous_layout is None:
                 self.layouts.pop(name, None)
@@ -262,6 +299,7 @@ class DetachableManager(QObject):
         if self.active_layout_name == name:
             self.active_layout_name = None
 
+        self.wait_for_background_saves()
         if not save_layout(self.layouts, CONFIG_DIR):
             self.layouts[name] = removed_layout
             self.active_layout_name = previous_active_layout
@@ -507,6 +545,8 @@ class DetachableManager(QObject):
             widget.setFixedWidth(max(1, restore_state["width"]))
         widget.show()
         self.active_widgets[metric_key] = widget
+        # Das neue Widget braucht beim nächsten Tick alle Werte, auch unveränderte
+        self.main_win.invalidate_delivered_data()
         if restore_state:
             self._restore_hidden_widget_group_membership(metric_key, restore_state)
 
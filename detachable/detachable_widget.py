@@ -167,7 +167,7 @@ class DetachableWidget(QWidget):
         candidate = None
         if self.metric_key == "net":
             unit = "MBit/s"
-            mode = DisplayMode.BOTH.value
+            mode = DisplayMode.BOTH
             if settings_manager is not None:
                 unit = str(
                     settings_manager.get_setting(
@@ -181,15 +181,15 @@ class DetachableWidget(QWidget):
                         mode,
                     )
                 ).lower()
-            if mode == DisplayMode.UP.value:
+            if mode == DisplayMode.UP:
                 candidate = f"\u25B2999.9 {unit}"
-            elif mode == DisplayMode.DOWN.value:
+            elif mode == DisplayMode.DOWN:
                 candidate = f"\u25BC999.9 {unit}"
             else:
                 candidate = f"\u25B2999.9 \u25BC999.9 {unit}"
         elif self.metric_key == "disk_io":
             unit = "MB/s"
-            mode = DisplayMode.BOTH.value
+            mode = DisplayMode.BOTH
             if settings_manager is not None:
                 unit = str(
                     settings_manager.get_setting(
@@ -203,9 +203,9 @@ class DetachableWidget(QWidget):
                         mode,
                     )
                 ).lower()
-            if mode == DisplayMode.READ.value:
+            if mode == DisplayMode.READ:
                 candidate = f"R:999.9 {unit}"
-            elif mode == DisplayMode.WRITE.value:
+            elif mode == DisplayMode.WRITE:
                 candidate = f"W:999.9 {unit}"
             else:
                 candidate = f"R:999.9 W:999.9 {unit}"
@@ -3,7 +3,7 @@ import json
 import logging
 from typing import Dict, Any
 from pathlib import Path
-from config.config import save_atomic
+from config.config import save_atomic, save_bytes_atomic
 
 def save_layout(state: Dict[str, Any], config_dir: str | Path) -> bool:
     """Speichert den Zustand der detachable Widgets atomar in einer JSON-Datei."""
@@ -16,6 +16,16 @@ def save_layout(state: Dict[str, Any], config_dir: str | Path) -> bool:
     logging.error(f"Fehler beim Speichern des Detachable-Layouts nach: {file_path}")
     return False
 
+def save_layout_payload(payload: bytes, config_dir: str | Path) -> bool:
+    """Schreibt ein bereits serialisiertes Layout atomar, z. B. aus einem Pool-Thread."""
+    file_path = Path(config_dir) / 'detachable_layout.json'
+    if save_bytes_atomic(payload, file_path):
+        logging.debug(f"Detachable-Layout gespeichert in: {file_path}")
+        return True
+
+    logging.error(f"Fehler beim Speichern des Detachable-Layouts nach: {file_path}")
+    return False
+
 def load_layout(config_dir: str | Path) -> Dict[str, Any]:
     """Lädt den Zustand der detachable Widgets aus einer JSON-Datei."""
     file_path = Path(config_dir) / 'detachable_layout.json'
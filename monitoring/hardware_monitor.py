@@ -4,7 +4,7 @@ import logging
 import threading
 from typing import Dict, Any, TYPE_CHECKING
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QTimer, Qt, Signal, Slot
 
 from monitoring.io_calculator import IOCalculator
 from monitoring.system_data_collector import SystemDataCollector
@@ -25,6 +25,9 @@ class HardwareMonitorWorker(QObject):
     sensor_error = Signal(str, str)
     memory_warning = Signal(dict, float)
 
+    # Wartezeit bis zum nächsten Versuch nach einem fehlgeschlagenen Durchlauf
+    ERROR_RETRY_DELAY_SEC = 2.0
+
     def __init__(self, context: "AppContext", interval_ms: int):
         super().__init__()
         self.context = context
@@ -32,9 +35,11 @@ class HardwareMonitorWorker(QObject):
         
         self._is_running = True
         self._stop_event = threading.Event()
-        self._pending_settings_lock = threading.Lock()
-        self._pending_settings: dict[str, Any] = {}
         self.sleep_duration_sec = interval_ms / 1000.0
+        # Wird in run() im Worker-Thread angelegt
+        self._timer: QTimer | None = None
+        self._prev_tick_time = 0.0
+        self._next_deadline = 0.0
         
         # Manager-Instanzen aus dem Kontext holen
         self.lhm_support = context.hardware_manager.lhm_support
@@ -50,25 +55,12 @@ class HardwareMonitorWorker(QObject):
         
         logging.info(f"HardwareMonitorWorker initialisiert - LHM: {self.lhm_support}, Intervall: {self.sleep_duration_sec}s")
 
-    def queue_setting_update(self, key: str, value: Any):
-        """Merkt Änderungen thread-sicher vor, damit der Worker sie selbst anwenden kann."""
-        with self._pending_settings_lock:
-            self._pending_settings[key] = value
-
-    def _consume_pending_setting_updates(self):
-        """Wendet vorgemerkte Settings gesammelt im Worker-Thread an."""
-        with self._pending_settings_lock:
-            if not self._pending_settings:
-                return
-            pending = dict(self._pending_settings)
-            self._pending_settings.clear()
-
-        for key, value in pending.items():
-            self.update_setting(key, value)
-
     @Slot(str, object)
     def update_setting(self, key: str, value: Any):
-        """Aktualisiert Einstellungen in allen relevanten Managern."""
+        """
+        Aktualisiert Einstellungen in allen relevanten Managern.
+        Wird per QueuedConnection aufgerufen und läuft daher im Worker-Thread zwischen zwei Durchläufen.
+        """
         self.settings[key] = value
         
         # Propagiere die Einstellung an alle Manager
@@ -78,67 +70,94 @@ class HardwareMonitorWorker(QObject):
         self.performance_tracker.update_settings(key, value)
         
         if key == 'update_interval_ms':
-            self.sleep_duration_sec = value / 1000.0
+            self.set_interval(value)
+
+    @Slot(int)
+    def set_interval(self, interval_ms: int):
+        """Ändert das Abfrageintervall im laufenden Betrieb und stellt den Timer neu."""
+        self.sleep_duration_sec = interval_ms / 1000.0
+        logging.info(f"Abfrageintervall auf {interval_ms}ms geändert.")
+        if self._timer is None or not self._timer.isActive():
+            # Vor run() oder während eines Durchlaufs: die nächste Planung nutzt das neue Intervall
+            return
+        now = time.monotonic()
+        self._next_deadline = max(now, self._prev_tick_time + self.sleep_duration_sec)
+        self._timer.start(max(0, round((self._next_deadline - now) * 1000)))
 
     def run(self):
-        """Die Hauptschleife des Worker-Threads."""
+        """Startet die zeitgesteuerte Abfrage in der Event-Loop des Worker-Threads."""
         logging.info("Hardware Monitor Worker startet...")
-        
-        prev_time = time.time()
-
-        while not self._stop_event.is_set():
-            start_time = time.time()
-            try:
-                self._consume_pending_setting_updates()
-                current_time = time.time()
-                elapsed = max(0.1, current_time - prev_time)
-                prev_time = current_time
-
-                all_data = {}
-
-                all_data.update(self.system_collector.collect_all())
-                all_data.update(self.io_calculator.calculate_all(elapsed))
-                
-                if self.lhm_support:
-                    all_data.update(self.sensor_manager.read_all_sensors())
-                
-                self.data_updated.emit(all_data)
-                self.consecutive_errors = 0
-                
-                # Performance und Speicher überwachen
-                self.performance_tracker.track_update_performance(time.time() - start_time)
-                if memory_mb := self.performance_tracker.check_memory_usage():
-                    for warning in self.performance_tracker.consume_pending_memory_warnings():
-                        self.memory_warning.emit(warning, memory_mb)
-
-                self.health_report_updated.emit(self.get_health_report())
-                
-                stats = self.performance_tracker.get_performance_stats()
-                if stats['update_count'] > 0 and stats['update_count'] % self.performance_log_interval == 0:
-                    logging.info(f"Performance: Avg={stats['avg_update_time_ms']:.1f}ms, Max={stats['max_update_time_ms']:.1f}ms")
-                    
-                remaining_sleep = max(0, self.sleep_duration_sec - (time.time() - start_time))
-                if self._stop_event.wait(remaining_sleep):
-                    break
-
-            except Exception:
-                self.consecutive_errors += 1
-                logging.exception(f"Fehler in Worker-Schleife (Fehler #{self.consecutive_errors})")
-                if self.consecutive_errors >= self.max_consecutive_errors:
-                    logging.critical("Maximale Anzahl aufeinanderfolgender Fehler erreicht. Worker wird gestoppt.")
-                    self.sensor_error.emit("Kritisch", "Worker wegen wiederholter Fehler gestoppt.")
-                    self._stop_event.set()
-                    break
-                if self._stop_event.wait(2.0):
-                    break
-        
-        self._is_running = False
-        logging.info("Hardware Monitor Worker beendet.")
+
+        self._prev_tick_time = time.monotonic()
+        self._next_deadline = self._prev_tick_time
+        # Einmal-Timer, der nach jedem Durchlauf auf die nächste Deadline neu gestellt wird
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start(0)
+
+    @Slot()
+    def _tick(self):
+        """Ein Abfrage-Durchlauf; plant anschließend den nächsten."""
+        if self._stop_event.is_set():
+            return
+
+        start_time = time.monotonic()
+        try:
+            elapsed = max(0.1, start_time - self._prev_tick_time)
+            self._prev_tick_time = start_time
+
+            all_data = {}
+
+            all_data.update(self.system_collector.collect_all())
+            all_data.update(self.io_calculator.calculate_all(elapsed))
+            
+            if self.lhm_support:
+                all_data.update(self.sensor_manager.read_all_sensors())
+            
+            self.data_updated.emit(all_data)
+            self.consecutive_errors = 0
+            
+            # Performance und Speicher überwachen
+            self.performance_tracker.track_update_performance(time.monotonic() - start_time)
+            if memory_mb := self.performance_tracker.check_memory_usage():
+                for warning in self.performance_tracker.consume_pending_memory_warnings():
+                    self.memory_warning.emit(warning, memory_mb)
+
+            self.health_report_updated.emit(self.get_health_report())
+            
+            stats = self.performance_tracker.get_performance_stats()
+            if stats['update_count'] > 0 and stats['update_count'] % self.performance_log_interval == 0:
+                logging.info(f"Performance: Avg={stats['avg_update_time_ms']:.1f}ms, Max={stats['max_update_time_ms']:.1f}ms")
+
+        except Exception:
+            self.consecutive_errors += 1
+            logging.exception(f"Fehler in Worker-Schleife (Fehler #{self.consecutive_errors})")
+            if self.consecutive_errors >= self.max_consecutive_errors:
+                logging.critical("Maximale Anzahl aufeinanderfolgender Fehler erreicht. Worker wird gestoppt.")
+                self.sensor_error.emit("Kritisch", "Worker wegen wiederholter Fehler gestoppt.")
+                self.stop()
+                return
+            self._next_deadline = time.monotonic() + self.ERROR_RETRY_DELAY_SEC
+        else:
+            # Feste Taktung ab der letzten Deadline statt "Intervall ab Ende", damit nichts driftet
+            self._next_deadline += self.sleep_duration_sec
+            now = time.monotonic()
+            if self._next_deadline < now:
+                # Durchlauf dauerte länger als ein Intervall: verpasste Takte nicht nachholen
+                self._next_deadline = now
+
+        if not self._stop_event.is_set():
+            self._timer.start(max(0, round((self._next_deadline - time.monotonic()) * 1000)))
 
     def stop(self):
         """Stoppt den Worker sicher."""
+        if not self._is_running:
+            return
         self._is_running = False
         self._stop_event.set()
+        logging.info("Hardware Monitor Worker beendet.")
 
     def get_health_report(self) -> Dict[str, Any]:
         """Sammelt Gesundheitsberichte von allen Managern."""
@@ -308,6 +308,7 @@ class ActionHandler:
         # 2. Persistierte Layouts vollständig zurücksetzen
         self.main_win.detachable_manager.layouts.clear()
         self.main_win.detachable_manager.active_layout_name = None
+        self.main_win.detachable_manager.wait_for_background_saves()
         save_layout(self.main_win.detachable_manager.layouts, CONFIG_DIR)
 
         # 3. Dynamische Sensoren (Storage, Custom) erneut zur Konfiguration hinzufügen
@@ -345,6 +346,8 @@ class ActionHandler:
         """Aktualisiert alle UI-Komponenten nach dem vollständigen Reset."""
         try:
             # UI-Manager über Sprachänderung informieren (falls Sprache zurückgesetzt wurde)
+            self.main_win._refresh_cached_translations()
+            self.main_win.context.data_handler.refresh_language()
             self.main_win.ui_manager.refresh_metric_definitions()
             self.main_win.context.data_handler.refresh_custom_sensors()
             
@@ -142,13 +142,13 @@ class TrayIconManager:
     def _get_valid_shape_value(self) -> str:
         shape_value = self.settings_manager.get_setting(
             SettingsKey.TRAY_SHAPE.value,
-            DefaultTrayIcon.SHAPE.value,
+            DefaultTrayIcon.SHAPE,
         )
-        valid_values = {shape.value for shape in TrayShape}
+        valid_values = set(TrayShape.values())
         if shape_value in valid_values:
             return shape_value
         logging.warning("Ungültige Tray-Form '%s'. Verwende Standardform.", shape_value)
-        return DefaultTrayIcon.SHAPE.value
+        return DefaultTrayIcon.SHAPE
 
     def _get_valid_color(self, key: str, fallback: str) -> str:
         color_value = self.settings_manager.get_setting(key, fallback)
@@ -207,11 +207,11 @@ class TrayIconManager:
     def _get_shape_path(self, shape_value: str, rect: QRectF) -> QPainterPath:
         """Returns a QPainterPath for the chosen shape."""
         path = QPainterPath()
-        if shape_value == TrayShape.ROUND.value:
+        if shape_value == TrayShape.ROUND:
             path.addEllipse(rect)
-        elif shape_value == TrayShape.SQUARE.value:
+        elif shape_value == TrayShape.SQUARE:
             path.addRect(rect)
-        elif shape_value == TrayShape.TRIANGLE.value:
+        elif shape_value == TrayShape.TRIANGLE:
             poly = QPolygonF([
                 QPointF(rect.center().x(), rect.top()),
                 QPointF(rect.left(), rect.bottom()),
@@ -219,7 +219,7 @@ class TrayIconManager:
             ])
             path.addPolygon(poly)
             path.closeSubpath()
-        elif shape_value == TrayShape.HEXAGON.value:
+        elif shape_value == TrayShape.HEXAGON:
             hw, hh = rect.width() / 2, rect.height() / 2
             cx, cy = rect.center().x(), rect.center().y()
             poly = QPolygonF([
@@ -229,7 +229,7 @@ class TrayIconManager:
             ])
             path.addPolygon(poly)
             path.closeSubpath()
-        elif shape_value == TrayShape.DIAMOND.value:
+        elif shape_value == TrayShape.DIAMOND:
             poly = QPolygonF([
                 QPointF(rect.center().x(), rect.top()),
                 QPointF(rect.right(), rect.center().y()),
@@ -238,7 +238,7 @@ class TrayIconManager:
             ])
             path.addPolygon(poly)
             path.closeSubpath()
-        elif shape_value == TrayShape.STAR.value:
+        elif shape_value == TrayShape.STAR:
             hw, hh = rect.width() / 2, rect.height() / 2
             cx, cy = rect.center().x(), rect.center().y()
             outer_r, inner_r = min(hw, hh), min(hw, hh) * 0.4
@@ -186,7 +186,7 @@ class TrayMenuBuilder:
     def _create_tray_icon_menu(self, menu: QMenu):
         """Erstellt das Menü für die Tray-Icon-Einstellungen."""
         tray_menu = menu.addMenu(self.translator.translate("menu_tray_icon"))
-        shapes = {s.value: self.translator.translate(f"menu_tray_shape_{s.name.lower()}") for s in TrayShape}
+        shapes = {value: self.translator.translate(f"menu_tray_shape_{name.lower()}") for name, value in TrayShape.items()}
         self._create_exclusive_action_group_menu(tray_menu, self.translator.translate("menu_tray_shape"), SettingsKey.TRAY_SHAPE.value, shapes, self.action_handler.set_tray_setting)
 
         text_menu = tray_menu.addMenu(self.translator.translate("menu_tray_text"))
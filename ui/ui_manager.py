@@ -214,7 +214,7 @@ class UIManager:
                 if metric_key in custom_sensors:
                     if is_alarm:
                         return "#FF4500"
-                    return custom_sensors[metric_key].get("color", "#FFFFFF")
+                    return custom_sensors[metric_key].color
             return "#FFFFFF"
 
         if not hasattr(self.main_win.context, "data_handler"):
@@ -224,16 +224,10 @@ class UIManager:
         config = data_handler.METRIC_CONFIG.get(metric_key, {})
 
         if is_alarm:
-            color_key_enum = config.get("color_key")
-            if color_key_enum:
-                color_key = color_key_enum.value.replace("_color", "_alarm_color")
-                default_color = "#FF4500"
-            else:
-                color_key = "cpu_alarm_color"
-                default_color = "#FF4500"
+            color_key = config.get("alarm_setting_key") or "cpu_alarm_color"
+            default_color = "#FF4500"
         else:
-            color_key_enum = config.get("color_key")
-            color_key = color_key_enum.value if color_key_enum else "cpu_color"
+            color_key = config.get("color_setting_key") or "cpu_color"
             default_color = "#FFFFFF"
 
         return self.settings_manager.get_setting(color_key, default_color)
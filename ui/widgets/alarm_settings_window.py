@@ -14,7 +14,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from config.constants import DiskIOUnit, NetworkUnit, SettingsKey, TemperatureUnit
+from config.constants import KELVIN_OFFSET, DiskIOUnit, NetworkUnit, SettingsKey, TemperatureUnit
 
 from .base_window import (
     SafeWindow,
@@ -195,18 +195,18 @@ class AlarmSettingsWindow(SafeWindow):
         if key_enum in self.TEMPERATURE_THRESHOLD_KEYS:
             temperature_unit = self.settings_manager.get_setting(
                 SettingsKey.TEMPERATURE_UNIT.value,
-                TemperatureUnit.CELSIUS.value,
+                TemperatureUnit.CELSIUS,
             )
-            return "K" if temperature_unit == TemperatureUnit.KELVIN.value else "°C"
+            return "K" if temperature_unit == TemperatureUnit.KELVIN else "°C"
         if key_enum in self.DISK_IO_THRESHOLD_KEYS:
             return self.settings_manager.get_setting(
                 SettingsKey.DISK_IO_UNIT.value,
-                DiskIOUnit.MB_S.value,
+                DiskIOUnit.MB_S,
             )
         if key_enum in self.NETWORK_THRESHOLD_KEYS:
             return self.settings_manager.get_setting(
                 SettingsKey.NETWORK_UNIT.value,
-                NetworkUnit.MBIT_S.value,
+                NetworkUnit.MBIT_S,
             )
         if key_enum in self.PERCENT_THRESHOLD_KEYS:
             return "%"
@@ -222,25 +222,25 @@ class AlarmSettingsWindow(SafeWindow):
         if key_enum in self.TEMPERATURE_THRESHOLD_KEYS:
             temperature_unit = self.settings_manager.get_setting(
                 SettingsKey.TEMPERATURE_UNIT.value,
-                TemperatureUnit.CELSIUS.value,
+                TemperatureUnit.CELSIUS,
             )
-            if temperature_unit == TemperatureUnit.KELVIN.value:
-                return value + 273.15
+            if temperature_unit == TemperatureUnit.KELVIN:
+                return value + KELVIN_OFFSET
 
         if key_enum in self.DISK_IO_THRESHOLD_KEYS:
             disk_io_unit = self.settings_manager.get_setting(
                 SettingsKey.DISK_IO_UNIT.value,
-                DiskIOUnit.MB_S.value,
+                DiskIOUnit.MB_S,
             )
-            if disk_io_unit == DiskIOUnit.GB_S.value:
+            if disk_io_unit == DiskIOUnit.GB_S:
                 return value / 1024.0
 
         if key_enum in self.NETWORK_THRESHOLD_KEYS:
             network_unit = self.settings_manager.get_setting(
                 SettingsKey.NETWORK_UNIT.value,
-                NetworkUnit.MBIT_S.value,
+                NetworkUnit.MBIT_S,
             )
-            if network_unit == NetworkUnit.GBIT_S.value:
+            if network_unit == NetworkUnit.GBIT_S:
                 return value / 1000.0
 
         return value
@@ -251,25 +251,25 @@ class AlarmSettingsWindow(SafeWindow):
         if key_enum in self.TEMPERATURE_THRESHOLD_KEYS:
             temperature_unit = self.settings_manager.get_setting(
                 SettingsKey.TEMPERATURE_UNIT.value,
-                TemperatureUnit.CELSIUS.value,
+                TemperatureUnit.CELSIUS,
             )
-            if temperature_unit == TemperatureUnit.KELVIN.value:
-                return value - 273.15
+            if temperature_unit == TemperatureUnit.KELVIN:
+                return value - KELVIN_OFFSET
 
         if key_enum in self.DISK_IO_THRESHOLD_KEYS:
             disk_io_unit = self.settings_manager.get_setting(
                 SettingsKey.DISK_IO_UNIT.value,
-                DiskIOUnit.MB_S.value,
+                DiskIOUnit.MB_S,
             )
-            if disk_io_unit == DiskIOUnit.GB_S.value:
+            if disk_io_unit == DiskIOUnit.GB_S:
                 return value * 1024.0
 
         if key_enum in self.NETWORK_THRESHOLD_KEYS:
             network_unit = self.settings_manager.get_setting(
                 SettingsKey.NETWORK_UNIT.value,
-                NetworkUnit.MBIT_S.value,
+                NetworkUnit.MBIT_S,
             )
-            if network_unit == NetworkUnit.GBIT_S.value:
+            if network_unit == NetworkUnit.GBIT_S:
                 return value * 1000.0
 
         return value
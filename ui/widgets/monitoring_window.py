@@ -26,7 +26,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from config.constants import SettingsKey
+from config.constants import KELVIN_OFFSET, SettingsKey
 from monitoring.history_manager import GRAPHABLE_METRICS_MAP
 from .base_window import (
     SafeWindow,
@@ -242,10 +242,8 @@ class MonitoringWindow(SafeWindow):
         if metric_key in {"net_upload", "net_download"}:
             return self.settings_manager.get_setting(SettingsKey.NETWORK_UNIT.value, "MBit/s")
         if metric_key.startswith("custom_"):
-            return self.main_win.context.data_handler.custom_sensors.get(metric_key, {}).get(
-                "unit",
-                "",
-            )
+            custom_sensor = self.main_win.context.data_handler.custom_sensors.get(metric_key)
+            return custom_sensor.unit if custom_sensor else ""
         return ""
 
     def _get_metric_compatibility_key(self, metric_key: str) -> str:
@@ -260,7 +258,7 @@ class MonitoringWindow(SafeWindow):
             "storage_temp_"
         ):
             if self.settings_manager.get_setting(SettingsKey.TEMPERATURE_UNIT.value, "C") == "K":
-                return value + 273.15
+                return value + KELVIN_OFFSET
             return value
 
         if metric_key in {"disk_read", "disk_write"}:
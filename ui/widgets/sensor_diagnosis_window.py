@@ -3,7 +3,6 @@ import os
 import logging
 import csv
 import uuid
-from pathlib import Path
 from datetime import datetime
 from PySide6.QtWidgets import (
     QVBoxLayout, QTextEdit, QPushButton, QWidget, QHBoxLayout,
@@ -23,6 +22,7 @@ from .base_window import (
 from .custom_sensor_dialog import CustomSensorDialog
 from config.constants import SettingsKey
 from core.sensor_mapping import is_hardware_compatible
+from core import sensor_cache
 
 
 SPECIFIC_SENSOR_OPTIONS = [
@@ -837,22 +837,16 @@ class SensorDiagnosisWindow(SafeWindow):
             return
 
         try:
-            from config import config as app_config
-            cache_file = Path(app_config.CONFIG_DIR) / 'sensor_cache.json'
-            cache_deleted = False
-
-            if cache_file.exists():
-                cache_file.unlink()
-                cache_deleted = True
-            else:
-                cache_deleted = False
+            # clear_cache verwirft auch ein noch ausstehendes, verzögertes Speichern,
+            # damit die gelöschte Datei nicht sofort wieder angelegt wird
+            cache_deleted = sensor_cache.clear_cache()
 
             runtime_cache = getattr(self.main_app.hw_manager, 'sensor_cache', {}) or {}
             fingerprint = runtime_cache.get('_hardware_fingerprint')
             self.main_app.hw_manager.sensor_cache = (
                 {'_hardware_fingerprint': fingerprint} if fingerprint else {}
             )
-            self.main_app.hw_manager.cache_updated = False
+            self.main_app.hw_manager.discard_sensor_cache_changes()
 
             cache_message = (
                 self.translator.translate('win_diag_cache_cleared_success')
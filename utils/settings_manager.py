@@ -2,26 +2,64 @@
 import json
 import logging
 import shutil
-from typing import Dict, Any, Optional, Union, List
+import sys
+from typing import Dict, Any, Iterable, Mapping, Optional, Union
 from pathlib import Path
 from datetime import datetime
 from copy import deepcopy
 
-from PySide6.QtCore import QObject, Signal
-from config.config import save_atomic
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from config.config import dumps_json, save_atomic, save_bytes_atomic
+
+class _SaveJob(QRunnable):
+    """Writes an already serialized settings snapshot on a pool thread."""
+
+    def __init__(self, payload: bytes, target_path: Path):
+        super().__init__()
+        self.payload = payload
+        self.target_path = target_path
+
+    def run(self):
+        if not save_bytes_atomic(self.payload, self.target_path):
+            logging.error("Failed to save settings in background.")
+
 
 class SettingsManager(QObject):
     """
     Manages application settings with automatic repair, backups, and Qt signal integration.
     """
     setting_changed = Signal(str, object)  # Emits: key, new_value
+    _save_requested = Signal()
+
+    SAVE_DEBOUNCE_MS = 500
+    BACKGROUND_SAVE_TIMEOUT_MS = 2000
 
-    def __init__(self, settings_file_path: Union[str, Path], default_settings: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        settings_file_path: Union[str, Path],
+        default_settings: Optional[Mapping[str, Any]] = None,
+        default_settings_json: Optional[bytes] = None,
+    ):
         super().__init__()
         self.settings_file_path = Path(settings_file_path)
-        self.default_settings = deepcopy(default_settings or {})
+        self.default_settings = deepcopy(dict(default_settings or {}))
+        # Optional vorab serialisierte Form von default_settings (spart das Kodieren beim Zurücksetzen)
+        self.default_settings_json = default_settings_json
         self.current_settings = {}
 
+        # Mehrere Änderungen kurz hintereinander werden zu einem Schreibvorgang
+        # zusammengefasst. Das Signal sorgt dafür, dass der Timer auch bei
+        # Aufrufen aus dem Worker-Thread im Thread des Managers gestartet wird.
+        self._save_pending = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._save_in_background)
+        self._save_requested.connect(self._save_timer.start)
+        # Ein einzelner Thread hält die Reihenfolge der Hintergrund-Speichervorgänge ein
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
         self.settings_file_path.parent.mkdir(parents=True, exist_ok=True)
         self.load_settings()
 
@@ -42,8 +80,11 @@ class SettingsManager(QObject):
                     raise ValueError("Settings file does not contain a valid dictionary.")
 
                 # Merge loaded settings with defaults to add new keys
+                # loaded_settings ist frisch geparst und muss nicht kopiert werden.
+                # Geparste Schlüssel werden interniert, damit Lookups mit den
+                # (bereits internierten) Konstanten per Identität treffen.
                 self.current_settings = deepcopy(self.default_settings)
-                self.current_settings.update(deepcopy(loaded_settings))
+                self.current_settings |= {sys.intern(key): value for key, value in loaded_settings.items()}
                 logging.info(f"Loaded {len(loaded_settings)} settings.")
 
         except (json.JSONDecodeError, ValueError) as e:
@@ -57,18 +98,61 @@ class SettingsManager(QObject):
 
     def save_settings(self) -> bool:
         """Saves the current settings to the file atomically."""
-        try:
-            temp_file = self.settings_file_path.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.current_settings, f, indent=4, ensure_ascii=False)
-            
-            # Atomic move/replace
-            temp_file.replace(self.settings_file_path)
-            logging.debug(f"Settings saved to: {self.settings_file_path}")
+        self._wait_for_background_saves()
+        self._save_pending = False
+        if not save_atomic(self.current_settings, self.settings_file_path):
+            logging.error("Failed to save settings.")
+            return False
+        logging.debug(f"Settings saved to: {self.settings_file_path}")
+        return True
+
+    def _save_default_settings(self) -> bool:
+        """Saves current_settings, which must equal the defaults, using the pre-serialized form if available."""
+        if self.default_settings_json is None:
+            return self.save_settings()
+        self._wait_for_background_saves()
+        self._save_pending = False
+        if not save_bytes_atomic(self.default_settings_json, self.settings_file_path):
+            logging.error("Failed to save default settings.")
+            return False
+        logging.debug(f"Default settings saved to: {self.settings_file_path}")
+        return True
+
+    def schedule_save(self):
+        """Schedules a debounced save; repeated calls within the interval are coalesced."""
+        self._save_pending = True
+        self._save_requested.emit()
+
+    def flush_pending_save(self) -> bool:
+        """
+        Writes a pending debounced save immediately and waits for background saves.
+        Returns True if nothing was pending.
+        """
+        self._save_timer.stop()
+        if not self._save_pending:
+            self._wait_for_background_saves()
             return True
+        return self.save_settings()
+
+    def _save_in_background(self):
+        """
+        Serializes the current settings on the calling thread and hands the bytes to the save pool.
+        The serialized bytes are an immutable snapshot, so later changes cannot race with the write.
+        """
+        if not self._save_pending:
+            return
+        try:
+            payload = dumps_json(self.current_settings)
         except Exception:
-            logging.exception("Failed to save settings.")
-            return False
+            logging.exception("Failed to serialize settings.")
+            return
+        self._save_pending = False
+        self._save_pool.start(_SaveJob(payload, self.settings_file_path))
+
+    def _wait_for_background_saves(self):
+        """Blocks until queued background saves are written, so a synchronous save cannot be overwritten."""
+        if not self._save_pool.waitForDone(self.BACKGROUND_SAVE_TIMEOUT_MS):
+            logging.warning("Background settings save did not finish in time.")
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Retrieves a single setting's value. Returns a deep copy for mutable types."""
@@ -89,7 +173,7 @@ class SettingsManager(QObject):
             logging.debug(f"Setting changed: {key} = {value} (was: {old_value})")
             self.setting_changed.emit(key, emitted_value)
             if save_immediately:
-                self.save_settings()
+                self.schedule_save()
 
     def update_settings(self, updates: Dict[str, Any], save_immediately: bool = True):
         """
@@ -105,14 +189,14 @@ class SettingsManager(QObject):
                 self.setting_changed.emit(key, emitted_value)
         
         if save_immediately:
-            self.save_settings()
+            self.schedule_save()
 
     def get_all_settings(self) -> Dict[str, Any]:
         """Returns a copy of all current settings."""
         return deepcopy(self.current_settings)
 
     # ERWEITERT: Gruppierte Einstellungen für das Layout-System
-    def get_settings_by_keys(self, keys: List[str]) -> Dict[str, Any]:
+    def get_settings_by_keys(self, keys: Iterable[str]) -> Dict[str, Any]:
         """
         Gibt eine Gruppe von Einstellungen basierend auf einer Liste von Schlüsseln zurück.
         """
@@ -238,7 +322,7 @@ class SettingsManager(QObject):
         if all_updates:
             self.update_settings(all_updates, save_immediately)
 
-    def reset_settings_to_defaults_by_keys(self, keys: List[str], save_immediately: bool = True):
+    def reset_settings_to_defaults_by_keys(self, keys: Iterable[str], save_immediately: bool = True):
         """
         Setzt eine Gruppe von Einstellungen auf ihre Standardwerte zurück.
         """
@@ -345,7 +429,7 @@ class SettingsManager(QObject):
 
             old_settings = deepcopy(self.current_settings)
             self.current_settings = deepcopy(self.default_settings)
-            if not self.save_settings():
+            if not self._save_default_settings():
                 self.current_settings = old_settings
                 return False
 
@@ -358,7 +442,7 @@ class SettingsManager(QObject):
     def _create_default_settings(self):
         """Creates a new settings file with default values."""
         self.current_settings = deepcopy(self.default_settings)
-        self.save_settings()
+        self._save_default_settings()
         logging.info("Default settings created and saved.")
 
     def _handle_corrupt_settings(self):
@@ -378,6 +462,8 @@ class SettingsManager(QObject):
 
     def _backup_current_settings(self, suffix: str) -> Optional[Path]:
         """Creates a timestamped backup of the current settings file."""
+        # The backup must include debounced changes that have not reached the file yet
+        self.flush_pending_save()
         if not self.settings_file_path.exists():
             return None
 